@@ -3,15 +3,10 @@ import logging
 import os
 import sys
 from pathlib import Path
+from typing import Optional, Tuple
 
 import click
-import rich.logging
-from rich import traceback
 
-from cookietemple.bump_version.bump_version import VersionBumper
-from cookietemple.common.load_yaml import load_yaml_file
-from cookietemple.config.config import ConfigCommand
-from cookietemple.create.create import choose_domain
 from cookietemple.custom_cli.click import (
     CustomArg,
     CustomHelpSubcommand,
@@ -19,20 +14,20 @@ from cookietemple.custom_cli.click import (
     print_cookietemple_version,
     print_project_version,
 )
-from cookietemple.custom_cli.questionary import cookietemple_questionary_or_dot_cookietemple
-from cookietemple.info.info import TemplateInfo
-from cookietemple.lint.lint import lint_project
-from cookietemple.list.list import TemplateLister
-from cookietemple.sync.sync import TemplateSync
-from cookietemple.upgrade.upgrade import UpgradeCommand
+from cookietemple.util.profiling import profiler
 from cookietemple.util.rich import console
-from cookietemple.warp.warp import warp_project
+
+# NOTE: every command imports the modules it needs itself, so that e.g. cookietemple list never pays for importing git or cookiecutter
 
 WD = os.path.dirname(__file__)
 log = logging.getLogger()
 
 
 def main():
+    from rich import traceback
+
+    from cookietemple.upgrade.upgrade import UpgradeCommand
+
     traceback.install(width=200, word_wrap=True)
     console.print(
         r"""[bold blue]
@@ -46,8 +41,8 @@ def main():
 
     console.print("[bold blue]Run [green]cookietemple --help [blue]for an overview of all commands\n")
 
-    # Is the latest cookietemple version installed? Upgrade if not!
-    if not UpgradeCommand.check_cookietemple_latest():
+    # Is the latest cookietemple version installed? Upgrade if not! (never waits for PyPI)
+    if not UpgradeCommand.check_cookietemple_latest_cached():
         console.print("[bold blue]Run [green]cookietemple upgrade [blue]to get the latest version.")
     cookietemple_cli()
 
@@ -63,11 +58,22 @@ def main():
 )
 @click.option("-v", "--verbose", is_flag=True, default=False, help="Enable verbose output (print debug statements).")
 @click.option("-l", "--log-file", help="Save a verbose log to a file.")
+@click.option(
+    "--profile",
+    is_flag=True,
+    default=False,
+    help="Print the wall time, CPU time and peak memory of every phase of the command.",
+)
+@click.option(
+    "--profile-output", type=click.Path(), help="Additionally write a cProfile dump (pstats format) to this file."
+)
 @click.pass_context
-def cookietemple_cli(ctx, verbose, log_file):
+def cookietemple_cli(ctx, verbose, log_file, profile, profile_output):
     """
     Create state of the art projects from production ready templates.
     """
+    import rich.logging
+
     # Set the base logger to output DEBUG
     log.setLevel(logging.DEBUG)
 
@@ -88,6 +94,11 @@ def cookietemple_cli(ctx, verbose, log_file):
         log_fh.setFormatter(logging.Formatter("[%(asctime)s] %(name)-20s [%(levelname)-7s]  %(message)s"))
         log.addHandler(log_fh)
 
+    # Profile all phases of the command and print the summary when the command finished (or exited)
+    if profile or profile_output:
+        profiler.start(with_cprofile=bool(profile_output))
+        ctx.call_on_close(lambda: profiler.stop(profile_output))
+
 
 @cookietemple_cli.command(short_help="Create a new project using one of our templates.", cls=CustomHelpSubcommand)
 @click.argument("path", type=click.Path(), default=Path.cwd(), helpmsg="Path where the project should be created at.", cls=CustomArg)  # type: ignore
@@ -96,7 +107,40 @@ def cookietemple_cli(ctx, verbose, log_file):
     type=click.Choice(["cli", "lib", "gui", "web", "pub"]),
     help="The projects domain with currently cli, lib, gui, web and pub supported.",
 )
-def create(path: Path, domain: str) -> None:
+@click.option(
+    "--batch",
+    type=str,
+    multiple=True,
+    help="Create one project per .cookietemple.yml specification without any prompts. Accepts (quoted) glob patterns.",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    help="Number of parallel workers used for --batch. Defaults to the number of CPUs.",
+)
+@click.option(
+    "--log-dir",
+    type=click.Path(file_okay=False),
+    help="Directory to write the output of every creation of --batch to. Defaults to cookietemple_batch_logs in the path.",
+)
+@click.option(
+    "--offline", is_flag=True, help="Do not look up whether the project name is already taken at PyPi or readthedocs."
+)
+@click.option(
+    "--output-archive",
+    type=str,
+    help="Stream the project into a .tar.gz, .tgz, .tar or .zip archive instead of a directory. Use - for a tar.gz on stdout.",
+)
+def create(
+    path: Path,
+    domain: str,
+    batch: Tuple[str, ...],
+    jobs: Optional[int],
+    log_dir: Optional[str],
+    offline: bool,
+    output_archive: Optional[str],
+) -> None:
     """
     Create a new project using one of our templates.
 
@@ -105,13 +149,37 @@ def create(path: Path, domain: str) -> None:
     Template specific prompts follow. If you do not yet have a cookietemple config file you may be asked to create one first.
     Next, you will be asked whether you want to use cookietemple's Github support create a repository, push your template and enable a few settings.
     After the project has been created it will be linted and you will be notified of any TODOs.
+
+    Pass one or several .cookietemple.yml specifications with --batch to create many projects at once and in parallel.
+    Pass --output-archive to receive the project as archive instead of a directory.
     """
-    choose_domain(path, domain, None)
+    from cookietemple.create.batch import BatchCreator
+    from cookietemple.create.create import choose_domain, create_archive
+
+    if batch and output_archive:
+        console.print("[bold red]--output-archive cannot be combined with --batch!")
+        sys.exit(1)
+    if output_archive:
+        create_archive(output_archive, domain, offline=offline)
+    elif batch:
+        batch_creator = BatchCreator(batch, Path(path), jobs, offline, log_dir)
+        results = batch_creator.create()
+        batch_creator.print_summary(results)
+        if any(result.status != "created" for result in results):
+            sys.exit(1)
+    else:
+        choose_domain(path, domain, None, offline=offline)
 
 
 @cookietemple_cli.command(short_help="Lint your existing cookietemple project.", cls=CustomHelpSubcommand)
 @click.argument("project_dir", type=click.Path(), default=Path(str(Path.cwd())), helpmsg="Path to projects directory.", cls=CustomArg)  # type: ignore
-def lint(project_dir) -> None:
+@click.option("--jobs", "-j", type=click.IntRange(min=1), default=1, help="Number of lint checks run in parallel.")
+@click.option(
+    "--no-cache", is_flag=True, help="Scan all files again instead of only the files changed since the last lint."
+)
+@click.option("--since", type=str, help="Only lint the files changed since this git reference (like HEAD or main).")
+@click.option("--staged", is_flag=True, help="Only lint the files staged in git.")
+def lint(project_dir, jobs: int, no_cache: bool, since: Optional[str], staged: bool) -> None:
     """
     Lint your existing cookietemple project.
 
@@ -120,8 +188,16 @@ def lint(project_dir) -> None:
     Examples include a consistent project version, the existence of documentation and whether cookiecutter statements are still left.
     Afterwards, template specific linting is invoked. cli-python for example may check for the existence of a setup.py file.
     Both results are collected and displayed.
+    Pass --jobs to run the checks in parallel.
+    Only files changed since the last lint are scanned for TODO and cookiecutter strings again, unless --no-cache is passed.
+    Pass --since or --staged to only lint the files changed in git, for example in a pre-commit hook.
     """
-    lint_project(project_dir)
+    from cookietemple.lint.lint import lint_project
+
+    if since and staged:
+        console.print("[bold red]--since cannot be combined with --staged!")
+        sys.exit(1)
+    lint_project(project_dir, jobs=jobs, cache=not no_cache, since=since, staged=staged)
 
 
 @cookietemple_cli.command(short_help="List all available cookietemple templates.", cls=CustomHelpSubcommand)
@@ -133,6 +209,8 @@ def list() -> None:
     The output only consists of a short description for all templates.
     To get a detailed overview of a specific subset of templates use info.
     """
+    from cookietemple.list.list import TemplateLister
+
     template_lister = TemplateLister()
     template_lister.list_available_templates()
 
@@ -150,6 +228,8 @@ def info(ctx, handle: str) -> None:
     Info provides a long description for a specific subset of templates.
     Pass a domain, language or full handle (e.g. cli-python).
     """
+    from cookietemple.info.info import TemplateInfo
+
     if not handle:
         HelpErrorHandling.args_not_provided(ctx, "info")
     else:
@@ -179,6 +259,9 @@ def sync(project_dir, set_token, pat, username, check_update) -> None:
     To ensure that you have the latest changes you can invoke sync, which submits a pull request to your Github repository (if existing).
     If no repository exists the TEMPLATE branch will be updated and you can merge manually.
     """
+    from cookietemple.common.load_yaml import load_yaml_file
+    from cookietemple.sync.sync import TemplateSync
+
     project_dir_path = Path(project_dir).resolve()
     log.debug(f"Set project top level path to given path argument {project_dir_path}")
     # if set_token flag is set, update the sync token value and exit
@@ -299,6 +382,9 @@ def bump_version(ctx, new_version, project_dir, downgrade, tag) -> None:
 
     Users can create a commit tag for the version bump commit by using the --tag/-t flag.
     """
+    from cookietemple.bump_version.bump_version import VersionBumper
+    from cookietemple.custom_cli.questionary import cookietemple_questionary_or_dot_cookietemple
+
     create_tag = True if tag else False
     version_bumper = VersionBumper(project_dir, downgrade)
     # suggest valid version if none was given
@@ -342,6 +428,8 @@ def warp(input_dir: str, exec: str, output: str) -> None:
     cookietemple bundles Warp (https://github.com/dgiagio/warp), which can be used to create self contained, native executables.
     Currently, cookietemple does not ship any templates, where this may be required.
     """
+    from cookietemple.warp.warp import warp_project
+
     warp_project(input_dir, exec, output)
 
 
@@ -361,6 +449,8 @@ def config(ctx, view: bool, section: str) -> None:
     - pat: set your Github personal access token for Github repository creation
     - all: calls general and pat
     """
+    from cookietemple.config.config import ConfigCommand
+
     if view:
         ConfigCommand.view_current_config()
         sys.exit(0)
@@ -389,8 +479,119 @@ def upgrade() -> None:
     Checks whether the locally installed version of cookietemple is the latest.
     If not pip will be invoked to upgrade cookietemple to the latest version.
     """
+    from cookietemple.upgrade.upgrade import UpgradeCommand
+
     UpgradeCommand.check_upgrade_cookietemple()
 
 
+@cookietemple_cli.command(
+    short_help="Serve create, lint, bump-version and info requests from a long running process.",
+    cls=CustomHelpSubcommand,
+)
+@click.option("--host", type=str, default="127.0.0.1", help="Host to listen on.")
+@click.option("--port", "-p", type=int, default=8765, help="Port to listen on.")
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False),
+    help="Listen on a UNIX socket (only accessible by the current user) instead of a port. Recommended.",
+)
+@click.option(
+    "--workers",
+    "-w",
+    type=click.IntRange(min=1),
+    help="Number of requests handled in parallel. Defaults to the number of CPUs.",
+)
+def serve(host: str, port: int, socket_path: Optional[str], workers: Optional[int]) -> None:
+    """
+    Serve create, lint, bump-version and info requests from a long running process.
+
+    Each request is a POST of a JSON object containing the command's parameters to /create, /lint, /bump-version or /info.
+    The response contains the exit code, the output and the results of the command.
+    The template registry and all compiled templates are kept in memory. Requests are never prompted, so all answers have to be passed.
+    """
+    from cookietemple.serve.serve import TemplateServer
+
+    template_server = TemplateServer(workers)
+    template_server.serve(template_server.bind(host, port, socket_path))
+
+
+@cookietemple_cli.command(
+    name="dev-render", short_help="Render a template with fixed answers for template authors.", cls=CustomHelpSubcommand
+)
+@click.argument("handle", type=str, helpmsg="Handle of the template to render (e.g. cli-python).", cls=CustomArg)  # type: ignore
+@click.option(
+    "--answers",
+    "-a",
+    type=click.Path(exists=True, dir_okay=False),
+    required=True,
+    help="File containing the answers to all prompts in the format of a .cookietemple.yml file.",
+)
+@click.option(
+    "--output-dir",
+    "-o",
+    type=click.Path(file_okay=False),
+    default=".",
+    help="Directory to render the project into. Defaults to the current working directory.",
+)
+@click.option("--watch", "-w", is_flag=True, help="Render changed files again whenever the template changes.")
+def dev_render(handle: str, answers: str, output_dir: str, watch: bool) -> None:
+    """
+    Render a template with fixed answers for template authors.
+
+    Renders the template into the output directory without any prompts, name lookups or Github support and lints the project.
+    With --watch the template sources and the answers file are watched and only the files affected by a change are rendered and linted again.
+    """
+    from cookietemple.template_tools.dev_render import DevRenderer
+
+    dev_renderer = DevRenderer(handle, answers, output_dir)
+    dev_renderer.render()
+    if watch:
+        dev_renderer.watch()
+
+
+@cookietemple_cli.group(short_help="Manage the templates shipped with cookietemple.")
+def templates() -> None:
+    """
+    Manage the templates shipped with cookietemple.
+    """
+
+
+@templates.command(
+    name="compile", short_help="Pre-compile all templates into the jinja bytecode cache.", cls=CustomHelpSubcommand
+)
+def compile_templates() -> None:
+    """
+    Pre-compile all templates into the persistent jinja bytecode cache.
+
+    cookietemple caches the compiled templates in its user cache directory, so that every creation only loads the cached bytecode.
+    Run this command once after installing or upgrading cookietemple to warm up the cache.
+    """
+    from cookietemple.template_tools.compile import TemplateCompiler
+
+    TemplateCompiler().compile_templates()
+
+
+@templates.command(
+    name="pack", short_help="Bundle every template into a single indexed pack file.", cls=CustomHelpSubcommand
+)
+@click.option(
+    "--remove-sources",
+    is_flag=True,
+    help="Remove the template directories after packing, so that only the packs remain.",
+)
+def pack_templates(remove_sources: bool) -> None:
+    """
+    Bundle every template into a single compressed pack file next to its directory.
+
+    A pack contains a manifest indexing the path, size, hash and permissions of every template file and whether it is rendered.
+    cookietemple reads templates from their packs, whenever their directories do not exist.
+    Run this command with --remove-sources before building a package to ship only the packs.
+    """
+    from cookietemple.template_tools.pack import TemplatePacker
+
+    TemplatePacker().pack_templates(remove_sources)
+
+
 if __name__ == "__main__":
     sys.exit(main())  # pragma: no cover
@@ -16,6 +16,7 @@ from rich import print
 from cookietemple.create.github_support import is_git_repo
 from cookietemple.custom_cli.questionary import cookietemple_questionary_or_dot_cookietemple
 from cookietemple.lint.template_linter import TemplateLinter
+from cookietemple.util.profiling import profile_phase
 
 log = logging.getLogger(__name__)
 
@@ -39,6 +40,7 @@ class VersionBumper:
             )
             sys.exit(1)
 
+    @profile_phase("bump-version: bump files")
     def bump_template_version(self, new_version: str, project_dir: Path, create_tag: bool) -> None:
         """
         Update the version number for all files that are whitelisted in the config file or explicitly allowed in the blacklisted section.
@@ -58,12 +60,8 @@ class VersionBumper:
         log.debug(f"Current version: {self.CURRENT_VERSION} --- New version: {new_version}")
         sections = ["bumpversion_files_whitelisted", "bumpversion_files_blacklisted"]
 
-        # if project_dir was given as handle use cwd since we need it for git add
-        ct_cfg_path = (
-            f"{str(project_dir)}/cookietemple.cfg"
-            if str(project_dir).startswith(str(Path.cwd()))
-            else f"{str(Path.cwd())}/{project_dir}/cookietemple.cfg"
-        )
+        # git add needs the paths of all changed files (relative paths are relative to the current working directory)
+        ct_cfg_path = os.path.abspath(f"{project_dir}/cookietemple.cfg")
 
         # keep path of all files that were changed during bump version
         changed_files = [ct_cfg_path]
@@ -80,10 +78,7 @@ class VersionBumper:
                 not_changed, file_path = VersionBumper.replace(f"{project_dir}/{path}", new_version, section)
                 # only add file if the version(s) in the file were bumped
                 if not not_changed:
-                    path_changed = (
-                        file_path if file_path.startswith(str(Path.cwd())) else f"{str(Path.cwd())}/{file_path}"
-                    )
-                    changed_files.append(path_changed)
+                    changed_files.append(os.path.abspath(file_path))
 
         # update new version in cookietemple.cfg file
         log.debug("Updating version in cookietemple.cfg file.")
@@ -265,6 +260,7 @@ class VersionBumper:
         log.debug("Identified SNAPSHOT version bump")
         return True
 
+    @profile_phase("bump-version: lint")
     def lint_before_bump(self) -> None:
         """
         Check, whether all versions are consistent over the project
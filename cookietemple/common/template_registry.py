@@ -0,0 +1,138 @@
+import logging
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Set
+
+from cookietemple.common.load_yaml import load_yaml_file
+from cookietemple.util.dict_util import is_nested_dictionary
+
+log = logging.getLogger(__name__)
+
+TEMPLATES_PATH = os.path.realpath(f"{os.path.dirname(__file__)}/../create/templates")
+AVAILABLE_TEMPLATES_PATH = f"{TEMPLATES_PATH}/available_templates.yml"
+
+
+@dataclass(frozen=True)
+class TemplateEntry:
+    """
+    A single template of the available_templates.yml file.
+    """
+
+    handle: str  # e.g. cli-python or web-website-python
+    name: str
+    version: str
+    available_libraries: str
+    short_description: str
+    long_description: str
+    domain: str
+    subdomain: str  # empty if the template has no subdomain
+    language: str
+    path: str  # path to the template's directory below the templates directory (e.g. cli/cli_python)
+
+
+class TemplateRegistry:
+    """
+    The catalog of all available cookietemple templates.
+    The available_templates.yml file is parsed only once per process and flattened into template entries,
+    which are indexed by handle, domain and language.
+    Use TemplateRegistry.get() to obtain the shared registry.
+    """
+
+    def __init__(self, available_templates_path: str):
+        log.debug(f"Reading available templates from {available_templates_path}.")
+        # the raw (nested) content of the available_templates.yml file
+        self.available_templates = load_yaml_file(available_templates_path)
+        self.templates: List[TemplateEntry] = []
+        self.flatten(self.available_templates, [])
+
+        self.by_handle: Dict[str, TemplateEntry] = {template.handle: template for template in self.templates}
+        self.by_domain: Dict[str, List[TemplateEntry]] = {}
+        self.by_language: Dict[str, List[TemplateEntry]] = {}
+        for template in self.templates:
+            self.by_domain.setdefault(template.domain, []).append(template)
+            self.by_language.setdefault(template.language, []).append(template)
+
+    @staticmethod
+    def get(available_templates_path: Optional[str] = None) -> "TemplateRegistry":
+        """
+        Return the registry of the given available templates file, which is loaded only on first access.
+
+        :param available_templates_path: Path to the available_templates.yml file. Defaults to the file shipped with cookietemple.
+        :return: The shared registry
+        """
+        return TemplateRegistry._load(os.path.realpath(available_templates_path or AVAILABLE_TEMPLATES_PATH))
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _load(available_templates_path: str) -> "TemplateRegistry":
+        return TemplateRegistry(available_templates_path)
+
+    def flatten(self, templates: dict, keys: List[str]) -> None:
+        """
+        Recursively flatten the nested available templates into template entries.
+
+        :param templates: The (nested) part of the available templates to flatten
+        :param keys: The domain (and subdomain) keys leading to this part
+        """
+        for key, value in templates.items():
+            if is_nested_dictionary(value):
+                self.flatten(value, keys + [key])
+                continue
+            domain, subdomain, language = keys[0], keys[1] if len(keys) > 1 else "", key
+            self.templates.append(
+                TemplateEntry(
+                    handle=str(value["handle"]),
+                    name=str(value["name"]),
+                    version=str(value["version"]),
+                    available_libraries=str(value["available libraries"]),
+                    short_description=str(value["short description"]),
+                    long_description=str(value["long description"]),
+                    domain=domain,
+                    subdomain=subdomain,
+                    language=language,
+                    path=f"{domain}/{subdomain if subdomain else domain}_{language}",
+                )
+            )
+
+    def version(self, handle: str) -> str:
+        """
+        Look up the version of a template.
+
+        :param handle: The template handle
+        :return: The version of the template or an empty string if no template has this handle
+        """
+        template = self.by_handle.get(handle)
+        return template.version if template else ""
+
+    def find(self, handle: str) -> List[TemplateEntry]:
+        """
+        Find all templates matching a (partial) handle like cli, cli-python, web-website or web-website-python.
+
+        :param handle: The (partial) handle
+        :return: All templates whose handle starts with the given handle parts
+        """
+        return [
+            template
+            for template in self.templates
+            if template.handle == handle or template.handle.startswith(f"{handle}-")
+        ]
+
+    @property
+    def handles(self) -> Set[str]:
+        """
+        All complete handles and their possible prefixes (e.g. web, web-website and web-website-python).
+        """
+        all_handles: Set[str] = set()
+        for template in self.templates:
+            parts = template.handle.split("-")
+            all_handles.update("-".join(parts[:i]) for i in range(1, len(parts) + 1))
+
+        return all_handles
+
+    @property
+    def languages(self) -> Set[str]:
+        """
+        All languages cookietemple offers templates for.
+        """
+        return set(self.by_language)
@@ -5,6 +5,7 @@ from typing import Tuple
 from rich import print
 
 from cookietemple.common.load_yaml import load_yaml_file
+from cookietemple.common.template_registry import TemplateRegistry
 
 
 def load_ct_template_version(handle: str, yaml_path: str) -> str:
@@ -15,15 +16,7 @@ def load_ct_template_version(handle: str, yaml_path: str) -> str:
     :param yaml_path: Path to the yaml file
     :return: The version number to the given handles template
     """
-    available_templates = load_yaml_file(yaml_path)
-    parts = handle.split("-")
-    if len(parts) == 2:
-        return available_templates[parts[0]][parts[1]]["version"]
-    elif len(parts) == 3:
-
-        return available_templates[parts[0]][parts[1]][parts[2]]["version"]
-
-    return ""
+    return TemplateRegistry.get(yaml_path).version(handle)
 
 
 def load_project_template_version_and_handle(project_dir: Path) -> Tuple[str, str]:
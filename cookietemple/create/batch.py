@@ -0,0 +1,215 @@
+import glob
+import hashlib
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+from rich.box import HEAVY_HEAD
+from rich.style import Style
+from rich.table import Table
+
+from cookietemple.common.load_yaml import load_yaml_file
+from cookietemple.create.create import choose_domain
+from cookietemple.util.rich import console
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class BatchResult:
+    """
+    Outcome of creating a single project of a batch.
+    """
+
+    spec: str  # path to the .cookietemple.yml specification the project was created from
+    project: str  # name of the created project (empty if the specification could not be loaded)
+    status: str  # either created or failed
+    seconds: float  # wall time the creation took
+    log_file: str  # file which holds the complete output of the creation (empty if the creation never started)
+    message: str = ""  # reason for a failed creation
+
+
+class BatchCreator:
+    """
+    Create many projects from .cookietemple.yml specifications without any prompts.
+    Every specification is handed to a worker process of a process pool, which renders the project directly into the target directory.
+    """
+
+    # directory (inside of the output path) the output of every creation is written to by default
+    LOG_DIR = "cookietemple_batch_logs"
+
+    def __init__(
+        self,
+        spec_patterns: Iterable[str],
+        path: Path,
+        jobs: Optional[int] = None,
+        offline: bool = False,
+        log_dir: Optional[str] = None,
+    ):
+        self.specs = BatchCreator.expand_spec_patterns(spec_patterns)
+        self.path = Path(path).resolve()
+        self.jobs = jobs if jobs else os.cpu_count() or 1
+        self.offline = offline
+        self.log_dir = Path(log_dir).resolve() if log_dir else self.path / BatchCreator.LOG_DIR
+
+    @staticmethod
+    def expand_spec_patterns(spec_patterns: Iterable[str]) -> List[str]:
+        """
+        Expand all (possibly quoted) glob patterns into a sorted list of unique specification files.
+
+        :param spec_patterns: Paths or glob patterns pointing to .cookietemple.yml files
+        :return: All matching specification files
+        """
+        specs: Set[str] = set()
+        for pattern in spec_patterns:
+            matches = glob.glob(os.path.expanduser(pattern))
+            if not matches:
+                console.print(f"[bold yellow]No specification found matching {pattern}")
+            specs.update(os.path.abspath(match) for match in matches if os.path.isfile(match))
+
+        return sorted(specs)
+
+    def create(self) -> List[BatchResult]:
+        """
+        Fan out all specifications to the worker pool and collect the results in the order of the specifications.
+
+        :return: A result for every specification
+        """
+        if not self.specs:
+            console.print("[bold red]No .cookietemple.yml specifications to create projects from were found!")
+            sys.exit(1)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        # specifications creating an already claimed project directory fail right away instead of racing for it
+        results = self.duplicate_results()
+        specs = [spec for spec in self.specs if spec not in results]
+        jobs = min(self.jobs, len(specs))
+        console.print(f"[bold blue]Creating {len(specs)} projects at {self.path} using {jobs} workers")
+        log.debug(f"Writing the output of each creation to {self.log_dir}")
+
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = {
+                executor.submit(create_from_spec, spec, str(self.path), str(self.log_dir), self.offline): spec
+                for spec in specs
+            }
+            for future in as_completed(futures):
+                result = future.result()
+                results[futures[future]] = result
+                style = "green" if result.status == "created" else "red"
+                console.print(
+                    f"[bold {style}]{result.status}[/] {result.project or result.spec} ({result.seconds:.1f}s)"
+                )
+
+        return [results[spec] for spec in self.specs]
+
+    def duplicate_results(self) -> Dict[str, BatchResult]:
+        """
+        Find the specifications creating the same project directory as a previous specification.
+        Specifications, which cannot be loaded, are left to the workers to report.
+
+        :return: A failed result for every specification, whose project directory is already claimed
+        """
+        claimed: Dict[str, str] = {}
+        duplicates = {}
+        for spec in self.specs:
+            try:
+                dot_cookietemple = load_yaml_file(spec)
+                project = str(dot_cookietemple["project_name"])
+                language = str(dot_cookietemple.get("language", ""))
+            except Exception as e:
+                log.debug(f"Unable to load the specification {spec}: {e}")
+                continue
+            # python projects are created in a directory without hyphens (like TemplateCreator.project_dir_name)
+            project_dir = (
+                project.replace(" ", "_") if language != "python" else project.replace(" ", "_").replace("-", "_")
+            )
+            if project_dir in claimed:
+                message = f"Creates the project directory {project_dir} like {claimed[project_dir]}"
+                duplicates[spec] = BatchResult(spec, project, "failed", 0.0, "", message)
+            else:
+                claimed[project_dir] = spec
+
+        return duplicates
+
+    def print_summary(self, results: List[BatchResult]) -> None:
+        """
+        Print a table containing the status and the timing of every created project.
+
+        :param results: Results of all batch creations
+        """
+        table = Table(
+            title="[bold]Batch creation summary",
+            title_style="blue",
+            header_style=Style(color="blue", bold=True),
+            box=HEAVY_HEAD,
+        )
+        table.add_column("Specification", justify="left", style="green")
+        table.add_column("Project", justify="left")
+        table.add_column("Status", justify="left")
+        table.add_column("Time (s)", justify="right")
+        table.add_column("Details", justify="left")
+
+        for result in results:
+            status = f"[bold green]{result.status}" if result.status == "created" else f"[bold red]{result.status}"
+            details = (
+                f"{result.message}\nSee {result.log_file}" if result.message and result.log_file else result.message
+            )
+            table.add_row(result.spec, result.project, status, f"{result.seconds:.2f}", details)
+
+        console.print(table)
+        failed = sum(result.status != "created" for result in results)
+        total_time = sum(result.seconds for result in results)
+        console.print(
+            f"[bold blue]{len(results) - failed} of {len(results)} projects created "
+            f"(summed creation time {total_time:.1f}s)."
+        )
+        console.print(f"[bold blue]The output of every creation was written to {self.log_dir}")
+
+
+def create_from_spec(spec: str, path: str, log_dir: str, offline: bool = False) -> BatchResult:
+    """
+    Create a single project from a .cookietemple.yml specification.
+    Runs inside of a worker process: all output is redirected into a log file and no prompts are possible, since stdin is closed.
+
+    :param spec: Path to the .cookietemple.yml specification
+    :param path: Directory to create the project at
+    :param log_dir: Directory to write the output of the creation to
+    :param offline: Whether to skip all network lookups
+    :return: The result of the creation
+    """
+    log_file = os.path.join(log_dir, f"{Path(spec).stem}_{hashlib.md5(spec.encode()).hexdigest()[:8]}.log")
+    start = time.perf_counter()
+    project, status, message = "", "failed", ""
+
+    sys.stdout.flush()
+    sys.stderr.flush()
+    saved_fds = [os.dup(fd) for fd in (0, 1, 2)]
+    with open(log_file, "w") as log_fh, open(os.devnull) as devnull:
+        os.dup2(devnull.fileno(), 0)
+        os.dup2(log_fh.fileno(), 1)
+        os.dup2(log_fh.fileno(), 2)
+        try:
+            dot_cookietemple = load_yaml_file(spec)
+            project = str(dot_cookietemple.get("project_name", ""))
+            choose_domain(Path(path), None, dot_cookietemple, output_root=Path(path), offline=offline)
+            status = "created"
+        except SystemExit as e:
+            if e.code in (0, None):
+                status = "created"
+            else:
+                message = f"Creation exited with code {e.code}"
+        except Exception as e:
+            message = f"{e.__class__.__name__}: {e}"
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            for fd, saved_fd in zip((0, 1, 2), saved_fds):
+                os.dup2(saved_fd, fd)
+                os.close(saved_fd)
+
+    return BatchResult(spec, project, status, time.perf_counter() - start, log_file, message)
@@ -0,0 +1,148 @@
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from types import CodeType
+from typing import Optional
+
+import appdirs
+import jinja2
+from jinja2 import Environment
+from jinja2.bccache import Bucket, FileSystemBytecodeCache
+
+log = logging.getLogger(__name__)
+
+
+class TemplateBytecodeCache(FileSystemBytecodeCache):
+    """
+    Persistent cache for the bytecode jinja compiles the template files to.
+    Entries are keyed by the template name, the hash of the template file and the configuration of the jinja environment,
+    so that changed template files or environments (e.g. other extensions) never pick up stale bytecode.
+    The most recently used compiled templates are additionally kept in memory,
+    so that long running processes (like cookietemple serve) read the cache files of frequently rendered templates only once.
+    """
+
+    # path where the compiled templates are cached
+    CACHE_DIR = f'{appdirs.user_cache_dir(appname="cookietemple")}/jinja'
+    # set this environment variable to disable the bytecode cache
+    DISABLE_ENV = "COOKIETEMPLE_NO_BYTECODE_CACHE"
+    # the compiled templates of this process keyed by cache directory and key of the cache file (least recently used first)
+    MEMORY: "OrderedDict[str, CodeType]" = OrderedDict()
+    # number of compiled templates kept in memory, enough for all files of all shipped templates
+    MEMORY_SIZE = 1024
+    MEMORY_LOCK = threading.Lock()
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        cache_dir = cache_dir if cache_dir else TemplateBytecodeCache.CACHE_DIR
+        os.makedirs(cache_dir, exist_ok=True)
+        super().__init__(cache_dir, pattern="__cookietemple_%s.cache")
+
+    @staticmethod
+    def for_environment() -> Optional["TemplateBytecodeCache"]:
+        """
+        Create the bytecode cache to configure a jinja environment with.
+
+        :return: The bytecode cache or None if it is disabled or its directory cannot be created
+        """
+        if TemplateBytecodeCache.DISABLE_ENV in os.environ:
+            return None
+        try:
+            return TemplateBytecodeCache()
+        except OSError as e:
+            # the cache is only an optimization, so never fail the rendering because of it
+            log.debug(f"Unable to create the jinja bytecode cache: {e}")
+            return None
+
+    def get_bucket(self, environment: Environment, name: str, filename: Optional[str], source: str) -> Bucket:
+        """
+        Return the cache bucket of a template keyed by its name, its source and the jinja environment.
+
+        :param environment: The jinja environment the template is compiled with
+        :param name: Name of the template (its path relative to the templated directory)
+        :param filename: Absolute path of the template file
+        :param source: Content of the template file
+        :return: The (possibly already filled) cache bucket
+        """
+        checksum = self.get_source_checksum(source)
+        key = hashlib.sha256(
+            f"{TemplateBytecodeCache.environment_key(environment)}:{name}:{checksum}".encode("utf-8")
+        ).hexdigest()
+        bucket = Bucket(environment, key, checksum)
+        code = TemplateBytecodeCache.recall(self.memory_key(key))
+        if code:
+            bucket.code = code
+            return bucket
+        self.load_bytecode(bucket)
+        if bucket.code:
+            TemplateBytecodeCache.remember(self.memory_key(key), bucket.code)
+        return bucket
+
+    def memory_key(self, key: str) -> str:
+        """
+        :param key: Key of a cache file
+        :return: The key of the compiled template in memory
+        """
+        return os.path.join(self.directory, key)
+
+    @staticmethod
+    def recall(memory_key: str) -> Optional[CodeType]:
+        """
+        :param memory_key: Key of the compiled template in memory
+        :return: The compiled template kept in memory (if any)
+        """
+        with TemplateBytecodeCache.MEMORY_LOCK:
+            code = TemplateBytecodeCache.MEMORY.get(memory_key)
+            if code:
+                TemplateBytecodeCache.MEMORY.move_to_end(memory_key)
+            return code
+
+    @staticmethod
+    def remember(memory_key: str, code: CodeType) -> None:
+        """
+        Keep a compiled template in memory and forget the least recently used ones exceeding the MEMORY_SIZE.
+
+        :param memory_key: Key of the compiled template in memory
+        :param code: The compiled template
+        """
+        with TemplateBytecodeCache.MEMORY_LOCK:
+            TemplateBytecodeCache.MEMORY[memory_key] = code
+            TemplateBytecodeCache.MEMORY.move_to_end(memory_key)
+            while len(TemplateBytecodeCache.MEMORY) > TemplateBytecodeCache.MEMORY_SIZE:
+                TemplateBytecodeCache.MEMORY.popitem(last=False)
+
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        TemplateBytecodeCache.remember(self.memory_key(bucket.key), bucket.code)
+        try:
+            super().dump_bytecode(bucket)
+        except OSError as e:
+            log.debug(f"Unable to store compiled template in the jinja bytecode cache: {e}")
+
+    @staticmethod
+    def environment_key(environment: Environment) -> str:
+        """
+        Summarize all settings of a jinja environment that influence the compiled bytecode.
+
+        :param environment: The jinja environment
+        :return: A string identifying the environment configuration
+        """
+        return repr(
+            (
+                jinja2.__version__,
+                sorted(environment.extensions),
+                environment.block_start_string,
+                environment.block_end_string,
+                environment.variable_start_string,
+                environment.variable_end_string,
+                environment.comment_start_string,
+                environment.comment_end_string,
+                environment.line_statement_prefix,
+                environment.line_comment_prefix,
+                environment.trim_blocks,
+                environment.lstrip_blocks,
+                environment.newline_sequence,
+                environment.keep_trailing_newline,
+                environment.optimized,
+                environment.autoescape if not callable(environment.autoescape) else environment.autoescape.__name__,
+            )
+        )
@@ -1,4 +1,7 @@
 import logging
+import os
+import sys
+from contextlib import nullcontext, redirect_stdout
 from pathlib import Path
 from typing import Optional, Union
 
@@ -7,19 +10,35 @@ from cookietemple.create.domains.gui_creator import GuiCreator
 from cookietemple.create.domains.lib_creator import LibCreator
 from cookietemple.create.domains.pub_creator import PubCreator
 from cookietemple.create.domains.web_creator import WebCreator
+from cookietemple.create.sinks import ArchiveSink, OutputSink
+from cookietemple.create.template_creator import TemplateCreator
 from cookietemple.custom_cli.questionary import cookietemple_questionary_or_dot_cookietemple
+from cookietemple.util.rich import console
 
 log = logging.getLogger(__name__)
 
 
-def choose_domain(path: Path, domain: Union[str, bool], dot_cookietemple: Optional[dict]):
+def choose_domain(
+    path: Path,
+    domain: Optional[str],
+    dot_cookietemple: Optional[dict],
+    output_root: Optional[Path] = None,
+    offline: bool = False,
+    sink: Optional[OutputSink] = None,
+) -> TemplateCreator:
     """
     Prompts the user for the template domain.
     Creates the .cookietemple file.
     Prompts the user whether or not to create a Github repository
 
-    :param domain: Template domain
+    :param domain: Template domain. None to prompt for it (or take it from the .cookietemple.yml file).
     :param dot_cookietemple: Dictionary created from the .cookietemple.yml file. None if no .cookietemple.yml file was used.
+    :param output_root: Directory the project is created in if path is a directory named like the project inside of it (default case).
+        Defaults to the current working directory.
+    :param offline: Whether to skip all network lookups (e.g. whether the project name is already taken at PyPi)
+    :param sink: Receives the rendered project instead of the project directory (e.g. a MemorySink to keep the project in memory).
+        Projects rendered into a sink are neither linted nor pushed to Github.
+    :return: The creator, which created the project
     """
     if not domain:
         domain = cookietemple_questionary_or_dot_cookietemple(
@@ -33,5 +52,48 @@ def choose_domain(path: Path, domain: Union[str, bool], dot_cookietemple: Option
 
     switcher = {"cli": CliCreator, "web": WebCreator, "gui": GuiCreator, "lib": LibCreator, "pub": PubCreator}
 
-    creator_obj: Union[CliCreator, WebCreator, GuiCreator, LibCreator, PubCreator] = switcher.get(domain.lower())()  # type: ignore
+    creator_obj: Union[CliCreator, WebCreator, GuiCreator, LibCreator, PubCreator] = switcher.get(domain.lower())(output_root, offline, sink)  # type: ignore
+    creator_obj.dot_cookietemple = dot_cookietemple
     creator_obj.create_template(path, dot_cookietemple)
+
+    return creator_obj
+
+
+def create_archive(
+    archive: str, domain: Optional[str], dot_cookietemple: Optional[dict] = None, offline: bool = False
+) -> None:
+    """
+    Creates a project and streams it into a tar.gz, tar or zip archive without ever writing a project directory.
+    The archive contains the project directory. Its format is chosen by the archive's file extension.
+
+    :param archive: Path to the archive or - to stream a tar.gz archive to stdout
+    :param domain: Template domain. None to prompt for it (or take it from the .cookietemple.yml file).
+    :param dot_cookietemple: Dictionary created from the .cookietemple.yml file. None if no .cookietemple.yml file was used.
+    :param offline: Whether to skip all network lookups (e.g. whether the project name is already taken at PyPi)
+    """
+    archive_format = "tar.gz" if archive == "-" else ArchiveSink.archive_format(archive)
+    if not archive_format:
+        console.print(
+            f"[bold red]Unsupported archive {archive}! Please use one of the extensions {', '.join(ArchiveSink.FORMATS)}."
+        )
+        sys.exit(1)
+
+    fileobj = sys.stdout.buffer if archive == "-" else open(archive, "wb")
+    sink = ArchiveSink(fileobj, archive_format)  # type: ignore
+    finished = False
+    try:
+        # keep stdout clean for the archive, anything printed (like prompts) goes to stderr instead
+        with redirect_stdout(sys.stderr) if archive == "-" else nullcontext():
+            choose_domain(Path.cwd(), domain, dot_cookietemple, offline=offline, sink=sink)
+        sink.close()
+        finished = True
+    finally:
+        if archive == "-":
+            fileobj.flush()
+        else:
+            fileobj.close()
+            # never leave an incomplete archive behind
+            if not finished:
+                os.remove(archive)
+    if archive != "-":
+        console.print(f"[bold blue]Wrote the project into the archive {archive}.")
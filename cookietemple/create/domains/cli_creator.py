@@ -6,6 +6,7 @@ from typing import Any, Dict, Optional
 from cookietemple.common.version import load_ct_template_version
 from cookietemple.create.domains.cookietemple_template_struct import CookietempleTemplateStruct
 from cookietemple.create.github_support import prompt_github_repo
+from cookietemple.create.sinks import OutputSink
 from cookietemple.create.template_creator import TemplateCreator
 from cookietemple.custom_cli.questionary import cookietemple_questionary_or_dot_cookietemple
 
@@ -28,9 +29,9 @@ class TemplateStructCli(CookietempleTemplateStruct):
 
 
 class CliCreator(TemplateCreator):
-    def __init__(self):
+    def __init__(self, output_root: Optional[Path] = None, offline: bool = False, sink: Optional[OutputSink] = None):
         self.cli_struct = TemplateStructCli(domain="cli")
-        super().__init__(self.cli_struct)
+        super().__init__(self.cli_struct, output_root, offline, sink)
         self.WD_Path = Path(os.path.dirname(__file__))
         self.TEMPLATES_CLI_PATH = f"{self.WD_Path.parent}/templates/cli"
 
@@ -71,7 +72,7 @@ class CliCreator(TemplateCreator):
         if self.cli_struct.is_github_orga:
             self.cli_struct.github_username = self.cli_struct.github_orga
         # create the chosen and configured template
-        super().create_template_without_subdomain(self.TEMPLATES_CLI_PATH)
+        super().create_template_without_subdomain(self.TEMPLATES_CLI_PATH, path)
 
         # switch case statement to fetch the template version
         switcher_version = {"python": self.CLI_PYTHON_TEMPLATE_VERSION, "java": self.CLI_JAVA_TEMPLATE_VERSION}
@@ -82,7 +83,6 @@ class CliCreator(TemplateCreator):
 
         # perform general operations like creating a GitHub repository and general linting
         super().process_common_operations(
-            path=Path(path).resolve(),
             domain="cli",
             language=self.cli_struct.language,
             dot_cookietemple=dot_cookietemple,
@@ -6,6 +6,7 @@ from typing import Any, Dict, Optional
 from cookietemple.common.version import load_ct_template_version
 from cookietemple.create.domains.cookietemple_template_struct import CookietempleTemplateStruct
 from cookietemple.create.github_support import prompt_github_repo
+from cookietemple.create.sinks import OutputSink
 from cookietemple.create.template_creator import TemplateCreator
 from cookietemple.custom_cli.questionary import cookietemple_questionary_or_dot_cookietemple
 
@@ -21,9 +22,9 @@ class TemplateStructGui(CookietempleTemplateStruct):
 
 
 class GuiCreator(TemplateCreator):
-    def __init__(self):
+    def __init__(self, output_root: Optional[Path] = None, offline: bool = False, sink: Optional[OutputSink] = None):
         self.gui_struct = TemplateStructGui(domain="gui")
-        super().__init__(self.gui_struct)
+        super().__init__(self.gui_struct, output_root, offline, sink)
         self.WD_Path = Path(os.path.dirname(__file__))
         self.TEMPLATES_GUI_PATH = f"{self.WD_Path.parent}/templates/gui"
 
@@ -58,7 +59,7 @@ class GuiCreator(TemplateCreator):
         if self.gui_struct.is_github_orga:
             self.gui_struct.github_username = self.gui_struct.github_orga
         # create the gui template
-        super().create_template_without_subdomain(self.TEMPLATES_GUI_PATH)
+        super().create_template_without_subdomain(self.TEMPLATES_GUI_PATH, path)
 
         # switch case statement to fetch the template version
         switcher_version = {
@@ -72,7 +73,6 @@ class GuiCreator(TemplateCreator):
 
         # perform general operations like creating a GitHub repository and general linting
         super().process_common_operations(
-            path=Path(path).resolve(),
             domain="gui",
             language=self.gui_struct.language,
             dot_cookietemple=dot_cookietemple,
@@ -6,6 +6,7 @@ from typing import Any, Dict, Optional
 from cookietemple.common.version import load_ct_template_version
 from cookietemple.create.domains.cookietemple_template_struct import CookietempleTemplateStruct
 from cookietemple.create.github_support import prompt_github_repo
+from cookietemple.create.sinks import OutputSink
 from cookietemple.create.template_creator import TemplateCreator
 from cookietemple.custom_cli.questionary import cookietemple_questionary_or_dot_cookietemple
 
@@ -18,9 +19,9 @@ class TemplateStructLib(CookietempleTemplateStruct):
 
 
 class LibCreator(TemplateCreator):
-    def __init__(self):
+    def __init__(self, output_root: Optional[Path] = None, offline: bool = False, sink: Optional[OutputSink] = None):
         self.lib_struct = TemplateStructLib(domain="lib")
-        super().__init__(self.lib_struct)
+        super().__init__(self.lib_struct, output_root, offline, sink)
         self.WD_Path = Path(os.path.dirname(__file__))
         self.TEMPLATES_LIB_PATH = f"{self.WD_Path.parent}/templates/lib"
 
@@ -60,7 +61,7 @@ class LibCreator(TemplateCreator):
         if self.lib_struct.is_github_orga:
             self.lib_struct.github_username = self.lib_struct.github_orga
         # create the chosen and configured template
-        super().create_template_without_subdomain(self.TEMPLATES_LIB_PATH)
+        super().create_template_without_subdomain(self.TEMPLATES_LIB_PATH, path)
 
         # switch case statement to fetch the template version
         switcher_version = {
@@ -73,7 +74,6 @@ class LibCreator(TemplateCreator):
 
         # perform general operations like creating a GitHub repository and general linting
         super().process_common_operations(
-            path=Path(path).resolve(),
             domain="lib",
             language=self.lib_struct.language,
             dot_cookietemple=dot_cookietemple,
@@ -9,6 +9,7 @@ from cookietemple.common.version import load_ct_template_version
 from cookietemple.config.config import ConfigCommand
 from cookietemple.create.domains.cookietemple_template_struct import CookietempleTemplateStruct
 from cookietemple.create.github_support import load_github_username, prompt_github_repo
+from cookietemple.create.sinks import OutputSink
 from cookietemple.create.template_creator import TemplateCreator
 from cookietemple.custom_cli.questionary import cookietemple_questionary_or_dot_cookietemple
 
@@ -32,9 +33,9 @@ class TemplateStructPub(CookietempleTemplateStruct):
 
 
 class PubCreator(TemplateCreator):
-    def __init__(self):
+    def __init__(self, output_root: Optional[Path] = None, offline: bool = False, sink: Optional[OutputSink] = None):
         self.pub_struct = TemplateStructPub(domain="pub", language="latex")
-        super().__init__(self.pub_struct)
+        super().__init__(self.pub_struct, output_root, offline, sink)
         self.WD_Path = Path(os.path.dirname(__file__))
         self.TEMPLATES_PUB_PATH = f"{self.WD_Path.parent}/templates/pub"
 
@@ -78,8 +79,10 @@ class PubCreator(TemplateCreator):
 
         if self.pub_struct.is_github_orga:
             self.pub_struct.github_username = self.pub_struct.github_orga
-        # create the pub template
-        super().create_template_with_subdomain(self.TEMPLATES_PUB_PATH, self.pub_struct.pubtype)  # type: ignore
+        # create the pub template (publications do not need the common files)
+        super().create_template_with_subdomain(
+            self.TEMPLATES_PUB_PATH, self.pub_struct.pubtype, path, skip_common_files=True  # type: ignore
+        )
 
         # switch case statement to fetch the template version
         switcher_version = {
@@ -94,11 +97,8 @@ class PubCreator(TemplateCreator):
             f"pub-{self.pub_struct.pubtype}-{self.pub_struct.language.lower()}",
         )
 
-        # perform general operations like creating a GitHub repository and general linting, but skip common_files copying and rst linting
+        # perform general operations like creating a GitHub repository and general linting
         super().process_common_operations(
-            path=Path(path).resolve(),
-            skip_common_files=True,
-            skip_fix_underline=True,
             domain="pub",
             subdomain=self.pub_struct.pubtype,
             language=self.pub_struct.language,
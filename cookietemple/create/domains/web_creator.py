@@ -1,18 +1,17 @@
 import os
 from dataclasses import dataclass
-from distutils.dir_util import copy_tree
 from pathlib import Path
-from shutil import copy
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Set, Tuple
 
 from rich import print
 
 from cookietemple.common.version import load_ct_template_version
 from cookietemple.create.domains.cookietemple_template_struct import CookietempleTemplateStruct
 from cookietemple.create.github_support import prompt_github_repo
+from cookietemple.create.sinks import OutputSink
 from cookietemple.create.template_creator import TemplateCreator
+from cookietemple.create.template_renderer import TemplateLayer
 from cookietemple.custom_cli.questionary import cookietemple_questionary_or_dot_cookietemple
-from cookietemple.util.dir_util import delete_dir_tree
 
 
 @dataclass
@@ -48,9 +47,9 @@ class TemplateStructWeb(CookietempleTemplateStruct):
 
 
 class WebCreator(TemplateCreator):
-    def __init__(self):
+    def __init__(self, output_root: Optional[Path] = None, offline: bool = False, sink: Optional[OutputSink] = None):
         self.web_struct = TemplateStructWeb(domain="web")
-        super().__init__(self.web_struct)
+        super().__init__(self.web_struct, output_root, offline, sink)
         self.WD_Path = Path(os.path.dirname(__file__))
         self.TEMPLATES_WEB_PATH = f"{self.WD_Path.parent}/templates/web"
 
@@ -100,11 +99,8 @@ class WebCreator(TemplateCreator):
             self.web_struct.github_username = self.web_struct.github_orga
         # create the project (TODO COOKIETEMPLE: As for now (only Flask) this works. Might need to change this in future.
         super().create_template_with_subdomain_framework(
-            self.TEMPLATES_WEB_PATH, self.web_struct.webtype, self.web_struct.web_framework.lower()
+            self.TEMPLATES_WEB_PATH, self.web_struct.webtype, self.web_struct.web_framework.lower(), path
         )
-        # clean project for advanced or basic setup
-        self.basic_or_advanced_files_with_frontend(self.web_struct.setup_type, self.web_struct.frontend.lower())
-
         # switch case statement to fetch the template version
         switcher_version = {"python": self.WEB_WEBSITE_PYTHON_TEMPLATE_VERSION}
 
@@ -115,7 +111,6 @@ class WebCreator(TemplateCreator):
 
         # perform general operations like creating a GitHub repository and general linting
         super().process_common_operations(
-            path=Path(path).resolve(),
             domain="web",
             subdomain=self.web_struct.webtype,
             language=self.web_struct.language,
@@ -201,62 +196,84 @@ class WebCreator(TemplateCreator):
             to_get_property="vmusername",
         )
 
-    def basic_or_advanced_files_with_frontend(self, setup_type: str, template_name: str) -> None:
+    def main_template_layer(self, template_path: str) -> TemplateLayer:
+        """
+        Render only the parts of the flask template belonging to the chosen setup type and frontend.
         """
-        Remove the dir/files that do not belong in a basic/advanced template and add a full featured frontend template
-        if the user wants so.
+        layer = super().main_template_layer(template_path)
+        layer.remap, layer.exclude = self.basic_or_advanced_files_with_frontend(
+            self.web_struct.setup_type, self.web_struct.frontend.lower()
+        )
+        return layer
+
+    def basic_or_advanced_files_with_frontend(
+        self, setup_type: str, template_name: str
+    ) -> Tuple[Dict[str, str], Set[str]]:
+        """
+        Resolve the dir/files that do not belong in a basic/advanced template and where the files of a full featured
+        frontend template go to, if the user wants one. Nothing of this is rendered before, so excluded files are never written.
 
         :param setup_type: Shows whether the user sets up a basic or advanced website setup
         :param template_name: the name of the frontend template (if any)
+        :return: The rendered paths (relative to the project directory) to move and the paths to leave out
         """
-        cwd = os.getcwd()
-        os.chdir(f"{cwd}/{self.web_struct.project_slug_no_hyphen}/{self.web_struct.project_slug_no_hyphen}")
+        package_dir = self.web_struct.project_slug_no_hyphen
+        frontend_templates_dir = "frontend_templates"
+        remap: Dict[str, str] = {}
+        # never render any frontend stuff besides the chosen frontend, which is moved into the package
+        exclude = {frontend_templates_dir}
 
-        # remove all stuff, that is not necessary for the basic setup
+        # leave out all stuff, that is not necessary for the basic setup
         if setup_type == "basic":
-            delete_dir_tree(Path("translations"))
-            delete_dir_tree(Path("auth"))
-            delete_dir_tree(Path("main"))
-            delete_dir_tree(Path("models"))
-            delete_dir_tree(Path("services"))
-            delete_dir_tree(Path("templates/auth"))
-            os.remove("templates/index.html")
-            os.remove("templates/base.html")
-            os.remove("static/mail_stub.conf")
-            os.remove("../babel.cfg")
-
-            # the user wants only minimal frontend, so remove the index html file for this
+            exclude.update(
+                f"{package_dir}/{path}"
+                for path in (
+                    "translations",
+                    "auth",
+                    "main",
+                    "models",
+                    "services",
+                    "templates/auth",
+                    "templates/index.html",
+                    "templates/base.html",
+                    "static/mail_stub.conf",
+                )
+            )
+            exclude.add("babel.cfg")
+
+            # the user wants only minimal frontend, so leave out the index html file for this
             if not template_name or template_name == "none":
-                os.remove("templates/basic_index_f.html")
+                exclude.add(f"{package_dir}/templates/basic_index_f.html")
 
-        # remove basic stuff in advanced setup
+        # leave out basic stuff in advanced setup
         elif setup_type == "advanced":
-            delete_dir_tree(Path("basic"))
+            exclude.add(f"{package_dir}/basic")
 
         # the user wants to init its project with a full frontend
         if template_name and template_name != "none":
-            copy_tree(f"../frontend_templates/{template_name}/assets", "static/assets")
-            copy(f"../frontend_templates/{template_name}/index.html", "templates")
+            remap[f"{frontend_templates_dir}/{template_name}/assets"] = f"{package_dir}/static/assets"
+            remap[f"{frontend_templates_dir}/{template_name}/index.html"] = f"{package_dir}/templates/index.html"
 
-            # remove unnecessary files for basic frontend setup
+            # leave out unnecessary files for basic frontend setup
             if setup_type == "basic":
-                os.remove("templates/basic_index.html")
-                os.remove("templates/index.html")
-            # remove unnecessary files for advanced frontend setup
+                exclude.update({f"{package_dir}/templates/basic_index.html", f"{package_dir}/templates/index.html"})
+            # leave out unnecessary files for advanced frontend setup
             else:
-                os.remove("templates/basic_index_f.html")
-                os.remove("templates/basic_index.html")
+                exclude.update(
+                    {f"{package_dir}/templates/basic_index_f.html", f"{package_dir}/templates/basic_index.html"}
+                )
 
         else:
-            # remove basic html files if advanced setup
+            # leave out basic html files if advanced setup
             if setup_type == "advanced":
-                os.remove("templates/basic_index.html")
-                os.remove("templates/basic_index_f.html")
-
-        # remove all frontend stuff
-        delete_dir_tree(Path("../frontend_templates"))
+                exclude.update(
+                    {f"{package_dir}/templates/basic_index.html", f"{package_dir}/templates/basic_index_f.html"}
+                )
 
-        os.chdir(cwd)
+        return (
+            {os.path.normpath(source): os.path.normpath(target) for source, target in remap.items()},
+            {os.path.normpath(path) for path in exclude},
+        )
 
     def web_python_options(self, dot_cookietemple: Optional[dict]):
         """Prompts for web-python specific options and saves them into the CookietempleTemplateStruct"""
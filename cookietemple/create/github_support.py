@@ -12,6 +12,7 @@ import requests
 from cryptography.fernet import Fernet
 from git import Repo, exc
 from github import Github, GithubException
+from github.Repository import Repository
 from nacl import encoding, public
 from nacl.public import PublicKey
 from rich import print
@@ -26,62 +27,72 @@ from cookietemple.util.rich import console
 log = logging.getLogger(__name__)
 
 
-def create_push_github_repository(
-    project_path: str, creator_ctx: CookietempleTemplateStruct, tmp_repo_path: str
-) -> None:
+def github_access_token() -> Optional[str]:
     """
-    Creates a Github repository for the created template and pushes the template to it.
-    Prompts the user for the required specifications.
+    Verify that git is accessible and read the personal access token for Github.
+    Since reading the token may prompt the user to set it, this has to happen before any Github phase runs in the background.
 
-    :param creator_ctx: Full Template Struct. Github username may be updated if an organization repository is warranted.
-    :param project_path: The path to the recently created project
-    :param tmp_repo_path: Path to the empty cloned repo
+    :return: The decrypted PAT or None if git is not accessible
     """
-    try:
-        if not is_git_accessible():
-            return
-
-        # the personal access token for GitHub
-        access_token = handle_pat_authentification()
-
-        # Login to Github
-        log.debug("Logging into Github.")
-        console.print("[bold blue]Logging into Github")
-        authenticated_github_user = Github(access_token)
-        user = authenticated_github_user.get_user()
-
-        # Create new repository
-        console.print("[bold blue]Creating Github repository")
-        if creator_ctx.is_github_orga:
-            log.debug(f"Creating a new Github repository for organizaton: {creator_ctx.github_orga}.")
-            org = authenticated_github_user.get_organization(creator_ctx.github_orga)
-            repo = org.create_repo(
-                creator_ctx.project_slug,
-                description=creator_ctx.project_short_description,  # type: ignore
-                private=creator_ctx.is_repo_private,
-            )
-            creator_ctx.github_username = creator_ctx.github_orga
-        else:
-            log.debug(f"Creating a new Github repository for user: {creator_ctx.github_username}.")
-            repo = user.create_repo(
-                creator_ctx.project_slug,
-                description=creator_ctx.project_short_description,  # type: ignore
-                private=creator_ctx.is_repo_private,
-            )
+    if not is_git_accessible():
+        return None
 
-        console.print("[bold blue]Creating labels and default Github settings")
-        create_github_labels(repo=repo, labels=[("DEPENDABOT", "1BB0CE")])
+    return handle_pat_authentification()
 
-        repository = f"{tmp_repo_path}"
 
-        # NOTE: github_username is the organizations name, if an organization repository is to be created
+def github_owner(creator_ctx: CookietempleTemplateStruct) -> str:
+    """
+    :param creator_ctx: Full Template Struct
+    :return: The name of the user or organization owning the Github repository of the project
+    """
+    return creator_ctx.github_orga if creator_ctx.is_github_orga else creator_ctx.github_username
+
+
+def create_github_repository(creator_ctx: CookietempleTemplateStruct, access_token: str) -> Repository:
+    """
+    Creates an empty Github repository for the project. It only depends on the answers to the prompts,
+    so it can be created while the project is still being rendered.
+
+    :param creator_ctx: Full Template Struct
+    :param access_token: The PAT of the user with repo scope
+    :return: The created repository
+    """
+    # Login to Github
+    log.debug("Logging into Github.")
+    console.print("[bold blue]Logging into Github")
+    authenticated_github_user = Github(access_token)
+
+    # Create new repository
+    console.print("[bold blue]Creating Github repository")
+    if creator_ctx.is_github_orga:
+        log.debug(f"Creating a new Github repository for organizaton: {creator_ctx.github_orga}.")
+        owner = authenticated_github_user.get_organization(creator_ctx.github_orga)
+    else:
+        log.debug(f"Creating a new Github repository for user: {creator_ctx.github_username}.")
+        owner = authenticated_github_user.get_user()
+
+    return owner.create_repo(
+        creator_ctx.project_slug,
+        description=creator_ctx.project_short_description,  # type: ignore
+        private=creator_ctx.is_repo_private,
+    )
+
+
+def push_github_repository(
+    project_path: str, creator_ctx: CookietempleTemplateStruct, tmp_repo_path: str, access_token: str
+) -> None:
+    """
+    Pushes the created project to its already created Github repository and creates the development and TEMPLATE branches.
 
-        # create the repos sync secret
-        console.print("[bold blue]Creating repository sync secret")
-        create_sync_secret(creator_ctx.github_username, creator_ctx.project_slug, access_token)
-        # create repo cookietemple topic
-        console.print("[bold blue]Creating repository topic")
-        create_ct_topic(creator_ctx.github_username, creator_ctx.project_slug, access_token)
+    :param project_path: The path to the recently created project
+    :param creator_ctx: Full Template Struct. Github username is updated if an organization repository is warranted.
+    :param tmp_repo_path: Path to clone the empty repository into
+    :param access_token: The PAT of the user with repo scope
+    """
+    try:
+        # NOTE: github_username is the organizations name, if an organization repository is to be created
+        creator_ctx.github_username = github_owner(creator_ctx)
+        repository = f"{tmp_repo_path}"
 
         # git clone
         console.print("[bold blue]Cloning empty Github repository")
@@ -127,9 +138,7 @@ def create_push_github_repository(
 
         if not creator_ctx.is_repo_private and not creator_ctx.is_github_orga:
             main_branch = (
-                authenticated_github_user.get_user()
-                .get_repo(name=creator_ctx.project_slug)
-                .get_branch(f"{default_branch}")
+                Github(access_token).get_user().get_repo(name=creator_ctx.project_slug).get_branch(f"{default_branch}")
             )
             main_branch.edit_protection(dismiss_stale_reviews=True)
         else:
@@ -0,0 +1,171 @@
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import appdirs
+import requests
+from requests.adapters import HTTPAdapter
+
+from cookietemple.util.rich import console
+
+log = logging.getLogger(__name__)
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """
+    Lazily create a single, pooled session that is shared by all lookups of this process.
+
+    :return: The shared session
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=len(NameLookup.HOSTS), pool_maxsize=4, max_retries=0)
+            _session.mount("https://", adapter)
+        return _session
+
+
+class NameLookup:
+    """
+    Check whether a project name is already taken at PyPi and/or readthedocs.io.
+    All hosts are queried concurrently with strict timeouts and the results are kept in a TTL cache on disk.
+    In offline mode no request is made at all.
+    """
+
+    # hosts a project name can be looked up at and the url of a project with that name
+    HOSTS = {
+        "PyPi": "https://pypi.org/project/{name}",
+        "readthedocs.io": "https://{name}.readthedocs.io",
+    }
+    # connect and read timeout of a single lookup in seconds
+    TIMEOUT = (3.05, 5)
+    CACHE_FILE = f'{appdirs.user_cache_dir(appname="cookietemple")}/name_lookup.json'
+    # lookups are cached for one day
+    CACHE_TTL_SECONDS = 24 * 60 * 60
+    # set this environment variable to never look up names (e.g. on CI)
+    OFFLINE_ENV = "COOKIETEMPLE_OFFLINE"
+
+    def __init__(self, offline: bool = False, cache_file: Optional[str] = None):
+        self.offline = offline or NameLookup.OFFLINE_ENV in os.environ
+        self.cache_file = Path(cache_file if cache_file else NameLookup.CACHE_FILE)
+
+    def lookup(self, project_name: str, hosts: List[str]) -> Dict[str, bool]:
+        """
+        Look up a project name at several hosts at once and print the progress.
+
+        :param project_name: Name of the project the user wants to create
+        :param hosts: The hosts (PyPi and/or readthedocs.io) to look the name up at
+        :return: Whether the name is already taken for every host
+        """
+        results, messages = self.lookup_quietly(project_name, hosts)
+        for message in messages:
+            console.print(message)
+
+        return results
+
+    def lookup_quietly(self, project_name: str, hosts: List[str]) -> Tuple[Dict[str, bool], List[str]]:
+        """
+        Look up a project name at several hosts at once without printing anything.
+        Lookups running in the background use this, since printing would garble the prompts of the foreground.
+
+        :param project_name: Name of the project the user wants to create
+        :param hosts: The hosts (PyPi and/or readthedocs.io) to look the name up at
+        :return: Whether the name is already taken for every host and the messages to print for the user
+        """
+        for host in hosts:
+            # check if host is either PyPi or readthedocs.io; only relevant for developers working on this code
+            if host not in NameLookup.HOSTS:
+                raise ValueError(
+                    f"The name lookup has been called with the invalid host {host}.\nValid hosts are {', '.join(NameLookup.HOSTS)}"
+                )
+        if self.offline:
+            log.debug(f"Offline mode: skipping the lookup of {project_name} at {', '.join(hosts)}.")
+            return {host: False for host in hosts}, []
+
+        name = project_name.replace(" ", "")
+        cache = self.load_cache()
+        now = time.time()
+        results = {}
+        messages = []
+        for host in hosts:
+            entry = cache.get(f"{host}:{name}")
+            if entry and now - entry["time"] < NameLookup.CACHE_TTL_SECONDS:
+                log.debug(f"Using cached lookup of {name} at {host}.")
+                results[host] = entry["taken"]
+
+        missing = [host for host in hosts if host not in results]
+        if missing:
+            messages.append(f"[bold blue]Looking up {project_name} at {' and '.join(missing)}!")
+            with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+                lookups = dict(zip(missing, executor.map(lambda host: NameLookup.query(host, name), missing)))
+            for host, taken in lookups.items():
+                results[host] = bool(taken)
+                # only definite answers are cached; unreachable hosts are asked again next time
+                if taken is not None:
+                    cache[f"{host}:{name}"] = {"taken": taken, "time": now}
+                else:
+                    messages.append(
+                        f"[bold red]Cannot check whether name already taken on {host} because its unreachable at the moment!"
+                    )
+            self.save_cache(cache)
+
+        return {host: results[host] for host in hosts}, messages
+
+    @staticmethod
+    def query(host: str, name: str) -> Optional[bool]:
+        """
+        Make a GET request to the host to check whether a project with this name already exists.
+
+        :param host: The host (either PyPi or readthedocs.io)
+        :param name: Name of the project without any spaces
+        :return: Whether the name is already taken on host or None if the host could not be reached
+        """
+        url = NameLookup.HOSTS[host].format(name=name)
+        log.debug(f"Looking up {url}")
+        try:
+            return get_session().get(url, timeout=NameLookup.TIMEOUT).status_code == 200
+        # catch exceptions when server may be unavailable or the request timed out
+        except requests.exceptions.RequestException as e:
+            log.debug(f"Unable to contact {host}")
+            log.debug(f"Error was: {e}")
+            return None
+
+    def load_cache(self) -> dict:
+        """
+        Load all cached lookups.
+
+        :return: The cached lookups keyed by host and name
+        """
+        try:
+            with open(self.cache_file) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save_cache(self, cache: dict) -> None:
+        """
+        Atomically replace the cached lookups, dropping all expired entries.
+
+        :param cache: The lookups keyed by host and name
+        """
+        now = time.time()
+        cache = {key: entry for key, entry in cache.items() if now - entry["time"] < NameLookup.CACHE_TTL_SECONDS}
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_file = tempfile.mkstemp(prefix=".name_lookup_", dir=self.cache_file.parent)
+            with os.fdopen(fd, "w") as f:
+                json.dump(cache, f)
+            os.replace(tmp_file, self.cache_file)
+        except OSError as e:
+            # the cache is only an optimization, so never fail the creation because of it
+            log.debug(f"Unable to store the name lookup cache: {e}")
@@ -0,0 +1,151 @@
+import datetime
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, Optional, Tuple
+
+import appdirs
+
+import cookietemple
+from cookietemple.create.template_source import open_template_source
+from cookietemple.util.dir_util import copy_file
+
+log = logging.getLogger(__name__)
+
+
+class RenderCache:
+    """
+    Content addressed on disk cache for rendered cookiecutter templates.
+    A rendering is keyed by a hash of the template source tree and the context it was rendered with.
+    The least recently used renderings are evicted as soon as the cache exceeds its size cap.
+    """
+
+    # path where rendered templates are cached
+    CACHE_DIR = f'{appdirs.user_cache_dir(appname="cookietemple")}/render'
+    # default size cap of the cache in megabytes; can be overwritten by the environment variable below
+    MAX_SIZE_MB = 256
+    MAX_SIZE_ENV = "COOKIETEMPLE_RENDER_CACHE_MAX_MB"
+    # set this environment variable to disable the render cache
+    DISABLE_ENV = "COOKIETEMPLE_NO_RENDER_CACHE"
+
+    def __init__(self, cache_dir: Optional[str] = None, max_size_mb: Optional[int] = None):
+        self.cache_dir = Path(cache_dir if cache_dir else RenderCache.CACHE_DIR)
+        self.max_size = (
+            max_size_mb or int(os.environ.get(RenderCache.MAX_SIZE_ENV, RenderCache.MAX_SIZE_MB))
+        ) * 1024**2
+        self.enabled = RenderCache.DISABLE_ENV not in os.environ
+
+    def key(self, template_path: str, context: dict) -> str:
+        """
+        Calculate the cache key of a rendering.
+
+        :param template_path: Path to the cookiecutter template (the directory containing the cookiecutter.json)
+        :param context: The extra context the template is rendered with
+        :return: The key of the rendering
+        """
+        tree_hash, uses_now = RenderCache.template_tree_hash(os.path.abspath(template_path))
+        key_content = {
+            "cookietemple_version": cookietemple.__version__,
+            "template": tree_hash,
+            "context": context,
+            # templates using the jinja2 now extension (e.g. for copyright years) render differently every day
+            "date": datetime.date.today().isoformat() if uses_now else "",
+        }
+        return hashlib.sha256(json.dumps(key_content, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+    def layered_key(self, layers: Iterable[Tuple[str, dict]]) -> str:
+        """
+        Calculate the cache key of a rendering, which merges several templates.
+
+        :param layers: Paths to the cookiecutter templates and their contexts in the order they are rendered in
+        :return: The key of the rendering
+        """
+        keys = [self.key(template_path, context) for template_path, context in layers]
+        return hashlib.sha256("".join(keys).encode("utf-8")).hexdigest()
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def template_tree_hash(template_path: str) -> Tuple[str, bool]:
+        """
+        Hash all relative paths, permissions and contents of a template source tree.
+        Packed templates store this hash in their manifest, hence it is only calculated for template directories.
+
+        :param template_path: Absolute path to the template
+        :return: The hash of the template tree and whether any of its files uses the jinja2 now extension
+        """
+        return open_template_source(template_path).tree_hash()
+
+    def materialize(self, key: str, output_dir: str) -> bool:
+        """
+        Copy a cached rendering into the output directory.
+
+        :param key: Key of the rendering
+        :param output_dir: Directory to copy the rendered project directory into
+        :return: Whether the rendering was cached or not
+        """
+        if not self.enabled:
+            return False
+        entry = self.cache_dir / key
+        if not entry.is_dir():
+            log.debug(f"Render cache miss for {key}.")
+            return False
+        log.debug(f"Render cache hit for {key}. Copying cached rendering into {output_dir}.")
+        # mark the entry as recently used
+        os.utime(entry)
+        # copy the rendered project directory only: the output directory (often the working directory of the user) must keep
+        # its own permissions and modification time
+        for rendered in entry.iterdir():
+            shutil.copytree(
+                rendered, os.path.join(output_dir, rendered.name), copy_function=copy_file, dirs_exist_ok=True
+            )
+        return True
+
+    def put(self, key: str, project_dir: str) -> None:
+        """
+        Store a rendered project directory in the cache and evict old renderings if the cache grew too large.
+
+        :param key: Key of the rendering
+        :param project_dir: The rendered project directory
+        """
+        if not self.enabled:
+            return
+        entry = self.cache_dir / key
+        if entry.exists():
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_entry = tempfile.mkdtemp(prefix=f".{key}_", dir=self.cache_dir)
+            shutil.copytree(
+                project_dir, f"{tmp_entry}/{os.path.basename(os.path.normpath(project_dir))}", copy_function=copy_file
+            )
+            try:
+                os.rename(tmp_entry, entry)
+            except OSError:
+                # another process stored the same rendering in the meantime
+                shutil.rmtree(tmp_entry, ignore_errors=True)
+            self.evict()
+        except OSError as e:
+            # the cache is only an optimization, so never fail the creation because of it
+            log.debug(f"Unable to store rendering in the render cache: {e}")
+
+    def evict(self) -> None:
+        """
+        Remove the least recently used renderings until the cache does not exceed its size cap anymore.
+        """
+        entries = []
+        for entry in self.cache_dir.iterdir():
+            if entry.is_dir() and not entry.name.startswith("."):
+                size = sum(file.stat().st_size for file in entry.rglob("*") if file.is_file())
+                entries.append((entry.stat().st_mtime, size, entry))
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries, key=lambda e: e[0]):
+            if total_size <= self.max_size:
+                break
+            log.debug(f"Evicting {entry.name} from the render cache.")
+            shutil.rmtree(entry, ignore_errors=True)
+            total_size -= size
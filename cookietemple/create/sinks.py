@@ -0,0 +1,234 @@
+import io
+import logging
+import os
+import shutil
+import stat
+import tarfile
+import time
+import zipfile
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import BinaryIO, Dict, Optional, Set, Union
+
+from cookietemple.util.dir_util import copy_file
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class RenderedFile:
+    """
+    A single file of a rendered project.
+    """
+
+    content: bytes
+    mode: int  # permission bits of the file (like the ones of its template file)
+
+
+class OutputSink(ABC):
+    """
+    Receives all directories and files of a rendered project.
+    All paths are relative to the project directory. Sinks decide where the project ends up (e.g. on disk or in memory).
+    """
+
+    def start(self, project_name: str) -> None:
+        """
+        Called once before anything is added to the sink.
+
+        :param project_name: Name of the project directory
+        """
+
+    @abstractmethod
+    def add_dir(self, path: str, mode: Optional[int] = None) -> None:
+        """
+        Add a (possibly empty) directory to the project.
+
+        :param path: Path of the directory relative to the project directory
+        :param mode: Permission bits of the directory. None for the default ones given by the umask.
+        """
+
+    @abstractmethod
+    def add_file(self, path: str, content: bytes, mode: int) -> None:
+        """
+        Add a file to the project. Its parent directory has always been added before.
+
+        :param path: Path of the file relative to the project directory
+        :param content: Content of the file
+        :param mode: Permission bits of the file
+        """
+
+    def copy_file(self, path: str, source: str, mode: int) -> None:
+        """
+        Add a file, whose content is copied verbatim from another file, to the project.
+
+        :param path: Path of the file relative to the project directory
+        :param source: Absolute path of the file to copy
+        :param mode: Permission bits of the file
+        """
+        with open(source, "rb") as f:
+            self.add_file(path, f.read(), mode)
+
+
+class DirectorySink(OutputSink):
+    """
+    Write the project into a directory on disk.
+    """
+
+    def __init__(self, project_dir: str):
+        self.project_dir = project_dir
+        os.makedirs(project_dir, exist_ok=True)
+
+    def add_dir(self, path: str, mode: Optional[int] = None) -> None:
+        os.makedirs(os.path.join(self.project_dir, path), exist_ok=True)
+        if mode is not None:
+            os.chmod(os.path.join(self.project_dir, path), mode)
+
+    def add_file(self, path: str, content: bytes, mode: int) -> None:
+        outfile = os.path.join(self.project_dir, path)
+        with open(outfile, "wb") as f:
+            f.write(content)
+        os.chmod(outfile, mode)
+
+    def copy_file(self, path: str, source: str, mode: int) -> None:
+        # clone the file instead of reading it, which is considerably cheaper for large assets
+        copy_file(source, os.path.join(self.project_dir, path))
+
+
+class MemorySink(OutputSink):
+    """
+    Keep the project in memory, for example to diff it against an existing project or to archive it.
+    """
+
+    def __init__(self):
+        self.dirs: Set[str] = set()
+        # permission bits of the directories, which do not have the default ones
+        self.dir_modes: Dict[str, int] = {}
+        self.files: Dict[str, RenderedFile] = {}
+
+    def add_dir(self, path: str, mode: Optional[int] = None) -> None:
+        self.dirs.add(path)
+        if mode is not None:
+            self.dir_modes[path] = mode
+
+    def add_file(self, path: str, content: bytes, mode: int) -> None:
+        self.files[path] = RenderedFile(content, mode)
+
+    def write_to(self, project_dir: str) -> None:
+        """
+        Write the project kept in memory into a directory on disk, overwriting existing files.
+
+        :param project_dir: The directory to write the project into
+        """
+        log.debug(f"Writing {len(self.files)} files from memory into {project_dir}.")
+        sink = DirectorySink(project_dir)
+        for path in sorted(self.dirs):
+            sink.add_dir(path, self.dir_modes.get(path))
+        for path, file in self.files.items():
+            sink.add_file(path, file.content, file.mode)
+
+
+class ArchiveSink(OutputSink):
+    """
+    Stream the project into a tar.gz, tar or zip archive as its files are rendered, without ever writing a project directory.
+    The archive contains the project directory, as if it was archived after its creation.
+    Since the archive is written sequentially, it can be streamed into non seekable files like stdout as well.
+    """
+
+    # supported archive file extensions and their formats
+    FORMATS = {".tar.gz": "tar.gz", ".tgz": "tar.gz", ".tar": "tar", ".zip": "zip"}
+
+    def __init__(self, fileobj: BinaryIO, archive_format: str):
+        self.project_name = ""
+        self.mtime = time.time()
+        self.archive: Union[tarfile.TarFile, zipfile.ZipFile]
+        if archive_format == "zip":
+            self.archive = zipfile.ZipFile(fileobj, "w", compression=zipfile.ZIP_DEFLATED)
+        else:
+            self.archive = tarfile.open(fileobj=fileobj, mode="w|gz" if archive_format == "tar.gz" else "w|")
+
+    @staticmethod
+    def archive_format(archive_path: str) -> Optional[str]:
+        """
+        Determine the format of an archive by its file extension.
+
+        :param archive_path: Path to the archive
+        :return: The format of the archive or None if the extension is not supported
+        """
+        for extension, archive_format in ArchiveSink.FORMATS.items():
+            if archive_path.lower().endswith(extension):
+                return archive_format
+
+        return None
+
+    def start(self, project_name: str) -> None:
+        self.project_name = project_name
+        self.add_dir("")
+
+    def add_dir(self, path: str, mode: Optional[int] = None) -> None:
+        name = self.member_name(path)
+        mode = mode if mode is not None else 0o755
+        if isinstance(self.archive, zipfile.ZipFile):
+            info = zipfile.ZipInfo(f"{name}/", time.localtime(self.mtime)[:6])
+            info.external_attr = (stat.S_IFDIR | mode) << 16 | 0x10
+            self.archive.writestr(info, b"")
+        else:
+            tar_info = self.tar_info(name, mode)
+            tar_info.type = tarfile.DIRTYPE
+            self.archive.addfile(tar_info)
+
+    def add_file(self, path: str, content: bytes, mode: int) -> None:
+        self.add_stream(path, io.BytesIO(content), len(content), mode)
+
+    def copy_file(self, path: str, source: str, mode: int) -> None:
+        # stream the file into the archive instead of reading it into memory as a whole
+        with open(source, "rb") as f:
+            self.add_stream(path, f, os.fstat(f.fileno()).st_size, mode)
+
+    def add_stream(self, path: str, stream: BinaryIO, size: int, mode: int) -> None:
+        """
+        Add a file to the archive, whose content is read from a stream.
+
+        :param path: Path of the file relative to the project directory
+        :param stream: Stream to read the content from
+        :param size: Size of the content in bytes
+        :param mode: Permission bits of the file
+        """
+        name = self.member_name(path)
+        if isinstance(self.archive, zipfile.ZipFile):
+            info = zipfile.ZipInfo(name, time.localtime(self.mtime)[:6])
+            info.external_attr = (stat.S_IFREG | mode) << 16
+            info.compress_type = zipfile.ZIP_DEFLATED
+            with self.archive.open(info, "w") as member:
+                shutil.copyfileobj(stream, member)
+        else:
+            tar_info = self.tar_info(name, mode)
+            tar_info.size = size
+            self.archive.addfile(tar_info, stream)
+
+    def tar_info(self, name: str, mode: int) -> tarfile.TarInfo:
+        """
+        Create the header of a tar archive member.
+
+        :param name: Name of the member inside of the archive
+        :param mode: Permission bits of the member
+        :return: The member's header
+        """
+        tar_info = tarfile.TarInfo(name)
+        tar_info.mode = mode
+        tar_info.mtime = int(self.mtime)
+        return tar_info
+
+    def member_name(self, path: str) -> str:
+        """
+        Map a path relative to the project directory to the name of an archive member.
+
+        :param path: Path relative to the project directory
+        :return: Name of the archive member (always using forward slashes)
+        """
+        return os.path.normpath(os.path.join(self.project_name, path)).replace(os.sep, "/")
+
+    def close(self) -> None:
+        """
+        Finish the archive. The underlying file is not closed.
+        """
+        self.archive.close()
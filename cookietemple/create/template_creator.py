@@ -1,27 +1,43 @@
+import io
 import logging
 import os
 import re
 import shutil
 import sys
-import tempfile
 from dataclasses import asdict
-from distutils.dir_util import copy_tree
 from pathlib import Path
-from typing import Optional, Union
+from typing import List, Optional, Union
 
-import requests
-from cookiecutter.main import cookiecutter  # type: ignore
+from github import GithubException
 from ruamel.yaml import YAML
 
 import cookietemple
 from cookietemple.common.load_yaml import load_yaml_file
+from cookietemple.common.template_registry import TemplateRegistry
 from cookietemple.config.config import ConfigCommand
 from cookietemple.create.domains.cookietemple_template_struct import CookietempleTemplateStruct
-from cookietemple.create.github_support import create_push_github_repository, is_git_repo, load_github_username
+from cookietemple.create.github_support import (
+    create_ct_topic,
+    create_github_labels,
+    create_github_repository,
+    create_sync_secret,
+    github_access_token,
+    github_owner,
+    handle_failed_github_repo_creation,
+    is_git_repo,
+    load_github_username,
+    push_github_repository,
+)
+from cookietemple.create.name_lookup import NameLookup
+from cookietemple.create.render_cache import RenderCache
+from cookietemple.create.sinks import OutputSink
+from cookietemple.create.template_renderer import TemplateLayer, TemplateRenderer
 from cookietemple.custom_cli.questionary import cookietemple_questionary_or_dot_cookietemple
 from cookietemple.lint.lint import lint_project
 from cookietemple.util.dir_util import delete_dir_tree
 from cookietemple.util.docs_util import fix_short_title_underline
+from cookietemple.util.phase_scheduler import PhaseScheduler
+from cookietemple.util.profiling import profile_phase
 from cookietemple.util.rich import console
 
 log = logging.getLogger(__name__)
@@ -32,22 +48,43 @@ class TemplateCreator:
     The base class for all creators.
     It holds the basic template information that are common across all templates (like a project name).
     Furthermore it defines methods that are basic for the template creation process.
+    Network-bound phases (name lookups, creating the Github repository) run in the background as soon as their inputs are known.
+    The Github repository is only created once the project has been rendered, so that it is set up while the project is linted.
     """
 
-    def __init__(self, creator_ctx: CookietempleTemplateStruct):
+    # the background phases setting up the Github repository; pushing the project has to wait for all of them
+    GITHUB_PHASES = ["github repository", "github labels", "github secret", "github topic"]
+
+    def __init__(
+        self,
+        creator_ctx: CookietempleTemplateStruct,
+        output_root: Optional[Path] = None,
+        offline: bool = False,
+        sink: Optional[OutputSink] = None,
+    ):
         self.WD = os.path.dirname(__file__)
         self.TEMPLATES_PATH = f"{self.WD}/templates"
         self.COMMON_FILES_PATH = f"{self.TEMPLATES_PATH}/common_files"
         self.AVAILABLE_TEMPLATES_PATH = f"{self.TEMPLATES_PATH}/available_templates.yml"
-        self.AVAILABLE_TEMPLATES = load_yaml_file(self.AVAILABLE_TEMPLATES_PATH)
-        self.CWD = Path.cwd()
+        self.AVAILABLE_TEMPLATES = TemplateRegistry.get(self.AVAILABLE_TEMPLATES_PATH).available_templates
+        # directory projects are created in by default; no file operation depends on the current working directory
+        self.OUTPUT_ROOT = Path(output_root).resolve() if output_root else Path.cwd()
+        # directory the project directory is actually created in (set as soon as the project path is known)
+        self.PROJECT_ROOT = self.OUTPUT_ROOT
         self.creator_ctx = creator_ctx
+        self.render_cache = RenderCache()
+        self.name_lookup = NameLookup(offline)
+        # receives the rendered project instead of the project directory (e.g. to keep the project in memory)
+        self.sink = sink
+        # the template layers of the last rendering (e.g. to render single files of the project again)
+        self.layers: List[TemplateLayer] = []
+        # answers of the .cookietemple.yml file the project is created from (None if the user is prompted)
+        self.dot_cookietemple: Optional[dict] = None
+        self.phases = PhaseScheduler()
+        self.github_token: Optional[str] = None
 
     def process_common_operations(
         self,
-        path: Path,
-        skip_common_files=False,
-        skip_fix_underline=False,
         domain: Optional[str] = None,
         subdomain: Union[str, bool] = None,
         language: Union[str, bool] = None,
@@ -55,33 +92,30 @@ class TemplateCreator:
     ) -> None:
         """
         Create all stuff that is common for cookietemples template creation process; in detail those things are:
-        create and copy common files, fix docs style, lint the project and ask whether the user wants to create a github repo.
+        create the .cookietemple.yml file, lint the project and ask whether the user wants to create a github repo.
+        The docs style is already fixed while rendering the common files.
         """
-        # create the common files and copy them into the templates directory (skip if flag is set)
-
-        if not skip_common_files:
-            self.create_common_files()
-
         self.create_dot_cookietemple(template_version=self.creator_ctx.template_version)
 
-        if self.creator_ctx.language == "python":
-            project_path = f'{self.CWD}/{self.creator_ctx.project_slug.replace("-", "_")}'
-        else:
-            project_path = f"{self.CWD}/{self.creator_ctx.project_slug}"
-
-        # Ensure that docs are looking good (skip if flag is set)
-        if not skip_fix_underline:
-            fix_short_title_underline(f"{project_path}/docs/index.rst")
-
-        # Lint the project to verify that the new template adheres to all standards
-        lint_project(project_path)
+        project_path = f"{self.PROJECT_ROOT}/{self.project_dir_name()}"
 
-        if self.creator_ctx.is_github_repo and not dot_cookietemple:
-            # rename the currently created template to a temporary name, create Github repo, push, remove temporary template
-            tmp_project_path = f"{project_path}_cookietemple_tmp"
-            os.mkdir(tmp_project_path)
-            create_push_github_repository(project_path, self.creator_ctx, tmp_project_path)
-            shutil.rmtree(tmp_project_path, ignore_errors=True)
+        try:
+            # a project rendered into a sink does not exist on disk, so there is nothing to lint or push
+            if self.sink:
+                log.debug("Skipping linting and Github support of the project rendered into a sink.")
+            # Lint the project to verify that the new template adheres to all standards
+            else:
+                self.start_github_phases()
+                try:
+                    lint_project(project_path)
+                except BaseException:
+                    self.abort_github_phases()
+                    raise
+
+            if self.phases.started("github repository"):
+                self.push_github_repository(project_path)
+        finally:
+            self.phases.shutdown()
 
         if subdomain:
             console.print()
@@ -96,53 +130,48 @@ class TemplateCreator:
                 f"#{domain}-{language} for more information about how to use your chosen template."
             )
 
-        # do not move if path is current working directory or a directory named like the project in the current working directory (second is default case)
-        if path != self.CWD and path != Path(self.CWD / self.creator_ctx.project_slug_no_hyphen):
-            shutil.move(
-                f"{self.CWD}/{self.creator_ctx.project_slug_no_hyphen}",
-                f"{path}/{self.creator_ctx.project_slug_no_hyphen}",
-            )
-
-    def create_template_without_subdomain(self, domain_path: str) -> None:
+    def create_template_without_subdomain(self, domain_path: str, path: Path, skip_common_files: bool = False) -> None:
         """
         Creates a chosen template that does **not** have a subdomain.
-        Calls cookiecutter on the main chosen template.
+        Renders the main chosen template together with the common files.
 
         :param domain_path: Path to the template, which is still in cookiecutter format
+        :param path: Path where the project should be created at
+        :param skip_common_files: Whether to skip rendering the common files into the project
         """
+        self.PROJECT_ROOT = self.project_root(path)
         # Target directory is already occupied -> overwrite?
-        occupied = os.path.isdir(f"{self.CWD}/{self.creator_ctx.project_slug}")
+        occupied = self.project_dir_occupied()
         if occupied:
             self.directory_exists_warning()
 
             # Confirm proceeding with overwriting existing directory
             if cookietemple_questionary_or_dot_cookietemple("confirm", "Do you really want to continue?", default="No"):
-                cookiecutter(
-                    f"{domain_path}/{self.creator_ctx.domain}_{self.creator_ctx.language.lower()}",
-                    no_input=True,
-                    overwrite_if_exists=True,
-                    extra_context=self.creator_ctx_to_dict(),
+                self.render_template(
+                    f"{domain_path}/{self.creator_ctx.domain}_{self.creator_ctx.language.lower()}", skip_common_files
                 )
             else:
                 console.print("[bold red]Aborted! Canceled template creation!")
                 sys.exit(0)
         else:
-            cookiecutter(
-                f"{domain_path}/{self.creator_ctx.domain}_{self.creator_ctx.language.lower()}",
-                no_input=True,
-                overwrite_if_exists=True,
-                extra_context=self.creator_ctx_to_dict(),
+            self.render_template(
+                f"{domain_path}/{self.creator_ctx.domain}_{self.creator_ctx.language.lower()}", skip_common_files
             )
 
-    def create_template_with_subdomain(self, domain_path: str, subdomain: str) -> None:
+    def create_template_with_subdomain(
+        self, domain_path: str, subdomain: str, path: Path, skip_common_files: bool = False
+    ) -> None:
         """
         Creates a chosen template that **does** have a subdomain.
-        Calls cookiecutter on the main chosen template.
+        Renders the main chosen template together with the common files.
 
         :param domain_path: Path to the template, which is still in cookiecutter format
         :param subdomain: Subdomain of the chosen template
+        :param path: Path where the project should be created at
+        :param skip_common_files: Whether to skip rendering the common files into the project
         """
-        occupied = os.path.isdir(f"{self.CWD}/{self.creator_ctx.project_slug}")
+        self.PROJECT_ROOT = self.project_root(path)
+        occupied = self.project_dir_occupied()
         if occupied:
             self.directory_exists_warning()
 
@@ -150,35 +179,32 @@ class TemplateCreator:
             if cookietemple_questionary_or_dot_cookietemple(
                 "confirm", "Do you really want to continue?", default="Yes"
             ):
-                delete_dir_tree(Path(f"{self.CWD}/{self.creator_ctx.project_slug}"))
-                cookiecutter(
-                    f"{domain_path}/{subdomain}_{self.creator_ctx.language.lower()}",
-                    no_input=True,
-                    overwrite_if_exists=True,
-                    extra_context=self.creator_ctx_to_dict(),
+                delete_dir_tree(Path(f"{self.PROJECT_ROOT}/{self.creator_ctx.project_slug}"))
+                self.render_template(
+                    f"{domain_path}/{subdomain}_{self.creator_ctx.language.lower()}", skip_common_files
                 )
 
             else:
                 console.print("[bold red]Aborted! Canceled template creation!")
                 sys.exit(0)
         else:
-            cookiecutter(
-                f"{domain_path}/{subdomain}_{self.creator_ctx.language.lower()}",
-                no_input=True,
-                overwrite_if_exists=True,
-                extra_context=self.creator_ctx_to_dict(),
-            )
+            self.render_template(f"{domain_path}/{subdomain}_{self.creator_ctx.language.lower()}", skip_common_files)
 
-    def create_template_with_subdomain_framework(self, domain_path: str, subdomain: str, framework: str) -> None:
+    def create_template_with_subdomain_framework(
+        self, domain_path: str, subdomain: str, framework: str, path: Path, skip_common_files: bool = False
+    ) -> None:
         """
         Creates a chosen template that **does** have a subdomain.
-        Calls cookiecutter on the main chosen template.
+        Renders the main chosen template together with the common files.
 
         :param domain_path: Path to the template, which is still in cookiecutter format
         :param subdomain: Subdomain of the chosen template
         :param framework: Chosen framework
+        :param path: Path where the project should be created at
+        :param skip_common_files: Whether to skip rendering the common files into the project
         """
-        occupied = os.path.isdir(f"{self.CWD}/{self.creator_ctx.project_slug}")
+        self.PROJECT_ROOT = self.project_root(path)
+        occupied = self.project_dir_occupied()
         if occupied:
             self.directory_exists_warning()
 
@@ -186,24 +212,52 @@ class TemplateCreator:
             if cookietemple_questionary_or_dot_cookietemple(
                 "confirm", "Do you really want to continue?", default="Yes"
             ):
-                cookiecutter(
-                    f"{domain_path}/{subdomain}_{self.creator_ctx.language.lower()}/{framework}",
-                    no_input=True,
-                    overwrite_if_exists=True,
-                    extra_context=self.creator_ctx_to_dict(),
+                self.render_template(
+                    f"{domain_path}/{subdomain}_{self.creator_ctx.language.lower()}/{framework}", skip_common_files
                 )
 
             else:
                 console.print("[bold red]Aborted! Canceled template creation!")
                 sys.exit(0)
         else:
-            cookiecutter(
-                f"{domain_path}/{subdomain}_{self.creator_ctx.language.lower()}/{framework}",
-                no_input=True,
-                overwrite_if_exists=True,
-                extra_context=self.creator_ctx_to_dict(),
+            self.render_template(
+                f"{domain_path}/{subdomain}_{self.creator_ctx.language.lower()}/{framework}", skip_common_files
             )
 
+    def project_dir_occupied(self) -> bool:
+        """
+        Check whether the project directory already exists. Projects rendered into a sink never overwrite anything.
+
+        :return: Whether the project directory already exists
+        """
+        return not self.sink and os.path.isdir(f"{self.PROJECT_ROOT}/{self.creator_ctx.project_slug}")
+
+    def project_root(self, path: Path) -> Path:
+        """
+        Determine the directory the project directory is created in.
+        If the given path already is a directory named like the project inside the output root (default case),
+        the project directory is created in the output root instead of being nested.
+
+        :param path: Path where the project should be created at
+        :return: The directory to create the project directory in
+        """
+        path = Path(path).resolve()
+        if path == Path(self.OUTPUT_ROOT / self.creator_ctx.project_slug_no_hyphen):
+            return self.OUTPUT_ROOT
+        return path
+
+    def project_dir_name(self) -> str:
+        """
+        Python does not allow for hyphens (module imports etc), so python projects are created in a directory without hyphens.
+
+        :return: The name of the created project directory
+        """
+        return (
+            self.creator_ctx.project_slug
+            if self.creator_ctx.language != "python"
+            else self.creator_ctx.project_slug_no_hyphen
+        )
+
     def prompt_general_template_configuration(self, dot_cookietemple: Optional[dict]):
         """
         Prompts the user for general options that are required by all templates.
@@ -246,11 +300,9 @@ class TemplateCreator:
             dot_cookietemple=dot_cookietemple,
             to_get_property="project_name",
         ).lower()  # type: ignore
-        if self.creator_ctx.language == "python":
-            self.check_name_available("PyPi", dot_cookietemple)
-        self.check_name_available("readthedocs.io", dot_cookietemple)
-        self.creator_ctx.project_slug = self.creator_ctx.project_name.replace(" ", "_")  # type: ignore
-        self.creator_ctx.project_slug_no_hyphen = self.creator_ctx.project_slug.replace("-", "_")
+        hosts = ["PyPi", "readthedocs.io"] if self.creator_ctx.language == "python" else ["readthedocs.io"]
+        # look the name up while the remaining questions are answered
+        self.start_name_lookup(hosts, dot_cookietemple)
         self.creator_ctx.project_short_description = cookietemple_questionary_or_dot_cookietemple(
             function="text",
             question="Short description of your project",
@@ -300,6 +352,10 @@ class TemplateCreator:
             dot_cookietemple=dot_cookietemple,
             to_get_property="license",
         )
+        # the project name may still change, if it is already taken
+        self.check_name_available(hosts, dot_cookietemple)
+        self.creator_ctx.project_slug = self.creator_ctx.project_name.replace(" ", "_")  # type: ignore
+        self.creator_ctx.project_slug_no_hyphen = self.creator_ctx.project_slug.replace("-", "_")
         if dot_cookietemple:
             self.creator_ctx.github_username = dot_cookietemple["github_username"]
             self.creator_ctx.creator_github_username = dot_cookietemple["creator_github_username"]
@@ -307,132 +363,221 @@ class TemplateCreator:
             self.creator_ctx.github_username = load_github_username()
             self.creator_ctx.creator_github_username = self.creator_ctx.github_username
 
-    def create_common_files(self) -> None:
-        """
-        Create a temporary directory for common files of all templates and apply cookiecutter on them.
-        They are subsequently moved into the directory of the created template.
-        """
-        log.debug("Creating common files.")
-        dirpath = tempfile.mkdtemp()
-        copy_tree(f"{self.COMMON_FILES_PATH}", dirpath)
-        cwd_project = self.CWD
-        os.chdir(dirpath)
-        log.debug(f"Cookiecuttering common files at {dirpath}")
-        cookiecutter(
-            dirpath,
-            extra_context={
-                "full_name": self.creator_ctx.full_name,
-                "email": self.creator_ctx.email,
-                "language": self.creator_ctx.language,
-                "domain": self.creator_ctx.domain,
-                "project_name": self.creator_ctx.project_name,
-                "project_slug": self.creator_ctx.project_slug
-                if self.creator_ctx.language != "python"
-                else self.creator_ctx.project_slug_no_hyphen,
-                "version": self.creator_ctx.version,
-                "license": self.creator_ctx.license,
-                "project_short_description": self.creator_ctx.project_short_description,
-                "github_username": self.creator_ctx.github_username,
-                "creator_github_username": self.creator_ctx.creator_github_username,
-                "cookietemple_version": cookietemple.__version__,
-            },
-            no_input=True,
-            overwrite_if_exists=True,
-        )
+    def common_files_context(self) -> dict:
+        """
+        Build the context the files common to all templates are rendered with.
 
-        # recursively copy the common files directory content to the created project
-        log.debug("Copying common files into the created project")
-        dest_dir = (
-            self.creator_ctx.project_slug
-            if self.creator_ctx.language != "python"
-            else self.creator_ctx.project_slug_no_hyphen
+        :return: The context for the common files template
+        """
+        return {
+            "full_name": self.creator_ctx.full_name,
+            "email": self.creator_ctx.email,
+            "language": self.creator_ctx.language,
+            "domain": self.creator_ctx.domain,
+            "project_name": self.creator_ctx.project_name,
+            "project_slug": self.project_dir_name(),
+            "version": self.creator_ctx.version,
+            "license": self.creator_ctx.license,
+            "project_short_description": self.creator_ctx.project_short_description,
+            "github_username": self.creator_ctx.github_username,
+            "creator_github_username": self.creator_ctx.creator_github_username,
+            "cookietemple_version": cookietemple.__version__,
+        }
+
+    @profile_phase("render")
+    def render_template(self, template_path: str, skip_common_files: bool = False) -> None:
+        """
+        Render the main template layered with the common files of all templates in a single pass directly into the project root
+        (or into the sink, if the creator has one).
+        If the very same templates have already been rendered with the same context, the cached rendering is copied instead.
+
+        :param template_path: Path to the template, which is still in cookiecutter format
+        :param skip_common_files: Whether to skip rendering the common files into the project
+        """
+        layers = [self.main_template_layer(template_path)]
+        if not skip_common_files:
+            log.debug("Rendering common files into the project.")
+            # ensure that the docs are looking good
+            layers.append(
+                TemplateLayer(
+                    self.COMMON_FILES_PATH,
+                    self.common_files_context(),
+                    postprocessors={os.path.join("docs", "index.rst"): fix_short_title_underline},
+                )
+            )
+        self.layers = layers
+        output_dir = str(self.PROJECT_ROOT)
+        if self.sink:
+            TemplateRenderer(layers).render(output_dir, self.sink)
+            return
+        cache_key = self.render_cache.layered_key(
+            [
+                (
+                    layer.template_path,
+                    {
+                        **layer.extra_context,
+                        "_remap": layer.remap,
+                        "_exclude": sorted(layer.exclude),
+                        "_postprocessors": {path: func.__qualname__ for path, func in layer.postprocessors.items()},
+                    },
+                )
+                for layer in layers
+            ]
         )
-        copy_tree(f"{Path.cwd()}/common_files_util", f"{cwd_project}/{dest_dir}")
-        # delete the tmp cookiecuttered common files directory
-        log.debug("Delete common files directory.")
-        delete_dir_tree(Path(f"{Path.cwd()}/common_files_util"))
-        try:
-            shutil.rmtree(dirpath)
-        except PermissionError:
-            # If deleting these temporary files fails, fail silently (#748)
-            pass
-        # change to recent cwd so lint etc can run properly
-        os.chdir(str(cwd_project))
+        if self.render_cache.materialize(cache_key, output_dir):
+            log.debug(f"Using cached rendering of {template_path}")
+            return
+        project_dir = TemplateRenderer(layers).render(output_dir)
+        self.render_cache.put(cache_key, project_dir)
+
+    def main_template_layer(self, template_path: str) -> TemplateLayer:
+        """
+        Describe how the main template is rendered.
+        Creators override this to leave out or move parts of their template depending on the user's choices.
+
+        :param template_path: Path to the template, which is still in cookiecutter format
+        :return: The main template layer
+        """
+        return TemplateLayer(template_path, self.creator_ctx_to_dict())
+
+    def start_name_lookup(self, hosts: List[str], dot_cookietemple: Optional[dict]) -> None:
+        """
+        Start looking up the project name at PyPi and/or readthedocs.io in the background.
+        Its messages are only printed by check_name_available, since the user may be answering prompts meanwhile.
+
+        :param hosts: The hosts to look the project name up at
+        :param dot_cookietemple: Dictionary created from the .cookietemple.yml file. None if no .cookietemple.yml file was used.
+        """
+        # the name of a project created from a .cookietemple.yml file is fixed, so there is nothing to look up
+        if not dot_cookietemple:
+            self.phases.start("name lookup", self.name_lookup.lookup_quietly, self.creator_ctx.project_name, hosts)
 
-    def check_name_available(self, host, dot_cookietemple) -> None:
+    @profile_phase("name check")
+    def check_name_available(self, hosts: List[str], dot_cookietemple: Optional[dict]) -> None:
         """
-        Main function that calls the queries for the project name lookup at PyPi and readthedocs.io
+        Main function that looks up the project name at PyPi and/or readthedocs.io.
+        Waits for the lookup started in the background, if any.
+
+        :param hosts: The hosts to look the project name up at
+        :param dot_cookietemple: Dictionary created from the .cookietemple.yml file. None if no .cookietemple.yml file was used.
         """
+        # the name of a project created from a .cookietemple.yml file is fixed, so there is nothing to look up
+        if dot_cookietemple:
+            return
+        if self.phases.started("name lookup"):
+            lookup, messages = self.phases.join("name lookup")
+            for message in messages:
+                console.print(message)
+        else:
+            lookup = self.name_lookup.lookup(self.creator_ctx.project_name, hosts)  # type: ignore
         # if project already exists at either PyPi or readthedocs, ask user for confirmation with the option to change the project name
-        while TemplateCreator.query_name_available(host, self.creator_ctx.project_name) and not dot_cookietemple:  # type: ignore
-            console.print(f"[bold red]A project named {self.creator_ctx.project_name} already exists at {host}!")
+        while True:
+            taken_at = [host for host, taken in lookup.items() if taken]
+            if not taken_at:
+                break
+            console.print(
+                f"[bold red]A project named {self.creator_ctx.project_name} already exists at {' and '.join(taken_at)}!"
+            )
             # provide the user an option to change the project's name
             if cookietemple_questionary_or_dot_cookietemple(
                 function="confirm",
                 question="Do you want to choose another name for your project?\n"
-                f"Otherwise you will not be able to host your project at {host}!",
+                f"Otherwise you will not be able to host your project at {' and '.join(taken_at)}!",
                 default="Yes",
             ):
                 self.creator_ctx.project_name = cookietemple_questionary_or_dot_cookietemple(
                     function="text", question="Project name", default="Exploding Springfield"
                 )
+                lookup = self.name_lookup.lookup(self.creator_ctx.project_name, hosts)  # type: ignore
             # continue if the project should be named anyways
             else:
                 break
 
-    @staticmethod
-    def query_name_available(host: str, project_name: str) -> bool:
+    def start_github_phases(self) -> None:
         """
-        Make a GET request to the host to check whether a project with this name already exists.
-        :param host The host (either PyPi or readthedocs)
-        :param project_name Name of the project the user wants to create
-
-        :return: Whether request was successful (name already taken on host) or not
+        Create the Github repository with its labels, sync secret and topic in the background while the rendered project is linted,
+        since they only depend on the answers. Labels, secret and topic are created concurrently as soon as the repository exists.
+        Reading the personal access token may prompt the user and therefore happens right away.
         """
-        # check if host is either PyPi or readthedocs.io; only relevant for developers working on this code
-        if host not in {"PyPi", "readthedocs.io"}:
-            log.debug(f"[bold red]Unknown host {host}. Use either PyPi or readthedocs.io!")
-            # raise a ValueError if the host name is invalid
-            raise ValueError(
-                f"check_name_available has been called with the invalid host {host}.\nValid hosts are PyPi and readthedocs.io"
-            )
-        console.print(f"[bold blue]Looking up {project_name} at {host}!")
-        # determine url depending on host being either PyPi or readthedocs.io
-        url = "https://" + (
-            f'pypi.org/project/{project_name.replace(" ", "")}'
-            if host == "PyPi"
-            else f'{project_name.replace(" ", "")}.readthedocs.io'
+        if not self.creator_ctx.is_github_repo or self.dot_cookietemple or self.sink:
+            return
+        self.github_token = github_access_token()
+        if self.github_token is None:
+            return
+        repository, labels, secret, topic = TemplateCreator.GITHUB_PHASES
+        owner, project_slug = github_owner(self.creator_ctx), self.creator_ctx.project_slug
+        console.print("[bold blue]Creating the Github repository in the background")
+        self.phases.start(repository, create_github_repository, self.creator_ctx, self.github_token)
+        self.phases.start(
+            labels,
+            lambda: create_github_labels(self.phases.join(repository), [("DEPENDABOT", "1BB0CE")]),
+            after=[repository],
         )
-        log.debug(f"Looking up {url}")
+        self.phases.start(secret, create_sync_secret, owner, project_slug, self.github_token, after=[repository])
+        self.phases.start(topic, create_ct_topic, owner, project_slug, self.github_token, after=[repository])
+
+    def push_github_repository(self, project_path: str) -> None:
+        """
+        Wait for the Github repository to be set up and push the project to it.
+
+        :param project_path: The path to the created project
+        """
+        try:
+            with profile_phase("github setup"):
+                for phase in TemplateCreator.GITHUB_PHASES:
+                    self.phases.join(phase)
+        except (GithubException, ConnectionError) as e:
+            handle_failed_github_repo_creation(e)
+            return
+        # rename the currently created template to a temporary name, push, remove temporary template
+        tmp_project_path = f"{project_path}_cookietemple_tmp"
+        os.mkdir(tmp_project_path)
+        with profile_phase("github push"):
+            push_github_repository(project_path, self.creator_ctx, tmp_project_path, self.github_token)  # type: ignore
+        shutil.rmtree(tmp_project_path, ignore_errors=True)
+
+    def abort_github_phases(self) -> None:
+        """
+        Let the Github phases running in the background finish before exiting, since an interrupted request may leave a
+        half configured repository behind. The project is never pushed, so the created repository is deleted again.
+        """
+        if not self.phases.started("github repository"):
+            self.phases.shutdown()
+            return
+        self.phases.join_all()
+        self.phases.shutdown()
         try:
-            request = requests.get(url)
-            if request.status_code == 200:
-                return True
-        # catch exceptions when server may be unavailable or the request timed out
-        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
-            log.debug(f"Unable to contact {host}")
-            log.debug(f"Error was: {e}")
+            repository = self.phases.join("github repository")
+        # nothing was created
+        except Exception as e:
+            log.debug(f"The Github repository was not created: {e}")
+            return
+        try:
+            repository.delete()
             console.print(
-                f"[bold red]Cannot check whether name already taken on {host} because its unreachable at the moment!"
+                f"[bold yellow]Deleted the Github repository {self.creator_ctx.project_slug} again, since the project was not created!"
+            )
+        except (GithubException, ConnectionError) as e:
+            log.debug(f"Unable to delete the Github repository: {e}")
+            console.print(
+                f"[bold red]The project was not pushed to the already created Github repository {self.creator_ctx.project_slug}. "
+                "Please delete the repository manually!"
             )
-            return False
-
-        return False
 
     def directory_exists_warning(self) -> None:
         """
         If the directory is already a git directory within the same project, print error message and exit.
         Otherwise print a warning that a directory already exists and any further action on the directory will overwrite its contents.
         """
-        if is_git_repo(Path(f"{self.CWD}/{self.creator_ctx.project_slug}")):
+        if is_git_repo(Path(f"{self.PROJECT_ROOT}/{self.creator_ctx.project_slug}")):
             console.print(
-                f"[bold red]Error: A git project named {self.creator_ctx.project_slug} already exists at [green]{self.CWD}\n"
+                f"[bold red]Error: A git project named {self.creator_ctx.project_slug} already exists at [green]{self.PROJECT_ROOT}\n"
             )
             console.print("[bold red]Aborting!")
             sys.exit(1)
         else:
             console.print(
-                f"[bold yellow]WARNING: [red]A directory named {self.creator_ctx.project_slug} already exists at [blue]{self.CWD}\n"
+                f"[bold yellow]WARNING: [red]A directory named {self.creator_ctx.project_slug} already exists at [blue]{self.PROJECT_ROOT}\n"
             )
             console.print("Proceeding now will overwrite this directory and its content!")
 
@@ -446,14 +591,14 @@ class TemplateCreator:
         log.debug("Creating .cookietemple.yml file.")
         self.creator_ctx.template_version = f"{template_version} # <<COOKIETEMPLE_NO_BUMP>>"
         self.creator_ctx.cookietemple_version = f"{cookietemple.__version__} # <<COOKIETEMPLE_NO_BUMP>>"
-        # Python does not allow for hyphens (module imports etc) -> remove them
-        no_hyphen = self.creator_ctx.project_slug.replace("-", "_")
-        with open(
-            f'{self.creator_ctx.project_slug if self.creator_ctx.language != "python" else no_hyphen}/.cookietemple.yml',
-            "w",
-        ) as f:
-            yaml = YAML()
-            struct_to_dict = self.creator_ctx_to_dict()
+        yaml = YAML()
+        struct_to_dict = self.creator_ctx_to_dict()
+        if self.sink:
+            content = io.StringIO()
+            yaml.dump(struct_to_dict, content)
+            self.sink.add_file(".cookietemple.yml", content.getvalue().encode("utf-8"), 0o644)
+            return
+        with open(f"{self.PROJECT_ROOT}/{self.project_dir_name()}/.cookietemple.yml", "w") as f:
             yaml.dump(struct_to_dict, f)
 
     def creator_ctx_to_dict(self) -> dict:
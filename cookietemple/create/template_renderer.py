@@ -0,0 +1,351 @@
+import io
+import json
+import logging
+import os
+import warnings
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from cookiecutter.config import get_user_config  # type: ignore
+from cookiecutter.environment import StrictEnvironment  # type: ignore
+from cookiecutter.exceptions import ContextDecodingException, UndefinedVariableInTemplate  # type: ignore
+from cookiecutter.generate import apply_overwrites_to_context, is_copy_only_path  # type: ignore
+from cookiecutter.prompt import prompt_for_config  # type: ignore
+from jinja2.exceptions import TemplateSyntaxError, UndefinedError
+
+from cookietemple.create.bytecode_cache import TemplateBytecodeCache
+from cookietemple.create.sinks import DirectorySink, OutputSink
+from cookietemple.create.template_source import TemplateSource, open_template_source
+
+log = logging.getLogger(__name__)
+
+# file types which are always copied verbatim, since they are binary or static assets that never contain jinja syntax
+VERBATIM_SUFFIXES = frozenset(
+    {".eot", ".eps", ".gif", ".ico", ".jar", ".jpeg", ".jpg", ".pdf", ".png", ".ps", ".svg", ".ttf", ".woff", ".woff2"}
+)
+
+
+@dataclass
+class TemplateLayer:
+    """
+    A cookiecutter template together with the context it is rendered with.
+    """
+
+    template_path: str  # path to the template (the directory containing the cookiecutter.json or its pack)
+    extra_context: dict  # context overwriting the defaults of the cookiecutter.json
+    # rendered paths (relative to the project directory) that are moved to another path, e.g. a chosen frontend theme
+    remap: Dict[str, str] = field(default_factory=dict)
+    # rendered paths (relative to the project directory, after remapping) that are neither rendered nor written
+    exclude: Set[str] = field(default_factory=set)
+    # functions transforming the rendered content of files keyed by their path (relative to the project directory)
+    postprocessors: Dict[str, Callable[[str], str]] = field(default_factory=dict)
+
+
+@dataclass
+class SourceFile:
+    """
+    A single file of a template layer and how it is turned into an output file.
+    """
+
+    layer: int  # index of the layer the file belongs to
+    path: str  # path of the file relative to the templated directory of its layer
+    copy_only: bool  # whether the file is copied verbatim (matched by _copy_without_render or a verbatim file type)
+
+
+class TemplateRenderer:
+    """
+    Render one or more cookiecutter templates layered on top of each other in a single pass.
+    The templated directories of all layers are merged into one virtual source tree (files of later layers win)
+    and every output file is written exactly once into the project directory named by the first layer.
+    Where the project ends up is decided by an output sink (a directory on disk by default or e.g. memory).
+    Rendering behaves like cookiecutter (filters, _copy_without_render, binary files, newlines and permissions),
+    but never changes the current working directory.
+    Binary files and static assets (see VERBATIM_SUFFIXES) never pass through jinja and are cloned as cheaply as the filesystem allows.
+    Templates are read from their directories or, if those do not exist, from their packs (see template_source).
+    """
+
+    def __init__(self, layers: List[TemplateLayer]):
+        self.layers = layers
+        self.sources: List[TemplateSource] = []
+        # templated directories (e.g. {{ cookiecutter.project_slug }}) relative to the root of their template
+        self.template_dirs: List[str] = []
+        self.contexts: List[dict] = []
+        self.envs: List[StrictEnvironment] = []
+        # compiled template files are shared across all renderings (and processes) through a persistent cache
+        self.bytecode_cache = TemplateBytecodeCache.for_environment()
+
+    def render(self, output_dir: str, sink: Optional[OutputSink] = None) -> str:
+        """
+        Render all layers into a project directory inside of the output directory.
+
+        :param output_dir: Directory to create the project directory in
+        :param sink: The sink receiving all rendered directories and files. Defaults to writing them into the project directory.
+        :return: Absolute path to the rendered project directory (which only exists on disk for the default sink)
+        """
+        self.load_layers(output_dir)
+        project_name = self.project_name()
+        project_dir = os.path.abspath(os.path.join(output_dir, project_name))
+        sink = sink if sink else DirectorySink(project_dir)
+        sink.start(project_name)
+        dirs, files = self.source_tree()
+
+        log.debug(f"Rendering {len(files)} files of {len(self.layers)} template layers into {project_dir}")
+        for directory in sorted(dirs):
+            sink.add_dir(directory, dirs[directory])
+        for outfile, source in files.items():
+            self.write_file(source, outfile, sink)
+
+        return project_dir
+
+    def project_name(self) -> str:
+        """
+        Render the name of the project directory, which is named by the first layer.
+
+        :return: The name of the project directory
+        """
+        return self.render_string(0, os.path.basename(self.template_dirs[0]), "project directory")
+
+    def compile(self) -> int:
+        """
+        Compile all template files of all layers without rendering them, which fills the bytecode cache.
+
+        :return: The number of compiled template files
+        """
+        self.load_layers(".")
+        _, files = self.source_tree()
+        compiled = 0
+        for source in files.values():
+            if source.copy_only or self.sources[source.layer].is_binary(
+                os.path.join(self.template_dirs[source.layer], source.path)
+            ):
+                continue
+            try:
+                self.envs[source.layer].get_template(source.path.replace(os.sep, "/"))
+                compiled += 1
+            except TemplateSyntaxError as e:
+                log.debug(f"Unable to compile {source.path}: {e}")
+
+        return compiled
+
+    def load_layers(self, output_dir: str) -> None:
+        """
+        Generate the context and the jinja environment of every layer like cookiecutter does without any prompts.
+
+        :param output_dir: Directory the project is rendered into
+        """
+        default_context = get_user_config()["default_context"]
+        self.sources, self.template_dirs, self.contexts, self.envs = [], [], [], []
+        for layer in self.layers:
+            source = open_template_source(layer.template_path)
+            context = TemplateRenderer.generate_context(source, default_context, layer.extra_context)
+            context["cookiecutter"] = prompt_for_config(context, no_input=True)
+            context["cookiecutter"]["_template"] = source.template_path
+            context["cookiecutter"]["_output_dir"] = os.path.abspath(output_dir)
+            template_dir = source.find_template()
+            env = StrictEnvironment(
+                context=context,
+                keep_trailing_newline=True,
+                **context["cookiecutter"].get("_jinja2_env_vars", {}),
+            )
+            env.loader = source.loader(template_dir)
+            env.bytecode_cache = self.bytecode_cache
+            self.sources.append(source)
+            self.template_dirs.append(template_dir)
+            self.contexts.append(context)
+            self.envs.append(env)
+
+    @staticmethod
+    def generate_context(source: TemplateSource, default_context: dict, extra_context: dict) -> OrderedDict:
+        """
+        Generate the context of a template from its cookiecutter.json like cookiecutter's generate_context does,
+        but read the cookiecutter.json from the template's source.
+
+        :param source: The source of the template
+        :param default_context: The default context of the user's cookiecutter config
+        :param extra_context: Context overwriting the defaults of the cookiecutter.json
+        :return: The generated context
+        """
+        try:
+            obj = json.loads(source.read("cookiecutter.json").decode("utf-8"), object_pairs_hook=OrderedDict)
+        except ValueError as e:
+            raise ContextDecodingException(
+                f'JSON decoding error while loading "{os.path.join(source.template_path, "cookiecutter.json")}". '
+                f'Decoding error details: "{e}"'
+            )
+        if default_context:
+            try:
+                apply_overwrites_to_context(obj, default_context)
+            except ValueError as e:
+                warnings.warn(f"Invalid default received: {e}")
+        if extra_context:
+            apply_overwrites_to_context(obj, extra_context)
+
+        return OrderedDict(cookiecutter=obj)
+
+    def source_tree(self) -> Tuple[Dict[str, Optional[int]], Dict[str, SourceFile]]:
+        """
+        Merge the templated directories of all layers into one virtual source tree.
+        Paths excluded by a layer are dropped before any of their files is rendered and remapped paths win over
+        files of the same layer that already live at their target path.
+
+        :return: All rendered directory paths mapped to their permission bits (None for the default ones) and a mapping of every
+                 rendered file path to its source file (both relative to the project)
+        """
+        dirs: Dict[str, Optional[int]] = {}
+        files: Dict[str, SourceFile] = {}
+        for layer, template_dir in enumerate(self.template_dirs):
+            moved: Dict[str, SourceFile] = {}
+            for root, subdirs, filenames in self.sources[layer].walk(template_dir):
+                rel_root = os.path.relpath(root, template_dir)
+                render_dirs = []
+                for subdir in subdirs:
+                    rel_dir = os.path.normpath(os.path.join(rel_root, subdir))
+                    out_dir = self.render_string(layer, rel_dir, "directory")
+                    if self.is_pruned(layer, out_dir):
+                        log.debug(f"Skipping excluded directory {rel_dir}.")
+                    elif is_copy_only_path(rel_dir, self.contexts[layer]):
+                        self.add_copy_only_dir(layer, rel_dir, dirs, files, moved)
+                    else:
+                        render_dirs.append(subdir)
+                        mapped_dir = self.output_path(layer, out_dir)
+                        if mapped_dir:
+                            dirs.setdefault(mapped_dir, None)
+                # excluded directories are never walked and directories matched by _copy_without_render are copied as a whole
+                subdirs[:] = render_dirs
+                for filename in filenames:
+                    infile = os.path.normpath(os.path.join(rel_root, filename))
+                    outfile = self.render_string(layer, infile, "file")
+                    # files whose name renders to an empty string are skipped (like cookiecutter does)
+                    if not os.path.basename(outfile):
+                        log.debug(f"The resulting file name of {infile} is empty.")
+                        continue
+                    mapped_file = self.output_path(layer, outfile)
+                    if mapped_file:
+                        target = files if mapped_file == outfile else moved
+                        target[mapped_file] = SourceFile(layer, infile, self.is_verbatim(layer, infile))
+            files.update(moved)
+
+        return dirs, files
+
+    def add_copy_only_dir(
+        self,
+        layer: int,
+        rel_dir: str,
+        dirs: Dict[str, Optional[int]],
+        files: Dict[str, SourceFile],
+        moved: Dict[str, SourceFile],
+    ) -> None:
+        """
+        Add a directory, whose content is copied without rendering, to the virtual source tree.
+        Only the name of the directory itself is rendered. Like cookiecutter copies such directories as a whole,
+        they keep the permissions of their source directories.
+
+        :param layer: Index of the layer the directory belongs to
+        :param rel_dir: Path of the directory relative to the templated directory of its layer
+        :param dirs: Rendered directory paths of the source tree mapped to their permission bits
+        :param files: Rendered file paths of the source tree mapped to their source files
+        :param moved: Remapped file paths of the source tree mapped to their source files
+        """
+        out_dir = self.render_string(layer, rel_dir, "directory")
+        source_dir = os.path.join(self.template_dirs[layer], rel_dir)
+        for root, _, filenames in self.sources[layer].walk(source_dir):
+            rel_root = os.path.relpath(root, source_dir)
+            mapped_root = self.output_path(layer, os.path.normpath(os.path.join(out_dir, rel_root)))
+            if mapped_root:
+                dirs[mapped_root] = self.sources[layer].dir_mode(os.path.normpath(root))
+            for filename in filenames:
+                outfile = os.path.normpath(os.path.join(out_dir, rel_root, filename))
+                mapped_file = self.output_path(layer, outfile)
+                if mapped_file:
+                    target = files if mapped_file == outfile else moved
+                    target[mapped_file] = SourceFile(
+                        layer, os.path.normpath(os.path.join(rel_dir, rel_root, filename)), True
+                    )
+
+    def output_path(self, layer: int, path: str) -> Optional[str]:
+        """
+        Apply the remapping and the exclusions of a layer to a rendered path.
+
+        :param layer: Index of the layer the path belongs to
+        :param path: Rendered path relative to the project directory
+        :return: The path the output is written to or None if the path is excluded
+        """
+        remap = self.layers[layer].remap
+        for prefix in sorted(remap, key=len, reverse=True):
+            if path == prefix or path.startswith(f"{prefix}{os.sep}"):
+                path = os.path.normpath(remap[prefix] + path[len(prefix) :])
+                break
+        if any(path == excluded or path.startswith(f"{excluded}{os.sep}") for excluded in self.layers[layer].exclude):
+            return None
+
+        return path
+
+    def is_pruned(self, layer: int, rel_dir: str) -> bool:
+        """
+        Check whether nothing below a rendered directory ends up in the project, so that it does not need to be walked.
+
+        :param layer: Index of the layer the directory belongs to
+        :param rel_dir: Rendered directory path relative to the project directory
+        :return: Whether the directory can be skipped as a whole
+        """
+        if self.output_path(layer, rel_dir):
+            return False
+        # a remapped path may still live below an excluded directory
+        return not any(prefix.startswith(f"{rel_dir}{os.sep}") for prefix in self.layers[layer].remap)
+
+    def is_verbatim(self, layer: int, infile: str) -> bool:
+        """
+        Check whether a file is copied without rendering, either because the template's _copy_without_render
+        manifest matches it or because its file type is a known binary or static asset.
+
+        :param layer: Index of the layer the file belongs to
+        :param infile: Path of the file relative to the templated directory of its layer
+        :return: Whether the file is copied verbatim
+        """
+        return os.path.splitext(infile)[1].lower() in VERBATIM_SUFFIXES or is_copy_only_path(
+            infile, self.contexts[layer]
+        )
+
+    def write_file(self, source: SourceFile, outfile: str, sink: OutputSink) -> None:
+        """
+        Write a single output file into the sink, either by copying it verbatim or by rendering it.
+
+        :param source: The source file to generate the output file from
+        :param outfile: Path of the output file relative to the project directory
+        :param sink: The sink receiving the output file
+        """
+        template_source = self.sources[source.layer]
+        infile = os.path.join(self.template_dirs[source.layer], source.path)
+        mode = template_source.mode(infile)
+        if source.copy_only or template_source.is_binary(infile):
+            log.debug(f"Copying {infile} to {outfile} without rendering")
+            template_source.copy_file(infile, sink, outfile, mode)
+        else:
+            context = self.contexts[source.layer]
+            try:
+                rendered = self.envs[source.layer].get_template(source.path.replace(os.sep, "/")).render(**context)
+            except UndefinedError as e:
+                raise UndefinedVariableInTemplate(f"Unable to create file '{source.path}'", e, context)
+            postprocessor = self.layers[source.layer].postprocessors.get(outfile)
+            if postprocessor:
+                rendered = postprocessor(rendered)
+            # keep the newline style of the template file unless the template overwrites it
+            with io.TextIOWrapper(io.BytesIO(template_source.read(infile)), encoding="utf-8", newline="") as fh:
+                fh.readline()
+                newline = context["cookiecutter"].get("_new_lines", False) or fh.newlines or os.linesep
+            sink.add_file(outfile, rendered.replace("\n", newline).encode("utf-8"), mode)
+
+    def render_string(self, layer: int, template: str, kind: str) -> str:
+        """
+        Render a path of a layer with the context of this layer.
+
+        :param layer: Index of the layer
+        :param template: The path to render
+        :param kind: What the path belongs to (used for error messages)
+        :return: The rendered path
+        """
+        try:
+            return self.envs[layer].from_string(template).render(**self.contexts[layer])
+        except UndefinedError as e:
+            raise UndefinedVariableInTemplate(f"Unable to create {kind} '{template}'", e, self.contexts[layer])
@@ -0,0 +1,407 @@
+import hashlib
+import json
+import logging
+import mmap
+import os
+import stat
+import struct
+import zlib
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from binaryornot.check import is_binary  # type: ignore
+from cookiecutter.exceptions import NonTemplatedInputDirException  # type: ignore
+from cookiecutter.find import find_template  # type: ignore
+from jinja2 import BaseLoader, Environment, FileSystemLoader, TemplateNotFound
+
+from cookietemple.create.sinks import OutputSink
+
+log = logging.getLogger(__name__)
+
+# file extension of packed templates; the pack of a template lives next to its (possibly removed) directory
+PACK_SUFFIX = ".ctpack"
+# every pack starts with this magic followed by the length of its manifest (8 bytes, big endian) and the manifest itself
+PACK_MAGIC = b"CTPACK\x01\n"
+
+
+class TemplateSource(ABC):
+    """
+    The files of a cookiecutter template, which are either loose files in a directory or bundled into a single pack.
+    All paths are relative to the template's root (the directory containing the cookiecutter.json).
+    """
+
+    def __init__(self, template_path: str):
+        self.template_path = template_path  # absolute path to the template directory
+
+    @abstractmethod
+    def walk(self, top: str) -> Iterator[Tuple[str, List[str], List[str]]]:
+        """
+        Walk a directory of the template top-down like os.walk does. Removing directories from the yielded
+        directory lists prunes them.
+
+        :param top: Directory to walk (relative to the template's root)
+        :return: Iterator over all directories (relative to the template's root), their subdirectories and their files
+        """
+
+    @abstractmethod
+    def read(self, path: str) -> bytes:
+        """
+        Read the content of a template file.
+
+        :param path: Path of the file relative to the template's root
+        :return: The content of the file
+        """
+
+    @abstractmethod
+    def mode(self, path: str) -> int:
+        """
+        Look up the permission bits of a template file.
+
+        :param path: Path of the file relative to the template's root
+        :return: The permission bits of the file
+        """
+
+    @abstractmethod
+    def dir_mode(self, path: str) -> Optional[int]:
+        """
+        Look up the permission bits of a template directory.
+
+        :param path: Path of the directory relative to the template's root
+        :return: The permission bits of the directory or None if they are unknown
+        """
+
+    @abstractmethod
+    def is_binary(self, path: str) -> bool:
+        """
+        Check whether a template file is binary and hence never rendered.
+
+        :param path: Path of the file relative to the template's root
+        :return: Whether the file is binary
+        """
+
+    def copy_file(self, path: str, sink: OutputSink, outfile: str, mode: int) -> None:
+        """
+        Copy a template file verbatim into a sink.
+
+        :param path: Path of the file relative to the template's root
+        :param sink: The sink receiving the file
+        :param outfile: Path of the output file relative to the project directory
+        :param mode: Permission bits of the output file
+        """
+        sink.add_file(outfile, self.read(path), mode)
+
+    @abstractmethod
+    def find_template(self) -> str:
+        """
+        Find the templated directory (the one named like {{ cookiecutter.project_slug }}) of the template.
+
+        :return: Path of the templated directory relative to the template's root
+        """
+
+    @abstractmethod
+    def loader(self, template_dir: str) -> BaseLoader:
+        """
+        Create the jinja loader for all files of the templated directory.
+
+        :param template_dir: Path of the templated directory relative to the template's root
+        :return: The jinja loader
+        """
+
+    @abstractmethod
+    def tree_hash(self) -> Tuple[str, bool]:
+        """
+        Hash all relative paths, permissions and contents of the template source tree.
+        Directories and packs of the very same template share the hash.
+
+        :return: The hash of the template tree and whether any of its files uses the jinja2 now extension
+        """
+
+
+class DirectorySource(TemplateSource):
+    """
+    A template stored as loose files in a directory (e.g. a checkout of cookietemple).
+    """
+
+    def walk(self, top: str) -> Iterator[Tuple[str, List[str], List[str]]]:
+        for root, dirs, files in os.walk(os.path.join(self.template_path, top)):
+            yield os.path.relpath(root, self.template_path), dirs, files
+
+    def read(self, path: str) -> bytes:
+        with open(os.path.join(self.template_path, path), "rb") as f:
+            return f.read()
+
+    def mode(self, path: str) -> int:
+        return stat.S_IMODE(os.stat(os.path.join(self.template_path, path)).st_mode)
+
+    def dir_mode(self, path: str) -> Optional[int]:
+        return self.mode(path)
+
+    def is_binary(self, path: str) -> bool:
+        return is_binary(os.path.join(self.template_path, path))
+
+    def copy_file(self, path: str, sink: OutputSink, outfile: str, mode: int) -> None:
+        # let the sink clone the file instead of reading it
+        sink.copy_file(outfile, os.path.join(self.template_path, path), mode)
+
+    def find_template(self) -> str:
+        return os.path.relpath(find_template(self.template_path), self.template_path)
+
+    def loader(self, template_dir: str) -> BaseLoader:
+        return FileSystemLoader(os.path.join(self.template_path, template_dir))
+
+    def tree_hash(self) -> Tuple[str, bool]:
+        tree_hash = hashlib.sha256()
+        uses_now = False
+        for root, dirs, files in os.walk(self.template_path):
+            dirs.sort()
+            # directories copied without rendering keep their permissions
+            for directory in dirs:
+                dir_path = os.path.join(root, directory)
+                tree_hash.update(os.path.relpath(dir_path, self.template_path).encode("utf-8"))
+                tree_hash.update(oct(os.stat(dir_path).st_mode).encode("utf-8"))
+            for file in sorted(files):
+                file_path = os.path.join(root, file)
+                with open(file_path, "rb") as fh:
+                    content = fh.read()
+                uses_now |= b"{% now" in content
+                tree_hash.update(os.path.relpath(file_path, self.template_path).encode("utf-8"))
+                tree_hash.update(oct(os.stat(file_path).st_mode).encode("utf-8"))
+                tree_hash.update(hashlib.sha256(content).digest())
+
+        return tree_hash.hexdigest(), uses_now
+
+
+@dataclass
+class PackEntry:
+    """
+    A single file of a template pack as listed in the pack's manifest.
+    """
+
+    path: str  # path of the file relative to the template's root (always using forward slashes)
+    offset: int  # offset of the stored content relative to the end of the manifest
+    size: int  # size of the file in bytes
+    stored_size: int  # size of the (possibly compressed) stored content in bytes
+    compressed: bool  # whether the stored content is zlib compressed
+    sha256: str
+    mode: int  # permission bits of the file
+    render: bool  # whether the file is rendered (False for binary files, which are always copied verbatim)
+
+
+class PackSource(TemplateSource):
+    """
+    A template bundled into a single pack file, which is memory mapped and read with random access.
+    A pack consists of a manifest indexing all files (path, size, hash and whether they are rendered)
+    followed by the individually compressed contents of the files.
+    """
+
+    def __init__(self, template_path: str, pack_path: str):
+        super().__init__(template_path)
+        self.pack_path = pack_path
+        with open(pack_path, "rb") as f:
+            self.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.mmap[: len(PACK_MAGIC)] != PACK_MAGIC:
+            raise ValueError(f"{pack_path} is not a cookietemple template pack!")
+        (manifest_size,) = struct.unpack_from(">Q", self.mmap, len(PACK_MAGIC))
+        manifest_start = len(PACK_MAGIC) + 8
+        manifest = json.loads(self.mmap[manifest_start : manifest_start + manifest_size].decode("utf-8"))
+        self.data_start = manifest_start + manifest_size
+        self.tree_hash_value: Tuple[str, bool] = (manifest["tree_hash"], manifest["uses_now"])
+        self.entries: Dict[str, PackEntry] = {}
+        # subdirectories and files of every directory of the template
+        self.tree: Dict[str, Tuple[List[str], List[str]]] = {"": ([], [])}
+        self.dir_modes: Dict[str, int] = manifest.get("dir_modes", {})
+        for directory in manifest["dirs"]:
+            self.tree.setdefault(directory, ([], []))
+            parent, name = posix_split(directory)
+            self.tree.setdefault(parent, ([], []))[0].append(name)
+        for raw_entry in manifest["files"]:
+            entry = PackEntry(**raw_entry)
+            self.entries[entry.path] = entry
+            parent, name = posix_split(entry.path)
+            self.tree[parent][1].append(name)
+        log.debug(f"Opened template pack {pack_path} containing {len(self.entries)} files.")
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def load(template_path: str, pack_path: str) -> "PackSource":
+        """
+        Open a template pack, which is memory mapped only once per process.
+
+        :param template_path: Absolute path to the (possibly removed) template directory
+        :param pack_path: Absolute path to the pack
+        :return: The shared pack source
+        """
+        return PackSource(template_path, pack_path)
+
+    def walk(self, top: str) -> Iterator[Tuple[str, List[str], List[str]]]:
+        pending = [to_posix(top)]
+        while pending:
+            directory = pending.pop()
+            subdirs, files = self.tree[directory]
+            subdirs = list(subdirs)
+            yield os.path.normpath(directory) if directory else ".", subdirs, list(files)
+            pending.extend(posix_join(directory, subdir) for subdir in reversed(subdirs))
+
+    def entry(self, path: str) -> PackEntry:
+        """
+        Look up the manifest entry of a file.
+
+        :param path: Path of the file relative to the template's root
+        :return: The manifest entry of the file
+        """
+        return self.entries[to_posix(path)]
+
+    def read(self, path: str) -> bytes:
+        entry = self.entry(path)
+        start = self.data_start + entry.offset
+        content = self.mmap[start : start + entry.stored_size]
+        return zlib.decompress(content) if entry.compressed else content
+
+    def mode(self, path: str) -> int:
+        return self.entry(path).mode
+
+    def dir_mode(self, path: str) -> Optional[int]:
+        return self.dir_modes.get(to_posix(path))
+
+    def is_binary(self, path: str) -> bool:
+        return not self.entry(path).render
+
+    def find_template(self) -> str:
+        for directory in self.tree[""][0]:
+            if "cookiecutter" in directory and "{{" in directory and "}}" in directory:
+                return directory
+        raise NonTemplatedInputDirException
+
+    def loader(self, template_dir: str) -> BaseLoader:
+        return PackLoader(self, template_dir)
+
+    def tree_hash(self) -> Tuple[str, bool]:
+        return self.tree_hash_value
+
+
+class PackLoader(BaseLoader):
+    """
+    Jinja loader reading the files of a templated directory from a template pack.
+    """
+
+    def __init__(self, pack: PackSource, template_dir: str):
+        self.pack = pack
+        self.template_dir = to_posix(template_dir)
+
+    def get_source(self, environment: Environment, template: str) -> Tuple[str, Optional[str], Callable[[], bool]]:
+        path = posix_join(self.template_dir, template)
+        if path not in self.pack.entries:
+            raise TemplateNotFound(template)
+        # packs never change while they are opened, so loaded templates are always up to date
+        return self.pack.read(path).decode("utf-8"), f"{self.pack.pack_path}/{path}", lambda: True
+
+
+def open_template_source(template_path: str) -> TemplateSource:
+    """
+    Open the files of a template. The template's directory is preferred and its pack is used if the directory does not exist
+    (like in installed packages, which only ship the packs).
+
+    :param template_path: Path to the template directory or to its pack
+    :return: The source of the template's files
+    """
+    template_path = os.path.abspath(template_path)
+    if template_path.endswith(PACK_SUFFIX):
+        return PackSource.load(template_path[: -len(PACK_SUFFIX)], template_path)
+    if not os.path.isdir(template_path) and os.path.isfile(f"{template_path}{PACK_SUFFIX}"):
+        return PackSource.load(template_path, f"{template_path}{PACK_SUFFIX}")
+
+    return DirectorySource(template_path)
+
+
+def write_pack(template_path: str, pack_path: str) -> Tuple[int, int]:
+    """
+    Bundle all files of a template directory into a single pack.
+    Files are compressed individually, so that every file can be read from the pack without decompressing the others.
+
+    :param template_path: Path to the template directory
+    :param pack_path: Path to write the pack to
+    :return: The number of packed files and their total size in bytes
+    """
+    source = DirectorySource(os.path.abspath(template_path))
+    dirs: List[str] = []
+    dir_modes: Dict[str, int] = {}
+    entries: List[PackEntry] = []
+    contents: List[bytes] = []
+    offset = 0
+    # walk in the order the tree hash is calculated in
+    for root, subdirs, files in os.walk(source.template_path):
+        subdirs.sort()
+        rel_root = os.path.relpath(root, source.template_path)
+        for subdir in subdirs:
+            path = os.path.normpath(os.path.join(rel_root, subdir))
+            dirs.append(to_posix(path))
+            dir_modes[to_posix(path)] = source.mode(path)
+        for file in sorted(files):
+            path = os.path.normpath(os.path.join(rel_root, file))
+            content = source.read(path)
+            compressed = zlib.compress(content, 9)
+            stored = compressed if len(compressed) < len(content) else content
+            entries.append(
+                PackEntry(
+                    path=to_posix(path),
+                    offset=offset,
+                    size=len(content),
+                    stored_size=len(stored),
+                    compressed=stored is compressed,
+                    sha256=hashlib.sha256(content).hexdigest(),
+                    mode=source.mode(path),
+                    render=not source.is_binary(path),
+                )
+            )
+            contents.append(stored)
+            offset += len(stored)
+    tree_hash, uses_now = source.tree_hash()
+    manifest = json.dumps(
+        {
+            "tree_hash": tree_hash,
+            "uses_now": uses_now,
+            "dirs": dirs,
+            "dir_modes": dir_modes,
+            "files": [entry.__dict__ for entry in entries],
+        }
+    ).encode("utf-8")
+
+    tmp_pack_path = f"{pack_path}.tmp"
+    with open(tmp_pack_path, "wb") as f:
+        f.write(PACK_MAGIC)
+        f.write(struct.pack(">Q", len(manifest)))
+        f.write(manifest)
+        for content in contents:
+            f.write(content)
+    # never leave a half written pack behind, which would be picked up by the next creation
+    os.replace(tmp_pack_path, pack_path)
+
+    return len(entries), sum(entry.size for entry in entries)
+
+
+def to_posix(path: str) -> str:
+    """
+    Convert a relative path to the form used inside of packs (forward slashes, no leading ./).
+
+    :param path: Relative path
+    :return: The path inside of packs
+    """
+    path = os.path.normpath(path).replace(os.sep, "/")
+    return "" if path == "." else path
+
+
+def posix_split(path: str) -> Tuple[str, str]:
+    """
+    Split a path inside of a pack into its parent directory and its name.
+    """
+    parent, _, name = path.rpartition("/")
+    return parent, name
+
+
+def posix_join(directory: str, name: str) -> str:
+    """
+    Join a directory inside of a pack and a name.
+    """
+    return f"{directory}/{name}" if directory else name
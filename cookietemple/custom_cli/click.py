@@ -9,7 +9,6 @@ from rich import print
 from rich.console import Console
 
 import cookietemple
-from cookietemple.bump_version.bump_version import VersionBumper
 from cookietemple.common.levensthein_dist import most_similar_command
 from cookietemple.common.suggest_similar_commands import MAIN_COMMANDS
 
@@ -83,6 +82,12 @@ class HelpErrorHandling(click.Group):
             formatter.write_text(
                 f"{self.commands.get('upgrade').name}\t\t{self.commands.get('upgrade').get_short_help_str(limit=150)}"
             )
+            formatter.write_text(
+                f"{self.commands.get('templates').name}\t{self.commands.get('templates').get_short_help_str(limit=150)}"
+            )
+            formatter.write_text(
+                f"{self.commands.get('serve').name}\t\t{self.commands.get('serve').get_short_help_str(limit=150)}"
+            )
 
         with formatter.section(HelpErrorHandling.get_rich_value("Commands for cookietemple project")):
             formatter.write_text(
@@ -97,6 +102,9 @@ class HelpErrorHandling(click.Group):
             formatter.write_text(
                 f"{self.commands.get('sync').name}\t\t{self.commands.get('sync').get_short_help_str(limit=150)}"
             )
+            formatter.write_text(
+                f"{self.commands.get('dev-render').name}\t{self.commands.get('dev-render').get_short_help_str(limit=150)}"
+            )
 
         with formatter.section(HelpErrorHandling.get_rich_value("Special commands")):
             formatter.write_text(
@@ -276,6 +284,8 @@ def print_project_version(ctx, param, value) -> None:
     # if context uses resilient parsing (no changes of execution flow) or no flag value is provided, do nothing
     if not value or ctx.resilient_parsing:
         return
+    from cookietemple.bump_version.bump_version import VersionBumper
+
     try:
         print(f"[bold blue]Current project version is [bold green]{VersionBumper(Path.cwd(), False).CURRENT_VERSION}!")
         ctx.exit()
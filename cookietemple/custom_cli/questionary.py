@@ -1,10 +1,13 @@
 import logging
 import sys
-from typing import Dict, List, Optional, Union
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Union
 
 import questionary
 from prompt_toolkit.styles import Style  # type: ignore
 
+from cookietemple.util.profiling import profile_phase
 from cookietemple.util.rich import console
 
 log = logging.getLogger(__name__)
@@ -25,7 +28,23 @@ cookietemple_style = Style(
     ]
 )
 
+# threads without a user to answer prompts (like the workers of cookietemple serve)
+non_interactive = threading.local()
 
+
+@contextmanager
+def no_prompts() -> Iterator[None]:
+    """
+    Fail every prompt of the current thread, which is not answered by a .cookietemple.yml file, instead of waiting for an answer.
+    """
+    non_interactive.enabled = True
+    try:
+        yield
+    finally:
+        non_interactive.enabled = False
+
+
+@profile_phase("prompts")
 def cookietemple_questionary_or_dot_cookietemple(
     function: str,
     question: str,
@@ -57,6 +76,10 @@ def cookietemple_questionary_or_dot_cookietemple(
         )
         return default  # type: ignore
 
+    if getattr(non_interactive, "enabled", False):
+        console.print(f"[bold red]Cannot prompt for '{question}' without a user! Pass all answers instead.")
+        sys.exit(1)
+
     # There is no .cookietemple.yml file aka dot_cookietemple dict passed -> ask for the properties
     answer: Optional[str] = ""
     try:
@@ -1,5 +1,4 @@
 import logging
-import os
 import sys
 from typing import List
 
@@ -10,9 +9,8 @@ from rich.style import Style
 from rich.table import Table
 
 from cookietemple.common.levensthein_dist import most_similar_command
-from cookietemple.common.load_yaml import load_yaml_file
 from cookietemple.common.suggest_similar_commands import load_available_handles
-from cookietemple.util.dict_util import is_nested_dictionary
+from cookietemple.common.template_registry import TemplateEntry, TemplateRegistry
 
 log = logging.getLogger(__name__)
 
@@ -23,8 +21,6 @@ class TemplateInfo:
     """
 
     def __init__(self):
-        self.WD = os.path.dirname(__file__)
-        self.TEMPLATES_PATH = f"{self.WD}/../create/templates"
         self.available_handles = ""
         self.most_sim = []
         self.action = ""
@@ -35,47 +31,23 @@ class TemplateInfo:
 
         :param handle: domain/language/template handle (examples: cli or cli-python)
         """
-        # list of all templates that should be printed according to the passed handle
-        templates_to_print: List[str] = []
-        available_templates = load_yaml_file(f"{self.TEMPLATES_PATH}/available_templates.yml")
-        specifiers = handle.split("-")
-        domain = specifiers[0]
-        template_info: List[str] = []
-
-        # only domain OR language specified
-        if len(specifiers) == 1:
-            log.debug("Only domain or language was specified.")
-            try:
-                template_info = available_templates[domain]
-            except KeyError:
-                self.handle_domain_or_language_only(handle, available_templates)
-        # domain, subdomain, language
-        elif len(specifiers) > 2:
-            log.debug("A domain, subdomain and language was specified.")
-            try:
-                sub_domain = specifiers[1]
-                language = specifiers[2]
-                template_info = available_templates[domain][sub_domain][language]
-            except KeyError:
-                self.handle_non_existing_command(handle, True)
-        # domain, language OR domain, subdomain
-        else:
-            log.debug("A domain and language OR domain and a subdomain was specified.")
-            try:
-                second_specifier = specifiers[1]
-                template_info = available_templates[domain][second_specifier]
-            except KeyError:
+        # handles consist of at most a domain, a subdomain and a language
+        templates = TemplateRegistry.get().find("-".join(handle.split("-")[:3]))
+        if not templates:
+            # only domain OR language specified
+            if len(handle.split("-")) == 1:
+                log.debug("No domain matches the handle. Trying to treat it as language.")
+                self.handle_domain_or_language_only(handle)
+            else:
                 self.handle_non_existing_command(handle, True)
 
-        # Add all templates under template_info to list and output them
-        self.flatten_nested_dict(template_info, templates_to_print)
-        TemplateInfo.output_table(templates_to_print, handle)
+        # Output all templates matching the handle
+        TemplateInfo.output_table(TemplateInfo.info_rows(templates), handle)
 
-    def handle_domain_or_language_only(self, handle: str, available_templates: dict) -> None:
+    def handle_domain_or_language_only(self, handle: str) -> None:
         """
         Try to find a similar domain or treat handle as possible language
         :param handle: The handle inputted by the user
-        :param available_templates: All available templates load from yml file as dict
         """
         # try to find a similar domain
         self.handle_non_existing_command(handle)
@@ -84,14 +56,13 @@ class TemplateInfo:
             self.print_console_output(handle)
 
         # input may be a language so try this
-        templates_flatted: List[str] = []
-        self.flatten_nested_dict(available_templates, templates_flatted)
+        registry = TemplateRegistry.get()
         # load all available languages
-        available_languages = TemplateInfo.load_available_languages(templates_flatted)
+        available_languages = registry.languages
         # if handle exists as language in cookietemple output its available templates and exit with zero status
         if handle in available_languages:
-            templates_to_print_ = [template for template in templates_flatted if handle in template[1]]
-            TemplateInfo.output_table(templates_to_print_, handle)
+            templates_to_print_ = [template for template in registry.templates if handle in template.handle]
+            TemplateInfo.output_table(TemplateInfo.info_rows(templates_to_print_), handle)
 
         # the handle does not match any domain/language; is there a similar language?
         else:
@@ -113,6 +84,25 @@ class TemplateInfo:
                 TemplateInfo.non_existing_handle()
         sys.exit(0)
 
+    @staticmethod
+    def info_rows(templates: List[TemplateEntry]) -> List[List[str]]:
+        """
+        Create the rows of the info table for all given templates.
+
+        :param templates: The templates that should go into the table
+        :return: A row (name, handle, long description, available libraries, version) for every template
+        """
+        return [
+            [
+                template.name,
+                template.handle,
+                template.long_description,
+                template.available_libraries,
+                template.version,
+            ]
+            for template in templates
+        ]
+
     @staticmethod
     def output_table(templates_to_print: list, handle: str) -> None:
         """
@@ -203,40 +193,6 @@ class TemplateInfo:
         )
         sys.exit(0)
 
-    def flatten_nested_dict(self, template_info_, templates_to_print) -> None:
-        """
-        Flatten an arbitrarily deep nested dict and creates a list of list containing all available
-        templates for the specified domain/subdomain and/or language.
-
-        :param template_info_: The dict containing the yaml parsed info for all available templates the user wants to gather some information
-        :param templates_to_print: A list of templates string representations, that will be printed to console
-        """
-        if is_nested_dictionary(template_info_):
-            for templ in template_info_.values():
-                if not is_nested_dictionary(templ):
-                    templates_to_print.append(
-                        [
-                            templ["name"],
-                            templ["handle"],
-                            templ["long description"],
-                            templ["available libraries"],
-                            templ["version"],
-                        ]
-                    )
-                else:
-                    self.flatten_nested_dict(templ, templates_to_print)
-        else:
-            # a single template to append was reached
-            templates_to_print.append(
-                [
-                    template_info_["name"],
-                    template_info_["handle"],
-                    template_info_["long description"],
-                    template_info_["available libraries"],
-                    template_info_["version"],
-                ]
-            )
-
     @staticmethod
     def set_linebreaks(desc: str) -> str:
         """
@@ -261,14 +217,3 @@ class TemplateInfo:
             idx += 1
 
         return desc
-
-    @staticmethod
-    def load_available_languages(ls: list) -> set:
-        """
-        Load all available languages cookietemple supports.
-        NOTE: Assumption that all handles have two or three parts
-
-        :param ls: The flattended list from the available templates dict
-        :return: All available languages as a set
-        """
-        return {ls[1].split("-")[1] if len(ls[1].split("-")) == 2 else ls[1].split("-")[2] for ls in ls}
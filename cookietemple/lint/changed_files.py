@@ -0,0 +1,74 @@
+import logging
+import os
+import sys
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from cookietemple.util.rich import console
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class ChangedFiles:
+    """
+    The files of a project, which changed according to git.
+    """
+
+    # relative to the project directory, including deleted files
+    paths: List[str]
+    # whether files were added, deleted or renamed, which may change the result of the checks for the existence of files
+    added_or_deleted: bool
+
+
+def changed_files(project_dir: str, since: Optional[str] = None, staged: bool = False) -> ChangedFiles:
+    """
+    Ask git for the files of a project, which changed since a commit (including untracked files) or which are staged.
+    The project may be a subdirectory of the git repository.
+
+    :param project_dir: Path to the project directory
+    :param since: Any git reference (like HEAD or main) to compare the working tree with
+    :param staged: Whether to take the staged changes instead
+    :return: The changed files of the project
+    """
+    # GitPython is slow to import and only needed here
+    from git import BadName, GitCommandError, InvalidGitRepositoryError, NoSuchPathError, Repo  # type: ignore
+
+    try:
+        repo = Repo(project_dir, search_parent_directories=True)
+    except (InvalidGitRepositoryError, NoSuchPathError):
+        console.print(f"[bold red]{project_dir} is not part of a git repository!")
+        sys.exit(1)
+    # the changed paths relative to the repository and whether they were added, deleted or renamed
+    changes: Dict[str, bool] = {}
+    try:
+        if staged and not repo.head.is_valid():
+            # nothing was committed yet, so everything staged is new
+            changes = {path: True for path, _ in repo.index.entries}
+        else:
+            diffs = repo.index.diff("HEAD") if staged else repo.commit(since).diff(None)
+            for diff in diffs:
+                for path in [diff.a_path, diff.b_path]:
+                    if path:
+                        changes[path] = (
+                            changes.get(path, False) or diff.new_file or diff.deleted_file or diff.renamed_file
+                        )
+            if not staged:
+                changes.update({path: True for path in repo.untracked_files})
+    except (BadName, GitCommandError, ValueError) as e:
+        log.debug(f"Unable to diff against {since}: {e}")
+        console.print(f"[bold red]Unknown git reference {since}!")
+        sys.exit(1)
+
+    project_dir = os.path.realpath(project_dir)
+    relative_changes = {
+        os.path.relpath(os.path.join(os.path.realpath(repo.working_tree_dir), path), project_dir): added_or_deleted
+        for path, added_or_deleted in changes.items()
+    }
+    # changes outside of the project (e.g. in other projects of the same repository) are ignored
+    project_changes = {
+        path: added_or_deleted for path, added_or_deleted in relative_changes.items() if not path.startswith(os.pardir)
+    }
+    log.debug(f"Changed files of the project: {sorted(project_changes)}")
+
+    return ChangedFiles(sorted(project_changes), any(project_changes.values()))
@@ -0,0 +1,485 @@
+import configparser
+import hashlib
+import json
+import logging
+import mmap
+import os
+import re
+import sys
+import tempfile
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Pattern, Set, Tuple
+
+import cookietemple
+from cookietemple.util.rich import console
+
+log = logging.getLogger(__name__)
+
+# relative to the project directory
+CACHE_DIR = os.path.join(".cookietemple", "cache")
+
+
+class ContentRule(ABC):
+    """
+    A lint check looking for strings in the lines of single files, like left over TODO strings.
+    Lines are only looked at, if they contain one of the literals of the rule. Every rule decides on its own which files to skip.
+    """
+
+    # every finding contains one of these strings
+    LITERALS: List[str] = []
+
+    def __init__(self, check: str):
+        """
+        :param check: The id of the check the findings are reported as (e.g. general-3)
+        """
+        self.check = check
+
+    def ignores_dir(self, path: str) -> bool:
+        """
+        :param path: Path of a directory relative to the project directory
+        :return: Whether no file below the directory has to be scanned
+        """
+        return False
+
+    def ignores(self, path: str) -> bool:
+        """
+        :param path: Path of a file relative to the project directory
+        :return: Whether the file must not be scanned
+        """
+        return False
+
+    def fingerprint(self) -> list:
+        """
+        :return: Everything deciding what the rule finds, which is used to discard cached findings when the rule changes
+        """
+        return [type(self).__name__, self.check, self.LITERALS]
+
+    def confirm(self, line: str) -> bool:
+        """
+        :param line: A line containing one of the literals, decoded as latin1
+        :return: Whether the line is a finding
+        """
+        return True
+
+    @abstractmethod
+    def message(self, file_name: str, line_number: int, line: str) -> str:
+        """
+        :param file_name: Name of the file
+        :param line_number: Number of the line (starting at 1)
+        :param line: The line of the finding, decoded as latin1
+        :return: The message of the finding
+        """
+
+
+class TodoRule(ContentRule):
+    """
+    Find every 'TODO COOKIETEMPLE:' or 'COOKIETEMPLE TODO:' string. Git's files and the files (or directories) named in the
+    .gitignore file of the project are skipped.
+    """
+
+    LITERALS = ["TODO COOKIETEMPLE:", "COOKIETEMPLE TODO:"]
+
+    def __init__(self, project_dir: str):
+        super().__init__("general-3")
+        self.ignored: Set[str] = {".git"}
+        if os.path.isfile(os.path.join(project_dir, ".gitignore")):
+            with open(os.path.join(project_dir, ".gitignore"), encoding="latin1") as file:
+                for line in file:
+                    self.ignored.add(os.path.basename(line.strip().rstrip("/")))
+
+    def ignores_dir(self, path: str) -> bool:
+        return self.ignores(path)
+
+    def fingerprint(self) -> list:
+        return super().fingerprint() + sorted(self.ignored)
+
+    def ignores(self, path: str) -> bool:
+        return any(part in self.ignored for part in path.split(os.sep))
+
+    def message(self, file_name: str, line_number: int, line: str) -> str:
+        line = (
+            line.replace("<!--", "")
+            .replace("-->", "")
+            .replace("# TODO COOKIETEMPLE: ", "")
+            .replace("// TODO COOKIETEMPLE: ", "")
+            .replace("TODO COOKIETEMPLE: ", "")
+            .replace("# COOKIETEMPLE TODO: ", "")
+            .replace("// COOKIETEMPLE TODO: ", "")
+            .replace("COOKIETEMPLE TODO: ", "")
+            .strip()
+        )
+
+        return f"TODO string found in `{file_name}` line {line_number}: {line}"
+
+
+class CookiecutterStringRule(ContentRule):
+    """
+    Find every cookiecutter string left in a file, which is a '{' followed by ' cookiecutter' followed by a '}' on the same line.
+    Compiled Python files are skipped.
+    """
+
+    # TODO We should also add some of the more advanced cookiecutter if statements, raw statements etc
+    LITERALS = [" cookiecutter"]
+
+    def __init__(self):
+        super().__init__("general-4")
+
+    def ignores(self, path: str) -> bool:
+        return path.endswith(".pyc")
+
+    def confirm(self, line: str) -> bool:
+        # matches like {\s?.* cookiecutter.*\s?}, but in linear time: greedy wildcards backtrack on long (minified) lines
+        opening = line.find("{")
+        literal = line.find(" cookiecutter", opening + 1) if opening != -1 else -1
+
+        return literal != -1 and line.find("}", literal + len(" cookiecutter")) != -1
+
+    def message(self, file_name: str, line_number: int, line: str) -> str:
+        return f"Cookiecutter string found in '{file_name}' line {line_number}: {line[:50 - len(file_name)]}.."
+
+
+@lru_cache(maxsize=None)
+def literals_pattern(literals: Tuple[str, ...]) -> Pattern[bytes]:
+    """
+    Compile the literals of some rules into a single pattern, which finds all of them in one pass over a file.
+
+    :param literals: All literals of the rules
+    :return: A pattern matching any of the literals
+    """
+    return re.compile(
+        b"|".join(re.escape(literal.encode("latin1")) for literal in sorted(set(literals), key=len)[::-1])
+    )
+
+
+# line breaks of universal newlines, which Python uses when reading text files
+LINE_BREAK = re.compile(rb"\r\n?|\n")
+
+
+@dataclass
+class ScanStatistics:
+    """
+    Counts the scanned files and names the skipped ones.
+    """
+
+    scanned: int = 0
+    # scanned files, whose findings were taken from the cache
+    cached: int = 0
+    binary: List[str] = field(default_factory=list)
+    skipped_extension: List[str] = field(default_factory=list)
+    too_large: List[str] = field(default_factory=list)
+
+    def merge(self, other: "ScanStatistics") -> None:
+        """
+        Add the statistics of another shard.
+
+        :param other: The statistics of the other shard
+        """
+        self.scanned += other.scanned
+        self.cached += other.cached
+        self.binary.extend(other.binary)
+        self.skipped_extension.extend(other.skipped_extension)
+        self.too_large.extend(other.too_large)
+
+
+class ContentScanner:
+    """
+    Run all content rules in a single walk over the project. Every file is mapped into memory once and searched for the
+    literals of all rules in a single pass. Only lines containing a literal are decoded and confirmed by the rules.
+    The files are split into shards, which are scanned on a pool of workers.
+    Files with a skipped extension, files larger than the maximum size and binary files are not scanned.
+    Both limits can be configured in the lint section of the cookietemple.cfg file of the project.
+    """
+
+    # reading is mostly waiting for the disk, so there may be more workers than cores
+    MAX_WORKERS = 8
+    # files containing a null byte in their first block are binary files
+    SNIFF_SIZE = 8192
+    SKIP_EXTENSIONS = (
+        [".eps", ".gif", ".ico", ".jpeg", ".jpg", ".pdf", ".png", ".ps"]  # images and documents
+        + [".eot", ".otf", ".ttf", ".woff", ".woff2"]  # fonts
+        + [".class", ".gz", ".jar", ".pyc", ".so", ".zip"]  # compiled files and archives
+    )
+    # in bytes
+    MAX_FILE_SIZE = 1024 * 1024
+
+    def __init__(
+        self,
+        project_dir: str,
+        rules: List[ContentRule],
+        skip_extensions: Optional[List[str]] = None,
+        max_file_size: Optional[int] = None,
+        cache: bool = False,
+    ):
+        """
+        :param project_dir: Path to the project directory
+        :param rules: The rules to scan the files with
+        :param skip_extensions: Extensions of files never to scan
+        :param max_file_size: Files larger than this (in bytes) are not scanned
+        :param cache: Whether to cache the findings per file in the .cookietemple/cache directory of the project
+        """
+        self.project_dir = project_dir
+        self.rules = rules
+        self.skip_extensions = tuple(
+            extension.lower() for extension in (skip_extensions or ContentScanner.SKIP_EXTENSIONS)
+        )
+        self.max_file_size = max_file_size or ContentScanner.MAX_FILE_SIZE
+        self.statistics = ScanStatistics()
+        self.cache = ScanCache(os.path.join(project_dir, CACHE_DIR), self.fingerprint()) if cache else None
+
+    @classmethod
+    def configured(cls, project_dir: str, rules: List[ContentRule], cache: bool = False) -> "ContentScanner":
+        """
+        Create a scanner using the skipped extensions (skip_extensions, separated by commas) and the maximum file size in bytes
+        (max_file_size) of the lint section of the cookietemple.cfg file of the project, if set.
+
+        :param project_dir: Path to the project directory
+        :param rules: The rules to scan the files with
+        :param cache: Whether to cache the findings per file
+        :return: The configured scanner
+        """
+        parser = configparser.ConfigParser()
+        parser.read(os.path.join(project_dir, "cookietemple.cfg"))
+        skip_extensions = parser.get("lint", "skip_extensions", fallback="")
+        try:
+            max_file_size = parser.getint("lint", "max_file_size", fallback=0)
+        except ValueError:
+            console.print("[bold red]max_file_size of the lint section in cookietemple.cfg must be a number of bytes!")
+            sys.exit(1)
+
+        return cls(
+            project_dir,
+            rules,
+            [extension.strip() for extension in skip_extensions.split(",") if extension.strip()],
+            max_file_size,
+            cache,
+        )
+
+    def scan(self, files: Optional[Iterable[str]] = None) -> Dict[str, List[str]]:
+        """
+        Scan the project or some of its files. Files unchanged since they were cached are not scanned again.
+
+        :param files: Paths of the files to scan relative to the project directory. All files of the project if not set.
+        :return: The messages of all findings per check, ordered like the files. The statistics of the scan are kept by the scanner.
+        """
+        paths = list(self.walk() if files is None else files)
+        shard_size = -(-len(paths) // ContentScanner.MAX_WORKERS) or 1
+        shards = [paths[start : start + shard_size] for start in range(0, len(paths), shard_size)]
+        findings: Dict[str, List[str]] = {rule.check: [] for rule in self.rules}
+        entries: Dict[str, dict] = {}
+        with ThreadPoolExecutor(max_workers=ContentScanner.MAX_WORKERS, thread_name_prefix="scan") as executor:
+            for shard_entries, shard_statistics in executor.map(self.scan_shard, shards):
+                for path, entry in shard_entries.items():
+                    for check, message in entry["findings"]:
+                        findings[check].append(message)
+                entries.update(shard_entries)
+                self.statistics.merge(shard_statistics)
+        log.debug(f"Scanned {self.statistics.scanned} of {len(paths)} files with {len(self.rules)} content rules.")
+        if self.cache:
+            self.cache.save(entries, complete=files is None)
+
+        return findings
+
+    def walk(self) -> Iterable[str]:
+        """
+        Walk the project once, skipping the cache and directories ignored by all rules.
+
+        :return: Paths of all files relative to the project directory
+        """
+        for root, dirs, files in os.walk(self.project_dir):
+            relative_root = os.path.relpath(root, self.project_dir)
+            relative_root = "" if relative_root == os.curdir else relative_root
+            dirs[:] = [
+                directory
+                for directory in dirs
+                if os.path.join(relative_root, directory) != CACHE_DIR
+                and not all(rule.ignores_dir(os.path.join(relative_root, directory)) for rule in self.rules)
+            ]
+            for file in files:
+                yield os.path.join(relative_root, file)
+
+    def scan_shard(self, paths: List[str]) -> Tuple[Dict[str, dict], ScanStatistics]:
+        """
+        Scan the files of a shard, each with all rules not ignoring it.
+
+        :param paths: Paths of the files relative to the project directory
+        :return: The cache entries of all files, which were not skipped by extension, and the statistics of the shard
+        """
+        entries: Dict[str, dict] = {}
+        statistics = ScanStatistics()
+        for path in paths:
+            rules = [rule for rule in self.rules if not rule.ignores(path)]
+            if not rules or not os.path.isfile(os.path.join(self.project_dir, path)):
+                continue
+            if path.lower().endswith(self.skip_extensions):
+                statistics.skipped_extension.append(path)
+                continue
+            entry, cached = self.scan_file(path, rules)
+            entries[path] = entry
+            if entry["skipped"] == "binary":
+                statistics.binary.append(path)
+            elif entry["skipped"] == "too large":
+                statistics.too_large.append(path)
+            else:
+                statistics.scanned += 1
+                statistics.cached += cached
+
+        return entries, statistics
+
+    def scan_file(self, path: str, rules: List[ContentRule]) -> Tuple[dict, bool]:
+        """
+        Scan a file or take its findings from the cache, if its modification time and size or its content did not change.
+
+        :param path: Path of the file relative to the project directory
+        :param rules: The rules to scan the file with
+        :return: The cache entry of the file and whether it was taken from the cache
+        """
+        stat = os.stat(os.path.join(self.project_dir, path))
+        cached = self.cache.get(path) if self.cache else None
+        if cached and self.cache.unchanged(cached, stat):  # type: ignore
+            return cached, True
+        entry: dict = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "hash": "", "skipped": "", "findings": []}
+        if stat.st_size > self.max_file_size:
+            entry["skipped"] = "too large"
+            return entry, False
+        if stat.st_size == 0:
+            # empty files cannot be mapped
+            return entry, False
+        with open(os.path.join(self.project_dir, path), "rb") as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                if self.cache:
+                    entry["hash"] = hashlib.sha256(content).hexdigest()
+                    if cached and cached["hash"] == entry["hash"]:
+                        # only touched
+                        return {**cached, "mtime_ns": stat.st_mtime_ns}, True
+                if b"\0" in content[: ContentScanner.SNIFF_SIZE]:
+                    entry["skipped"] = "binary"
+                else:
+                    entry["findings"] = self.find(content, rules, os.path.basename(path))
+
+        return entry, False
+
+    def find(self, content: mmap.mmap, rules: List[ContentRule], file_name: str) -> List[Tuple[str, str]]:
+        """
+        Search the content of a file for the literals of all rules and let the rules confirm the lines containing any of them.
+        Line numbers are only counted up to the last of these lines.
+
+        :param content: The content of the file
+        :param rules: The rules to scan the file with
+        :param file_name: Name of the file
+        :return: The check and message of all findings in the order of the lines
+        """
+        findings: List[Tuple[str, str]] = []
+        pattern = literals_pattern(tuple(literal for rule in rules for literal in rule.LITERALS))
+        line_number, counted = 1, 0
+        hit = pattern.search(content)
+        while hit:
+            # only search back to the line of the previous hit, so that files with many hits are not searched quadratically
+            line_start = max(
+                content.rfind(b"\n", counted, hit.start()) + 1, content.rfind(b"\r", counted, hit.start()) + 1, counted
+            )
+            line_break = LINE_BREAK.search(content, hit.end())
+            line_end = line_break.start() if line_break else len(content)
+            line_number += len(LINE_BREAK.findall(content, counted, line_start))
+            counted = line_start
+            # latin1 decodes any bytes
+            line = content[line_start:line_end].decode("latin1")
+            for rule in rules:
+                if any(literal in line for literal in rule.LITERALS) and rule.confirm(line):
+                    findings.append((rule.check, rule.message(file_name, line_number, line)))
+            hit = pattern.search(content, line_end)
+
+        return findings
+
+    def fingerprint(self) -> str:
+        """
+        :return: A hash of the rules and the limits of the scanner, which changes whenever they would find something else
+        """
+        return hashlib.sha256(
+            json.dumps(
+                [[rule.fingerprint() for rule in self.rules], sorted(self.skip_extensions), self.max_file_size]
+            ).encode("utf-8")
+        ).hexdigest()
+
+
+class ScanCache:
+    """
+    Remember the findings of every scanned file together with its modification time, size and content hash.
+    The cache is discarded, when cookietemple was updated or the rules or the limits of the scanner changed.
+    """
+
+    CACHE_FILE = "content_scan.json"
+    # files modified this short before the last scan may have been modified again without changing their modification time
+    # (depending on the resolution of the file system), so their content is compared as well
+    RACY_NS = 2 * 10**9
+
+    def __init__(self, cache_dir: str, fingerprint: str):
+        """
+        :param cache_dir: Directory of the cache
+        :param fingerprint: Fingerprint of the rules and the limits of the scanner
+        """
+        self.cache_dir = cache_dir
+        self.fingerprint = fingerprint
+        self.files: Dict[str, dict] = {}
+        self.scanned_ns = 0
+        self.started_ns = time.time_ns()
+        try:
+            with open(os.path.join(cache_dir, ScanCache.CACHE_FILE)) as f:
+                cache = json.load(f)
+            if cache["version"] == cookietemple.__version__ and cache["fingerprint"] == fingerprint:
+                self.files, self.scanned_ns = cache["files"], cache["scanned_ns"]
+            else:
+                log.debug("Discarding the outdated content scan cache.")
+        except (OSError, ValueError, KeyError):
+            pass
+
+    def get(self, path: str) -> Optional[dict]:
+        """
+        :param path: Path of a file relative to the project directory
+        :return: The cached entry of the file, if any
+        """
+        return self.files.get(path)
+
+    def unchanged(self, cached: dict, stat: os.stat_result) -> bool:
+        """
+        :param cached: The cached entry of a file
+        :param stat: The current status of the file
+        :return: Whether the file did not change since it was cached, judging by its modification time and size
+        """
+        return (
+            cached["mtime_ns"] == stat.st_mtime_ns
+            and cached["size"] == stat.st_size
+            and stat.st_mtime_ns < self.scanned_ns - ScanCache.RACY_NS
+        )
+
+    def save(self, entries: Dict[str, dict], complete: bool) -> None:
+        """
+        Atomically replace the cache. Failing to write the cache is ignored.
+
+        :param entries: The entries of all scanned files
+        :param complete: Whether all files of the project were scanned. Entries of files not scanned are dropped then.
+        """
+        self.files = entries if complete else {**self.files, **entries}
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            gitignore = os.path.join(self.cache_dir, ".gitignore")
+            if not os.path.exists(gitignore):
+                with open(gitignore, "w") as f:
+                    f.write("# created by cookietemple lint\n*\n")
+            fd, tmp_file = tempfile.mkstemp(prefix=".content_scan_", dir=self.cache_dir)
+            with os.fdopen(fd, "w") as f:
+                json.dump(
+                    {
+                        "version": cookietemple.__version__,
+                        "fingerprint": self.fingerprint,
+                        "scanned_ns": self.started_ns,
+                        "files": self.files,
+                    },
+                    f,
+                )
+            os.replace(tmp_file, os.path.join(self.cache_dir, ScanCache.CACHE_FILE))
+        except OSError as e:
+            log.debug(f"Unable to write the content scan cache: {e}")
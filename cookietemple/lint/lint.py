@@ -5,24 +5,40 @@ from typing import Any, Optional, Union
 
 from ruamel.yaml import YAML
 
+from cookietemple.lint.changed_files import changed_files
 from cookietemple.lint.domains.cli import CliJavaLint, CliPythonLint
 from cookietemple.lint.domains.gui import GuiJavaLint
 from cookietemple.lint.domains.lib import LibCppLint
 from cookietemple.lint.domains.pub import PubLatexLint
 from cookietemple.lint.domains.web import WebWebsitePythonLint
 from cookietemple.lint.template_linter import TemplateLinter
+from cookietemple.util.profiling import profile_phase
 from cookietemple.util.rich import console
 
 log = logging.getLogger(__name__)
 
 
-def lint_project(project_dir: str) -> Optional[TemplateLinter]:
+@profile_phase("lint")
+def lint_project(
+    project_dir: str,
+    exit_on_failure: bool = True,
+    jobs: int = 1,
+    cache: bool = False,
+    since: Optional[str] = None,
+    staged: bool = False,
+) -> Optional[TemplateLinter]:
     """
     Verifies the integrity of a project to best coding and practices.
     Runs a set of general linting functions, which all templates share and afterwards runs template specific linting functions.
     All results are collected and presented to the user.
 
     :param project_dir: The path to the .cookietemple.yml file.
+    :param exit_on_failure: Whether to exit with a non-zero error code if any check failed or to return the linter instead
+    :param jobs: Number of checks to run in parallel. With more than one job general and template specific checks overlap.
+    :param cache: Whether to cache the findings of the content checks per file in the .cookietemple/cache directory of the project
+    :param since: Only lint the files changed since this git reference (like HEAD or main), including untracked files
+    :param staged: Only lint the files staged in git
+    :return: The linter holding the results of all checks
     """
     # Detect which template the project is based on
     template_handle = get_template_handle(project_dir)
@@ -51,18 +67,34 @@ def lint_project(project_dir: str) -> Optional[TemplateLinter]:
             disable_check_files = True
         else:
             disable_check_files = False
-        # Run non project specific linting
-        log.debug("Running general linting.")
-        console.print("[bold blue]Running general linting")
-        lint_obj.lint_project(
-            super(lint_obj.__class__, lint_obj), custom_check_files=disable_check_files, is_subclass_calling=False
-        )
-
-        # Run the project specific linting
-        log.debug(f"Running linting of {template_handle}")
-        console.print(f"[bold blue]Running {template_handle} linting")
-
-        lint_obj.lint()  # type: ignore
+        lint_obj.jobs = jobs
+        lint_obj.use_cache = cache
+        if since or staged:
+            lint_obj.changed_files = changed_files(project_dir, since, staged)
+            console.print(f"[bold blue]Linting {len(lint_obj.changed_files.paths)} changed files")
+        if jobs > 1:
+            # the checks are independent of each other, so the general and the project specific ones are run at once
+            log.debug(f"Running general and {template_handle} linting with {jobs} jobs.")
+            console.print(f"[bold blue]Running general and {template_handle} linting")
+            lint_obj.lint_project(
+                super(lint_obj.__class__, lint_obj),
+                custom_check_files=disable_check_files,
+                is_subclass_calling=False,
+                with_specific_checks=True,
+            )
+        else:
+            # Run non project specific linting
+            log.debug("Running general linting.")
+            console.print("[bold blue]Running general linting")
+            lint_obj.lint_project(
+                super(lint_obj.__class__, lint_obj), custom_check_files=disable_check_files, is_subclass_calling=False
+            )
+
+            # Run the project specific linting
+            log.debug(f"Running linting of {template_handle}")
+            console.print(f"[bold blue]Running {template_handle} linting")
+
+            lint_obj.lint()  # type: ignore
     except AssertionError as e:
         console.print(f"[bold red]Critical error: {e}")
         console.print("[bold red] Stopping tests...")
@@ -72,11 +104,11 @@ def lint_project(project_dir: str) -> Optional[TemplateLinter]:
     lint_obj.print_results()
 
     # Exit code
-    if len(lint_obj.failed) > 0:
+    if len(lint_obj.failed) > 0 and exit_on_failure:
         console.print(f"[bold red] {len(lint_obj.failed)} tests failed! Exiting with non-zero error code.")
         sys.exit(1)
 
-    return None
+    return lint_obj
 
 
 def get_template_handle(dot_cookietemple_path: str = ".cookietemple.yml") -> str:
@@ -3,16 +3,29 @@ import logging
 import os
 import re
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple
 
 import rich.markdown
 import rich.panel
 import rich.progress
 
+from cookietemple.lint.changed_files import ChangedFiles
+from cookietemple.lint.content_scanner import (
+    ContentRule,
+    ContentScanner,
+    CookiecutterStringRule,
+    ScanStatistics,
+    TodoRule,
+)
 from cookietemple.util.dir_util import pf
 from cookietemple.util.rich import console
 
 log = logging.getLogger(__name__)
 
+PROGRESS_LOCK = threading.Lock()
+
 
 class TemplateLinter:
     """Object to hold linting information and results.
@@ -24,15 +37,55 @@ class TemplateLinter:
         warned (list): A list of tuples of the form: `(<warned no>, <reason>)`
     """
 
+    # the checks inspecting the content of single files
+    CONTENT_CHECKS = ["check_cookietemple_todos", "check_no_cookiecutter_strings"]
+    # files (relative to the project directory) deciding the results of checks inspecting specific files
+    CHECK_FILES = {
+        "check_docker": ["Dockerfile"],
+        "lint_cookietemple_config": ["cookietemple.cfg"],
+        "check_sync_section": ["cookietemple.cfg"],
+    }
+
     def __init__(self, path="."):
         self.path = path
         self.files = []
-        self.passed = []
-        self.warned = []
-        self.failed = []
+        self._passed = []
+        self._warned = []
+        self._failed = []
+        # number of checks run in parallel
+        self.jobs = 1
+        # whether to cache the findings of the content checks per file
+        self.use_cache = False
+        # only lint these files, if set
+        self.changed_files: Optional[ChangedFiles] = None
+        # checks skipped, since none of the changed files affects their results
+        self.skipped_checks: List[str] = []
+        # the results of the check running in the current thread, if checks run in parallel
+        self._check_results = threading.local()
+        # findings of the content rules, which are scanned in one go for all content checks
+        self.content_findings: Optional[Dict[str, List[str]]] = None
+        self.scan_statistics: Optional[ScanStatistics] = None
+        self._scan_lock = threading.Lock()
+
+    @property
+    def passed(self) -> list:
+        return getattr(self._check_results, "passed", self._passed)
+
+    @property
+    def warned(self) -> list:
+        return getattr(self._check_results, "warned", self._warned)
+
+    @property
+    def failed(self) -> list:
+        return getattr(self._check_results, "failed", self._failed)
 
     def lint_project(
-        self, calling_class, check_functions: list = None, custom_check_files: bool = False, is_subclass_calling=True
+        self,
+        calling_class,
+        check_functions: list = None,
+        custom_check_files: bool = False,
+        is_subclass_calling=True,
+        with_specific_checks: bool = False,
     ) -> None:
         """Main linting function.
         Takes the template directory as the primary input and iterates through
@@ -40,11 +93,13 @@ class TemplateLinter:
         and returns summary at completion. Raises an exception if there is a
         critical error that makes the rest of the tests pointless (eg. no
         project script). Results from this function are printed by the main script.
+        With more than one job the checks run in parallel, but their results are collected in the order of the checks.
 
         :param calling_class: The class that calls the function -> used to get the class methods, which are the linting methods
         :param check_functions: List of functions of the calling class that should be checked. If not set, the default TemplateLinter check functions are called
         :param custom_check_files: Set to true if TemplateLinter check_files_exist should not be run
         :param is_subclass_calling: Indicates whether a domain specific linter calls the linting or not
+        :param with_specific_checks: Whether to run the template specific checks together with the general checks
         """
         # Called on its own, so not from a subclass -> run general linting
         if check_functions is None:
@@ -55,30 +110,108 @@ class TemplateLinter:
                 if (callable(getattr(TemplateLinter, func)) and not func.startswith("_"))
             ]
             # Remove internal functions
-            check_functions = list(
-                set(check_functions).difference({"lint_project", "print_results", "check_version_match"})
+            check_functions = sorted(
+                set(check_functions).difference({"lint_project", "print_results", "check_version_match", "lint_files"})
             )
             log.debug(f"Linting functions of general linting are:\n {check_functions}")
         # Some templates (e.g. latex based) do not adhere to the common programming based templates and therefore do not need to check for e.g. docs
         if custom_check_files:
             check_functions.remove("check_files_exist")
+        checks = [(calling_class, fun_name) for fun_name in check_functions]
+        if with_specific_checks:
+            checks += [(self, fun_name) for fun_name in self.methods]  # type: ignore
+        if self.changed_files is not None:
+            self.skipped_checks += [fun_name for _, fun_name in checks if not self._is_affected(fun_name)]
+            checks = [(calling, fun_name) for calling, fun_name in checks if fun_name not in self.skipped_checks]
 
         progress = rich.progress.Progress(
             "[bold green]{task.description}",
             rich.progress.BarColumn(bar_width=None),
             "[bold yellow]{task.completed} of {task.total}[reset] [bold green]{task.fields[func_name]}",
         )
-        with progress:
-            lint_progress = progress.add_task(
-                "Running lint checks", total=len(check_functions), func_name=check_functions
-            )
-            for fun_name in check_functions:
-                log.debug(f"Running linting function: {fun_name}")
-                progress.update(lint_progress, advance=1, func_name=fun_name)
-                if fun_name == "check_files_exist":
-                    getattr(calling_class, fun_name)(is_subclass_calling)
-                else:
-                    getattr(calling_class, fun_name)()
+        # rich supports only a single live display per console, so projects linted in parallel threads take turns
+        with PROGRESS_LOCK, progress:
+            lint_progress = progress.add_task("Running lint checks", total=len(checks), func_name=check_functions)
+            if self.jobs <= 1:
+                for calling, fun_name in checks:
+                    progress.update(lint_progress, advance=1, func_name=fun_name)
+                    self._run_check(calling, fun_name, is_subclass_calling)
+                return
+            with ThreadPoolExecutor(max_workers=self.jobs, thread_name_prefix="lint") as executor:
+                futures = {
+                    executor.submit(self._run_check_collecting, calling, fun_name, is_subclass_calling): fun_name
+                    for calling, fun_name in checks
+                }
+                for future in as_completed(futures):
+                    progress.update(lint_progress, advance=1, func_name=futures[future])
+            # merge in the order of the checks, no matter which finished first. Raises the exceptions of failed checks.
+            for future in futures:
+                passed, warned, failed = future.result()
+                self._passed.extend(passed)
+                self._warned.extend(warned)
+                self._failed.extend(failed)
+
+    def _is_affected(self, fun_name: str) -> bool:
+        """
+        Decide whether the changed files may change the result of a check.
+        The content checks only scan the changed files. The checks for the existence of files (named *files_exist) are affected
+        by added, deleted or renamed files. Other checks are affected by changes of their CHECK_FILES. Unknown checks always run.
+
+        :param fun_name: Name of the check function
+        :return: Whether the check has to run
+        """
+        if fun_name in TemplateLinter.CONTENT_CHECKS:
+            return True
+        if fun_name.endswith("files_exist"):
+            return self.changed_files.added_or_deleted  # type: ignore
+        if fun_name == "check_version_consistent":
+            check_files = ["cookietemple.cfg"] + self._version_files()
+        elif fun_name in TemplateLinter.CHECK_FILES:
+            check_files = TemplateLinter.CHECK_FILES[fun_name]
+        else:
+            return True
+
+        return any(os.path.normpath(file) in self.changed_files.paths for file in check_files)  # type: ignore
+
+    def _version_files(self) -> List[str]:
+        """
+        :return: Paths of all files, whose versions are checked for consistency, relative to the project directory
+        """
+        parser = configparser.ConfigParser()
+        parser.read(f"{self.path}/cookietemple.cfg")
+        sections = ["bumpversion_files_whitelisted", "bumpversion_files_blacklisted"]
+
+        return [path for section in sections if parser.has_section(section) for _file, path in parser.items(section)]
+
+    def _run_check(self, calling_class, fun_name: str, is_subclass_calling: bool) -> None:
+        """
+        Run a single check.
+
+        :param calling_class: The class (or super proxy) providing the check
+        :param fun_name: Name of the check function
+        :param is_subclass_calling: Indicates whether a domain specific linter calls the linting or not
+        """
+        log.debug(f"Running linting function: {fun_name}")
+        if fun_name == "check_files_exist":
+            getattr(calling_class, fun_name)(is_subclass_calling)
+        else:
+            getattr(calling_class, fun_name)()
+
+    def _run_check_collecting(self, calling_class, fun_name: str, is_subclass_calling: bool) -> Tuple[list, list, list]:
+        """
+        Run a single check in a worker thread, collecting its results separately from the results of all other checks.
+
+        :param calling_class: The class (or super proxy) providing the check
+        :param fun_name: Name of the check function
+        :param is_subclass_calling: Indicates whether a domain specific linter calls the linting or not
+        :return: The passed, warned and failed results of the check
+        """
+        self._check_results.passed, self._check_results.warned, self._check_results.failed = [], [], []
+        try:
+            self._run_check(calling_class, fun_name, is_subclass_calling)
+            return self._check_results.passed, self._check_results.warned, self._check_results.failed
+        finally:
+            del self._check_results.passed, self._check_results.warned, self._check_results.failed
 
     def check_files_exist(self, is_subclass_calling=True):
         """Checks a given project directory for required files.
@@ -172,52 +305,47 @@ class TemplateLinter:
         """
         Go through all template files looking for the string 'TODO COOKIETEMPLE:' or 'COOKIETEMPLE TODO:'
         """
-        ignore = [".git"]
-        if os.path.isfile(os.path.join(self.path, ".gitignore")):
-            with open(os.path.join(self.path, ".gitignore"), encoding="latin1") as file:
-                for line in file:
-                    ignore.append(os.path.basename(line.strip().rstrip("/")))
-        for root, dirs, files in os.walk(self.path):
-            # Ignore files
-            for ignore_file in ignore:
-                if ignore_file in dirs:
-                    dirs.remove(ignore_file)
-                if ignore_file in files:
-                    files.remove(ignore_file)
-            for fname in files:
-                with open(os.path.join(root, fname), encoding="latin1") as file:
-                    for line in file:
-                        if any(todostring in line for todostring in ["TODO COOKIETEMPLE:", "COOKIETEMPLE TODO:"]):
-                            line = (
-                                line.replace("<!--", "")
-                                .replace("-->", "")
-                                .replace("# TODO COOKIETEMPLE: ", "")
-                                .replace("// TODO COOKIETEMPLE: ", "")
-                                .replace("TODO COOKIETEMPLE: ", "")
-                                .replace("# COOKIETEMPLE TODO: ", "")
-                                .replace("// COOKIETEMPLE TODO: ", "")
-                                .replace("COOKIETEMPLE TODO: ", "")
-                                .strip()
-                            )
-                            self.warned.append(
-                                ("general-3", f"TODO string found in {self._wrap_quotes(fname)}: {line}")
-                            )
+        self.warned.extend(("general-3", message) for message in self._scan_content()["general-3"])
 
     def check_no_cookiecutter_strings(self) -> None:
         """
         Verifies that no cookiecutter strings are in any of the files
         """
-        for root, _dirs, files in os.walk(self.path):
-            for fname in files:
-                with open(os.path.join(root, fname), encoding="latin1") as file:
-                    if file.name.endswith(".pyc"):
-                        continue
-                    for line in file:
-                        # TODO We should also add some of the more advanced cookiecutter if statements, raw statements etc
-                        regex = re.compile(r"{\s?.* cookiecutter.*\s?}")  # noqa W605
-                        if regex.search(line):
-                            line = f"{line[:50 - len(fname)]}.."
-                            self.warned.append(("general-4", f"Cookiecutter string found in '{fname}': {line}"))
+        self.warned.extend(("general-4", message) for message in self._scan_content()["general-4"])
+
+    def lint_files(self, files: List[str]) -> None:
+        """
+        Run only the checks inspecting the content of single files (TODO and cookiecutter strings) on some files of the project.
+        Used to lint only the files, which changed since the whole project was linted.
+
+        :param files: Paths of the files relative to the project directory
+        """
+        scanner = ContentScanner.configured(self.path, self._content_rules())
+        findings = scanner.scan(files)
+        self.scan_statistics = scanner.statistics
+        for check, messages in findings.items():
+            self.warned.extend((check, message) for message in messages)
+
+    def _content_rules(self) -> List[ContentRule]:
+        """
+        :return: All rules inspecting the content of single files
+        """
+        return [TodoRule(self.path), CookiecutterStringRule()]
+
+    def _scan_content(self) -> Dict[str, List[str]]:
+        """
+        Scan all files of the project with all content rules on the first call. Later calls return the same findings.
+
+        :return: The messages of all findings per check
+        """
+        # both content checks may run in parallel, but only one of them scans
+        with self._scan_lock:
+            if self.content_findings is None:
+                scanner = ContentScanner.configured(self.path, self._content_rules(), self.use_cache)
+                self.content_findings = scanner.scan(self.changed_files.paths if self.changed_files else None)
+                self.scan_statistics = scanner.statistics
+
+        return self.content_findings
 
     def check_version_consistent(self) -> None:
         """
@@ -229,14 +357,11 @@ class TemplateLinter:
 
         try:
             current_version = parser.get("bumpversion", "current_version")
-            cwd = os.getcwd()
-            os.chdir(self.path)
 
             # check if the version matches current version in each listed file (depending on whitelisted or blacklisted)
             for section in sections:
                 for _file, path in parser.items(section):
                     self.check_version_match(path, current_version, section)
-            os.chdir(cwd)
             # Pass message if there weren't any inconsistencies within the version numbers
             if not any("general-5" in tup[0] for tup in self.failed):
                 self.passed.append(("general-5", "Versions were consistent over all files"))
@@ -248,11 +373,11 @@ class TemplateLinter:
     def check_version_match(self, path: str, version: str, section: str) -> None:
         """
         Check if the versions in a file are consistent with the current version in the cookietemple.cfg
-        :param path: The current file-path to check
+        :param path: The current file-path to check (relative to the project directory)
         :param version: The current version of the project specified in the cookietemple.cfg file
         :param section: The current section (blacklisted or whitelisted files)
         """
-        with open(path, encoding="utf-8") as file:
+        with open(os.path.join(self.path, path), encoding="utf-8") as file:
             for line in file:
                 # if a tag is found and (depending on whether it is a white or blacklisted file) check if the versions are matching
                 if (
@@ -308,6 +433,32 @@ class TemplateLinter:
             console.print()
             console.rule("[bold red][[\u2717]] Test Failures", style="red")
             console.print(rich.panel.Panel(format_result(self.failed), style="red"), overflow="ellipsis")
+        if self.scan_statistics:
+            self._print_scan_statistics(self.scan_statistics)
+        if self.skipped_checks:
+            console.print(
+                f"[bold blue]Skipped {len(self.skipped_checks)} checks not affected by the changed files: "
+                f"{', '.join(self.skipped_checks)}",
+                highlight=False,
+            )
+
+    def _print_scan_statistics(self, statistics: ScanStatistics) -> None:
+        """
+        Print how many files were scanned for TODO and cookiecutter strings and which files were skipped.
+
+        :param statistics: The statistics of the scan
+        """
+        console.print()
+        console.print(
+            f"[bold blue]Scanned {statistics.scanned} files ({statistics.cached} unchanged files from the cache) "
+            "for TODO and cookiecutter strings. Skipped "
+            f"{len(statistics.binary)} binary files, {len(statistics.skipped_extension)} files by extension and "
+            f"{len(statistics.too_large)} files larger than the maximum file size.",
+            highlight=False,
+        )
+        for reason, files in [("binary", statistics.binary), ("too large", statistics.too_large)]:
+            for file in files:
+                console.print(f"[blue]    skipped {reason}: {file}", highlight=False)
 
     def _wrap_quotes(self, files):
         if not isinstance(files, list):
@@ -397,7 +548,8 @@ class GetLintingFunctionsMeta(type):
             for func in dir(TemplateLinter)
             if (callable(getattr(TemplateLinter, func)) and not func.startswith("__"))
         ]
-        cls_only_funcs = list(set(specific_linter_function_names) - set(general_linter_function_names))
+        # sorted, since the results are reported in the order of the checks
+        cls_only_funcs = sorted(set(specific_linter_function_names) - set(general_linter_function_names))
         cls_only_funcs.remove(
             "lint"
         )  # remove 'lint', since we only want the newly defined methods and not the method itself
@@ -0,0 +1,385 @@
+import io
+import json
+import logging
+import os
+import socketserver
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import asdict
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, Union
+
+from rich.text import Text
+
+import cookietemple
+from cookietemple.bump_version.bump_version import VersionBumper
+from cookietemple.common.template_registry import TemplateRegistry
+from cookietemple.create.create import choose_domain
+from cookietemple.custom_cli.questionary import no_prompts
+from cookietemple.info.info import TemplateInfo
+from cookietemple.lint.lint import lint_project
+from cookietemple.template_tools.compile import TemplateCompiler
+from cookietemple.util.rich import console
+
+log = logging.getLogger(__name__)
+
+
+class RequestError(Exception):
+    """
+    Raised for requests lacking a required parameter or passing one of the wrong type.
+    """
+
+
+class ThreadOutput(io.TextIOBase):
+    """
+    A stream writing into the capture buffer of the current thread (if it captures its output) or into the wrapped stream otherwise.
+    """
+
+    def __init__(self, stream: io.TextIOBase, captured: threading.local):
+        self.stream = stream
+        self.captured = captured
+
+    def write(self, text: str) -> int:
+        buffer = getattr(self.captured, "buffer", None)
+        return (buffer if buffer is not None else self.stream).write(text)
+
+    def flush(self) -> None:
+        if getattr(self.captured, "buffer", None) is None:
+            self.stream.flush()
+
+    def isatty(self) -> bool:
+        return getattr(self.captured, "buffer", None) is None and self.stream.isatty()
+
+    def fileno(self) -> int:
+        return self.stream.fileno()
+
+    @property
+    def encoding(self) -> str:  # type: ignore
+        return getattr(self.stream, "encoding", "utf-8")
+
+
+class PooledRequestsMixIn:
+    """
+    Handle every connection on a bounded pool of worker threads instead of starting a thread per connection.
+    Connections exceeding the pool wait until a worker is free.
+    """
+
+    pool: ThreadPoolExecutor
+
+    def process_request(self, request, client_address) -> None:
+        self.pool.submit(self.process_request_in_worker, request, client_address)
+
+    def process_request_in_worker(self, request, client_address) -> None:
+        try:
+            self.finish_request(request, client_address)  # type: ignore
+        except Exception:
+            self.handle_error(request, client_address)  # type: ignore
+        finally:
+            self.shutdown_request(request)  # type: ignore
+
+
+class PooledHTTPServer(PooledRequestsMixIn, HTTPServer):
+    pass
+
+
+class PooledUnixHTTPServer(PooledRequestsMixIn, socketserver.UnixStreamServer):
+    pass
+
+
+class RequestHandler(BaseHTTPRequestHandler):
+    """
+    Answer GET /health and POST /<command> requests, whose bodies are JSON objects of the command's parameters.
+    """
+
+    server: Union[PooledHTTPServer, PooledUnixHTTPServer]
+
+    # names of the local host a browser sends, unless a DNS rebinding attack points another name to it
+    LOCAL_HOSTS = ["localhost", "127.0.0.1", "[::1]"]
+
+    def do_GET(self) -> None:
+        if not self.is_local_host():
+            return
+        if self.path == "/health":
+            self.send_json(200, {"status": "ok", "version": cookietemple.__version__})
+        else:
+            self.send_json(404, {"error": f"Unknown path {self.path}"})
+
+    def do_POST(self) -> None:
+        if not self.is_local_host():
+            return
+        # web pages can only POST JSON to another origin after a CORS preflight, which is never answered
+        if self.headers.get_content_type() != "application/json":
+            self.send_json(415, {"error": "The Content-Type of requests must be application/json"})
+            return
+        command = self.path.strip("/")
+        template_server: TemplateServer = self.server.template_server  # type: ignore
+        if command not in template_server.commands:
+            self.send_json(
+                404, {"error": f"Unknown command {command}. Available are {', '.join(template_server.commands)}"}
+            )
+            return
+        try:
+            request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        except ValueError as e:
+            self.send_json(400, {"error": f"Invalid JSON: {e}"})
+            return
+        if not isinstance(request, dict):
+            self.send_json(400, {"error": "The request must be a JSON object"})
+            return
+        self.send_json(*template_server.handle(command, request))
+
+    def is_local_host(self) -> bool:
+        """
+        Reject requests to TCP servers naming another host than the local one (or the host the server is bound to).
+        Requests over UNIX sockets cannot be sent by web pages and are always accepted.
+
+        :return: Whether the request may be handled
+        """
+        if isinstance(self.server.server_address, str):
+            return True
+        host = self.headers.get("Host", "")
+        hostname = host[: host.index("]") + 1] if host.startswith("[") and "]" in host else host.split(":")[0]
+        if hostname in RequestHandler.LOCAL_HOSTS or hostname == self.server.server_address[0]:
+            return True
+        self.send_json(403, {"error": f"Requests to host {host} are not allowed"})
+
+        return False
+
+    def send_json(self, status: int, response: dict) -> None:
+        """
+        Send a JSON response.
+
+        :param status: HTTP status code
+        :param response: The response body
+        """
+        body = json.dumps(response).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        # clients of UNIX sockets have no address, so only the request itself is logged
+        log.debug(format % args)
+
+
+class TemplateServer:
+    """
+    Serve create, lint, bump-version and info requests from a long running process, which keeps the template registry and the
+    compiled templates in memory and pays for starting Python and importing cookietemple's dependencies only once.
+    Requests are handled in parallel by a bounded pool of workers. Workers never prompt: every answer has to be part of the request.
+    Everything a command prints is returned as output of its request.
+    """
+
+    DEFAULT_HOST = "127.0.0.1"
+    DEFAULT_PORT = 8765
+
+    def __init__(self, workers: Optional[int] = None):
+        self.workers = workers if workers else os.cpu_count() or 1
+        self.commands: Dict[str, Callable[[dict], Tuple[int, dict]]] = {
+            "create": self.create,
+            "lint": self.lint,
+            "bump-version": self.bump_version,
+            "info": self.info,
+        }
+        self.captured = threading.local()
+
+    def bind(
+        self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, socket_path: Optional[str] = None
+    ) -> Union[PooledHTTPServer, PooledUnixHTTPServer]:
+        """
+        Bind the server to a local TCP port or to a UNIX socket, which is only accessible by the current user.
+
+        :param host: Host to listen on
+        :param port: Port to listen on (0 picks a free port)
+        :param socket_path: Path of a UNIX socket to listen on instead of the port
+        :return: The bound server
+        """
+        server: Union[PooledHTTPServer, PooledUnixHTTPServer]
+        if socket_path:
+            if os.path.exists(socket_path):
+                # a left over socket of a previous server
+                os.remove(socket_path)
+            server = PooledUnixHTTPServer(socket_path, RequestHandler)
+            os.chmod(socket_path, 0o600)
+        else:
+            server = PooledHTTPServer((host, port), RequestHandler)
+        server.pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="serve")
+        server.template_server = self  # type: ignore
+
+        return server
+
+    def serve(self, server: Union[PooledHTTPServer, PooledUnixHTTPServer]) -> None:
+        """
+        Warm up the templates and serve requests until interrupted or shut down.
+
+        :param server: The bound server
+        """
+        self.warm_up()
+        stdout, stderr, console_file = sys.stdout, sys.stderr, console.file
+        sys.stdout, sys.stderr = ThreadOutput(stdout, self.captured), ThreadOutput(stderr, self.captured)  # type: ignore
+        console.file = ThreadOutput(console_file, self.captured)  # type: ignore
+        address = server.server_address
+        console.print(
+            f"[bold blue]Serving {', '.join(self.commands)} with {self.workers} workers on "
+            f"[green]{address if isinstance(address, str) else f'http://{address[0]}:{address[1]}'}"
+        )
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            server.pool.shutdown()
+            sys.stdout, sys.stderr, console.file = stdout, stderr, console_file
+            if isinstance(server.server_address, str) and os.path.exists(server.server_address):
+                os.remove(server.server_address)
+            console.print("[bold blue]Stopped serving.")
+
+    def warm_up(self) -> None:
+        """
+        Load the template registry and compile all templates into memory before the first request arrives.
+        """
+        TemplateRegistry.get()
+        TemplateCompiler().compile_templates()
+
+    @contextmanager
+    def capture(self) -> Iterator[io.StringIO]:
+        """
+        Capture everything the current thread prints.
+
+        :return: The buffer receiving the output
+        """
+        self.captured.buffer = io.StringIO()
+        try:
+            yield self.captured.buffer
+        finally:
+            self.captured.buffer = None
+
+    def handle(self, command: str, request: dict) -> Tuple[int, dict]:
+        """
+        Run a command without any prompts.
+
+        :param command: Name of the command
+        :param request: Parameters of the command
+        :return: HTTP status code and the response containing the exit code, the output and the results of the command
+        """
+        log.debug(f"Handling {command} request {request}")
+        exit_code = 0
+        result: dict = {}
+        with self.capture() as output, no_prompts():
+            try:
+                exit_code, result = self.commands[command](request)
+            except SystemExit as e:
+                exit_code = e.code if isinstance(e.code, int) else 1
+            except RequestError as e:
+                return 400, {"error": str(e)}
+            except Exception as e:
+                log.exception(f"Failed to handle {command} request")
+                return 500, {"error": f"{type(e).__name__}: {e}", "output": Text.from_ansi(output.getvalue()).plain}
+
+        return 200 if exit_code == 0 else 422, {
+            "exit_code": exit_code,
+            "output": Text.from_ansi(output.getvalue()).plain,
+            **result,
+        }
+
+    @staticmethod
+    def parameter(request: dict, name: str, kind: type, default: Any = None) -> Any:
+        """
+        Read a parameter of a request.
+
+        :param request: The request
+        :param name: Name of the parameter
+        :param kind: Required type of the parameter
+        :param default: Value of omitted optional parameters. Parameters without default are required.
+        :return: The value of the parameter
+        """
+        if name not in request:
+            if default is None:
+                raise RequestError(f"Missing required parameter {name}")
+            return default
+        if not isinstance(request[name], kind):
+            raise RequestError(f"Parameter {name} must be of type {kind.__name__}")
+
+        return request[name]
+
+    def create(self, request: dict) -> Tuple[int, dict]:
+        """
+        Create a project from the answers of a .cookietemple.yml file.
+        Parameters: answers (object), output_dir (string).
+
+        :param request: The parameters of the request
+        :return: The exit code and the path to the created project
+        """
+        answers = TemplateServer.parameter(request, "answers", dict)
+        output_dir = Path(TemplateServer.parameter(request, "output_dir", str)).resolve()
+        output_dir.mkdir(parents=True, exist_ok=True)
+        creator = choose_domain(output_dir, None, answers, output_dir)
+
+        return 0, {"project_dir": f"{creator.PROJECT_ROOT}/{creator.project_dir_name()}"}
+
+    def lint(self, request: dict) -> Tuple[int, dict]:
+        """
+        Lint a project. Parameters: project_dir (string).
+
+        :param request: The parameters of the request
+        :return: The exit code and the passed, warned and failed checks
+        """
+        linter = lint_project(TemplateServer.parameter(request, "project_dir", str), exit_on_failure=False)
+        results = {
+            result: [{"check": check, "message": message} for check, message in getattr(linter, result)]
+            for result in ["passed", "warned", "failed"]
+        }
+
+        return 1 if results["failed"] else 0, results
+
+    def bump_version(self, request: dict) -> Tuple[int, dict]:
+        """
+        Bump the version of a project. Unreasonable bumps (like 1.0.0 to 3.0.0) have to be forced.
+        Parameters: project_dir (string), new_version (string), downgrade, tag and force (booleans, false by default).
+
+        :param request: The parameters of the request
+        :return: The exit code and the new version
+        """
+        project_dir = TemplateServer.parameter(request, "project_dir", str)
+        new_version = TemplateServer.parameter(request, "new_version", str)
+        downgrade = TemplateServer.parameter(request, "downgrade", bool, False)
+        version_bumper = VersionBumper(project_dir, downgrade)
+        version_bumper.lint_before_bump()
+        if not version_bumper.can_run_bump_version(new_version):
+            return 1, {}
+        if (
+            not downgrade
+            and not TemplateServer.parameter(request, "force", bool, False)
+            and not version_bumper.check_bump_range(
+                version_bumper.CURRENT_VERSION.split("-")[0], new_version.split("-")[0]
+            )
+        ):
+            console.print(
+                f"[bold red]Bumping from {version_bumper.CURRENT_VERSION} to {new_version} seems not reasonable. "
+                "Pass force to bump anyways."
+            )
+            return 1, {}
+        version_bumper.bump_template_version(
+            new_version, Path(project_dir), TemplateServer.parameter(request, "tag", bool, False)
+        )
+
+        return 0, {"version": new_version}
+
+    def info(self, request: dict) -> Tuple[int, dict]:
+        """
+        Get detailed info on a template domain or a single template. Parameters: handle (string).
+
+        :param request: The parameters of the request
+        :return: The exit code and all templates matching the handle
+        """
+        handle = TemplateServer.parameter(request, "handle", str).lower()
+        TemplateInfo().show_info(handle)
+        templates = TemplateRegistry.get().find("-".join(handle.split("-")[:3]))
+
+        return 0, {"templates": [asdict(template) for template in templates]}
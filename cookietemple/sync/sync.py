@@ -7,9 +7,7 @@ import logging
 import os
 import shutil
 import sys
-import tempfile
 from configparser import ConfigParser, NoSectionError
-from distutils.dir_util import copy_tree
 from pathlib import Path
 from subprocess import PIPE, Popen
 from typing import Tuple
@@ -20,11 +18,14 @@ from packaging import version
 from rich import print
 
 from cookietemple.common.load_yaml import load_yaml_file
-from cookietemple.common.version import load_ct_template_version, load_project_template_version_and_handle
+from cookietemple.common.template_registry import TemplateRegistry
+from cookietemple.common.version import load_project_template_version_and_handle
 from cookietemple.config.config import ConfigCommand
 from cookietemple.create.create import choose_domain
 from cookietemple.create.github_support import create_sync_secret, decrypt_pat, load_github_username
+from cookietemple.create.sinks import MemorySink
 from cookietemple.custom_cli.questionary import cookietemple_questionary_or_dot_cookietemple
+from cookietemple.util.profiling import profile_phase
 
 log = logging.getLogger(__name__)
 
@@ -100,6 +101,7 @@ class TemplateSync:
         if not self.made_changes:
             print("[bold blue]No changes made to TEMPLATE - sync complete")
 
+    @profile_phase("sync: inspect project")
     def inspect_sync_dir(self):
         """
         Examines target directory to sync, verifies that it is a git repository and ensures that there are no uncommitted changes.
@@ -134,6 +136,7 @@ class TemplateSync:
             print("[bold blue]Open cookietemple sync PR still unmerged! No sync will happen until this PR is merged!")
             sys.exit(0)
 
+    @profile_phase("sync: checkout TEMPLATE")
     def checkout_template_branch(self):
         """
         Try to check out the origin/TEMPLATE in a new TEMPLATE branch.
@@ -154,6 +157,7 @@ class TemplateSync:
                 print('[bold red]Could not check out branch "origin/TEMPLATE" or "TEMPLATE"')
                 sys.exit(1)
 
+    @profile_phase("sync: delete files")
     def delete_template_branch_files(self):
         """
         Delete all files in the TEMPLATE branch
@@ -176,25 +180,26 @@ class TemplateSync:
                 print(f"[bold red]{e}")
                 sys.exit(1)
 
+    @profile_phase("sync: render template")
     def make_template_project(self):
         """
         Delete all files and make a fresh template.
         """
         print("[bold blue]Creating a new template project.")
-        # dry create run from dot_cookietemple in tmp directory
-        with tempfile.TemporaryDirectory() as tmpdirname:
-            old_cwd = str(Path.cwd())
-            log.debug(f"Saving current working directory {old_cwd}.")
-            os.chdir(tmpdirname)
-            log.debug(f"Changed directory to {tmpdirname}.")
-            log.debug(f"Calling choose_domain with {self.dot_cookietemple}.")
-            choose_domain(path=Path.cwd(), domain=None, dot_cookietemple=self.dot_cookietemple)
-            # copy into the cleaned TEMPLATE branch's project directory
-            log.debug(f"Copying created template into {self.project_dir}.")
-            copy_tree(os.path.join(tmpdirname, self.dot_cookietemple["project_slug_no_hyphen"]), str(self.project_dir))
-            log.debug(f"Changing directory back to {old_cwd}.")
-            os.chdir(old_cwd)
+        # dry create run from dot_cookietemple in memory, which is written into the cleaned TEMPLATE branch's project directory
+        log.debug(f"Calling choose_domain with {self.dot_cookietemple} in memory.")
+        sink = MemorySink()
+        choose_domain(
+            path=Path(self.project_dir).parent,
+            domain=None,
+            dot_cookietemple=self.dot_cookietemple,
+            output_root=Path(self.project_dir).parent,
+            sink=sink,
+        )
+        log.debug(f"Writing created template into {self.project_dir}.")
+        sink.write_to(str(self.project_dir))
 
+    @profile_phase("sync: commit")
     def commit_template_changes(self):
         """
         If we have any changes with the new template files, make a git commit
@@ -257,6 +262,7 @@ class TemplateSync:
             sys.exit(1)
         return True
 
+    @profile_phase("sync: push")
     def push_template_branch(self):
         """
         If there are any changes to the template, push the TEMPLATE branch to the default remote
@@ -282,6 +288,7 @@ class TemplateSync:
             print(f"Could not push TEMPLATE or cookietemple_sync_v{self.new_template_version} branch:\n{e}")
             sys.exit(1)
 
+    @profile_phase("sync: pull request")
     def make_pull_request(self):
         """
         Create a pull request to a base branch from a head branch (that is, a temporary branch only created for syncing the new template version)
@@ -529,12 +536,7 @@ class TemplateSync:
         :param handle: The template handle
         :return: The actual version number of the template in cookietemple
         """
-        top_path = f"{os.path.dirname(__file__)}/.."
-        available_templates_path = f"{str(top_path)}/create/templates/available_templates.yml"
-        log.debug(
-            f"Using available templates file from {available_templates_path} to load current cookietemple template version."
-        )
-        return load_ct_template_version(handle, available_templates_path)
+        return TemplateRegistry.get().version(handle)
 
     @staticmethod
     def sync_load_project_template_version_and_handle(project_dir: Path) -> Tuple[str, str]:
@@ -0,0 +1,61 @@
+import logging
+import os
+import time
+from typing import List
+
+from cookietemple.create.bytecode_cache import TemplateBytecodeCache
+from cookietemple.create.template_renderer import TemplateLayer, TemplateRenderer
+from cookietemple.create.template_source import PACK_SUFFIX
+from cookietemple.util.rich import console
+
+log = logging.getLogger(__name__)
+
+
+class TemplateCompiler:
+    """
+    Pre-compile all templates shipped with cookietemple into the persistent jinja bytecode cache.
+    """
+
+    TEMPLATES_PATH = f"{os.path.dirname(__file__)}/../create/templates"
+
+    @staticmethod
+    def find_templates(templates_path: str = TEMPLATES_PATH) -> List[str]:
+        """
+        Find all cookiecutter templates (including the common files), which are either directories or packs.
+
+        :param templates_path: Path to the directory containing all templates
+        :return: Sorted paths to all directories containing a cookiecutter.json and to all (unpacked) template directories of packs
+        """
+        templates = set()
+        for root, dirs, files in os.walk(templates_path):
+            if "cookiecutter.json" in files:
+                templates.add(os.path.normpath(root))
+                # a template never contains another template
+                dirs.clear()
+            templates.update(
+                os.path.normpath(os.path.join(root, file[: -len(PACK_SUFFIX)]))
+                for file in files
+                if file.endswith(PACK_SUFFIX)
+            )
+
+        return sorted(templates)
+
+    def compile_templates(self) -> None:
+        """
+        Compile every template file of every template, so that subsequent renderings only load the cached bytecode.
+        """
+        if TemplateBytecodeCache.DISABLE_ENV in os.environ:
+            console.print(
+                f"[bold yellow]The jinja bytecode cache is disabled by {TemplateBytecodeCache.DISABLE_ENV}. Nothing to compile."
+            )
+            return
+        start = time.perf_counter()
+        compiled = 0
+        for template in TemplateCompiler.find_templates():
+            log.debug(f"Compiling {template}")
+            compiled += TemplateRenderer([TemplateLayer(template, {})]).compile()
+
+        console.print(
+            f"[bold blue]Compiled [green]{compiled}[blue] template files into {TemplateBytecodeCache.CACHE_DIR} "
+            f"in {time.perf_counter() - start:.1f}s."
+        )
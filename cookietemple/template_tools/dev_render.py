@@ -0,0 +1,336 @@
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from cookiecutter.exceptions import CookiecutterException  # type: ignore
+from jinja2 import meta, nodes
+from jinja2.exceptions import TemplateError, TemplateSyntaxError
+
+from cookietemple.common.load_yaml import load_yaml_file
+from cookietemple.common.template_registry import TemplateEntry, TemplateRegistry
+from cookietemple.create.create import choose_domain
+from cookietemple.create.sinks import DirectorySink, MemorySink, RenderedFile
+from cookietemple.create.template_renderer import SourceFile, TemplateRenderer
+from cookietemple.lint.lint import lint_project
+from cookietemple.lint.template_linter import TemplateLinter
+from cookietemple.util.rich import console
+
+log = logging.getLogger(__name__)
+
+# the answers key of the subdomain per domain
+SUBDOMAIN_KEYS = {"web": "webtype", "pub": "pubtype"}
+# marks templates using the whole cookiecutter context and contexts whose special (underscore) keys changed
+ALL_KEYS = "*"
+
+
+class DevRenderer:
+    """
+    Render a template with fixed answers for template authors. Prompts, name lookups and Github support are skipped.
+    While watching, the template sources are polled and only the files whose template file, included templates or
+    referenced context keys changed are rendered and linted again.
+    """
+
+    # seconds between two polls of the template sources
+    POLL_INTERVAL = 0.5
+
+    def __init__(self, handle: str, answers_path: str, output_dir: str):
+        template = TemplateRegistry.get().by_handle.get(handle)
+        if not template:
+            console.print(
+                f"[bold red]Unknown template handle {handle}! Run [green]cookietemple list [red]for all handles."
+            )
+            sys.exit(1)
+        self.template: TemplateEntry = template
+        self.answers_path = os.path.abspath(answers_path)
+        self.output_dir = os.path.abspath(output_dir)
+        self.project_dir = ""
+        self.renderer: Optional[TemplateRenderer] = None
+        # all rendered files of the project mapped to their source files
+        self.files: Dict[str, SourceFile] = {}
+        self.dot_cookietemple: Optional[RenderedFile] = None
+
+    def answers(self) -> dict:
+        """
+        Load the answers to all prompts. The answers of the domain, subdomain and language are given by the handle
+        and the project is never pushed to Github.
+
+        :return: The answers in the format of a .cookietemple.yml file
+        """
+        answers = {
+            "is_github_repo": False,
+            "is_repo_private": False,
+            "is_github_orga": False,
+            "github_orga": "",
+            **(load_yaml_file(self.answers_path) or {}),
+            "domain": self.template.domain,
+            "language": self.template.language,
+        }
+        if self.template.subdomain:
+            answers[SUBDOMAIN_KEYS[self.template.domain]] = self.template.subdomain
+
+        return answers
+
+    def load(self) -> TemplateRenderer:
+        """
+        Resolve the template layers of the answers like the create command does, by creating the project in memory.
+
+        :return: A renderer of the resolved layers
+        """
+        sink = MemorySink()
+        creator = choose_domain(Path(self.output_dir), None, self.answers(), Path(self.output_dir), True, sink)
+        self.dot_cookietemple = sink.files.get(".cookietemple.yml")
+        return TemplateRenderer(creator.layers)
+
+    def render(self) -> str:
+        """
+        Render the whole project and lint it.
+
+        :return: Path to the project directory
+        """
+        renderer = self.load()
+        renderer.load_layers(self.output_dir)
+        dirs, files = renderer.source_tree()
+        self.renderer, self.files = renderer, files
+        self.project_dir = os.path.join(self.output_dir, renderer.project_name())
+        self.write(dirs, list(files), write_dot_cookietemple=True)
+        console.print(f"[bold blue]Rendered {len(files)} files into {self.project_dir}.")
+        try:
+            lint_project(self.project_dir)
+        except SystemExit:
+            # failing lint checks are reported, but must not stop the template author from fixing them
+            pass
+
+        return self.project_dir
+
+    def watch(self) -> None:
+        """
+        Poll the template sources and the answers and render the changed files again until interrupted.
+        Failed renderings (e.g. syntax errors) are reported and retried with the next change.
+        """
+        console.print("[bold blue]Watching the template sources for changes. Press Ctrl+C to stop.")
+        snapshot = self.snapshot()
+        pending: Set[str] = set()
+        try:
+            while True:
+                time.sleep(DevRenderer.POLL_INTERVAL)
+                current = self.snapshot()
+                pending |= {
+                    path for path in snapshot.keys() | current.keys() if snapshot.get(path) != current.get(path)
+                }
+                snapshot = current
+                if not pending:
+                    continue
+                try:
+                    self.rerender(pending)
+                    pending = set()
+                    # the answers may have chosen other templates
+                    snapshot = self.snapshot()
+                except (TemplateError, CookiecutterException) as e:
+                    console.print(f"[bold red]Rendering failed: {e}")
+        except KeyboardInterrupt:
+            console.print("[bold blue]Stopped watching.")
+
+    def snapshot(self) -> Dict[str, Tuple[int, int]]:
+        """
+        Record modification time and size of the answers and of all files of all template directories.
+        Packed templates never change and are not watched.
+
+        :return: Modification time and size of every watched file keyed by its absolute path
+        """
+        paths = [self.answers_path]
+        for layer in self.renderer.layers if self.renderer else []:
+            for root, _, files in os.walk(os.path.abspath(layer.template_path)):
+                paths.extend(os.path.join(root, file) for file in files)
+        snapshot = {}
+        for path in paths:
+            try:
+                stat = os.stat(path)
+                snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+            except FileNotFoundError:
+                # removed in the meantime
+                pass
+
+        return snapshot
+
+    def rerender(self, changed_paths: Set[str]) -> List[str]:
+        """
+        Render only the files affected by changed template files or answers again and lint them.
+        Files which are not part of the project anymore are removed.
+
+        :param changed_paths: Absolute paths of all changed, added or removed template files and answers
+        :return: Paths of all rendered files relative to the project directory
+        """
+        old = self.renderer
+        answers_changed = self.answers_path in changed_paths
+        renderer = self.load() if answers_changed or not old else TemplateRenderer(old.layers)
+        renderer.load_layers(self.output_dir)
+        project_dir = os.path.join(self.output_dir, renderer.project_name())
+        dirs, files = renderer.source_tree()
+        if (
+            not old
+            or project_dir != self.project_dir
+            or [layer.template_path for layer in renderer.layers] != [layer.template_path for layer in old.layers]
+        ):
+            # other templates or another project directory: start over
+            outfiles, removed = list(files), []
+        else:
+            changed_templates = self.changed_templates(renderer, changed_paths)
+            changed_keys = [
+                DevRenderer.changed_keys(old.contexts[layer]["cookiecutter"], context["cookiecutter"])
+                for layer, context in enumerate(renderer.contexts)
+            ]
+            outfiles = [
+                outfile
+                for outfile, source in files.items()
+                if self.is_stale(renderer, source, self.files.get(outfile), changed_templates, changed_keys)
+            ]
+            removed = [outfile for outfile in self.files if outfile not in files]
+
+        self.renderer, self.files, self.project_dir = renderer, files, project_dir
+        self.write(dirs, outfiles, write_dot_cookietemple=answers_changed)
+        for outfile in removed:
+            if os.path.isfile(os.path.join(project_dir, outfile)):
+                os.remove(os.path.join(project_dir, outfile))
+        console.print(
+            f"[bold blue]Rendered [green]{len(outfiles)}[blue] changed files and removed [green]{len(removed)}[blue] files."
+        )
+        self.lint(outfiles)
+
+        return outfiles
+
+    def write(self, dirs: Dict[str, Optional[int]], outfiles: List[str], write_dot_cookietemple: bool) -> None:
+        """
+        Render files into the project directory.
+
+        :param dirs: All directories of the project relative to the project directory mapped to their permission bits
+        :param outfiles: The files to render relative to the project directory
+        :param write_dot_cookietemple: Whether to write the .cookietemple.yml file as well
+        """
+        sink = DirectorySink(self.project_dir)
+        for directory in sorted(dirs):
+            sink.add_dir(directory, dirs[directory])
+        for outfile in outfiles:
+            self.renderer.write_file(self.files[outfile], outfile, sink)  # type: ignore
+        if write_dot_cookietemple and self.dot_cookietemple:
+            sink.add_file(".cookietemple.yml", self.dot_cookietemple.content, self.dot_cookietemple.mode)
+
+    def lint(self, outfiles: List[str]) -> None:
+        """
+        Run the checks inspecting single files on the rendered files only.
+
+        :param outfiles: The rendered files relative to the project directory
+        """
+        linter = TemplateLinter(self.project_dir)
+        linter.lint_files(outfiles)
+        for check, message in linter.warned:
+            console.print(f"[bold yellow]{check}: {message}")
+
+    def changed_templates(self, renderer: TemplateRenderer, changed_paths: Set[str]) -> List[Set[str]]:
+        """
+        Map changed paths to the changed template files of every layer.
+
+        :param renderer: The renderer whose layers are loaded
+        :param changed_paths: Absolute paths of all changed files
+        :return: Names of the changed template files (relative to the templated directory) per layer
+        """
+        changed_templates: List[Set[str]] = []
+        for layer, source in enumerate(renderer.sources):
+            template_dir = os.path.join(source.template_path, renderer.template_dirs[layer])
+            changed_templates.append(
+                {
+                    os.path.relpath(path, template_dir).replace(os.sep, "/")
+                    for path in changed_paths
+                    if path.startswith(f"{template_dir}{os.sep}")
+                }
+            )
+
+        return changed_templates
+
+    @staticmethod
+    def changed_keys(old_context: dict, new_context: dict) -> Set[str]:
+        """
+        Compare the cookiecutter contexts of a layer.
+
+        :param old_context: The context of the previous rendering
+        :param new_context: The context of the current rendering
+        :return: All changed keys. Contains ALL_KEYS if a special key (like _copy_without_render) changed.
+        """
+        keys = {key for key in old_context.keys() | new_context.keys() if old_context.get(key) != new_context.get(key)}
+        if any(key.startswith("_") for key in keys):
+            keys.add(ALL_KEYS)
+
+        return keys
+
+    def is_stale(
+        self,
+        renderer: TemplateRenderer,
+        source: SourceFile,
+        old_source: Optional[SourceFile],
+        changed_templates: List[Set[str]],
+        changed_keys: List[Set[str]],
+    ) -> bool:
+        """
+        Check whether a file has to be rendered again.
+
+        :param renderer: The renderer whose layers are loaded
+        :param source: The current source file of the output file
+        :param old_source: The source file of the output file of the previous rendering (None for new output files)
+        :param changed_templates: Names of the changed template files per layer
+        :param changed_keys: Changed context keys per layer
+        :return: Whether the file has to be rendered again
+        """
+        if old_source != source or ALL_KEYS in changed_keys[source.layer]:
+            return True
+        if source.path.replace(os.sep, "/") in changed_templates[source.layer]:
+            return True
+        if source.copy_only or not (changed_keys[source.layer] or changed_templates[source.layer]):
+            return False
+        keys, templates = DevRenderer.dependencies(renderer, source)
+        if ALL_KEYS in keys and changed_keys[source.layer] or keys & changed_keys[source.layer]:
+            return True
+
+        return (
+            None in templates
+            and bool(changed_templates[source.layer])
+            or bool(templates & changed_templates[source.layer])
+        )
+
+    @staticmethod
+    def dependencies(renderer: TemplateRenderer, source: SourceFile) -> Tuple[Set[str], Set[Optional[str]]]:
+        """
+        Find the context keys and the templates a template file references.
+
+        :param renderer: The renderer whose layers are loaded
+        :param source: The source file
+        :return: The referenced keys (ALL_KEYS if the whole context is used) and the names of all included, imported or extended
+            templates (None if a name is only known while rendering)
+        """
+        template_source = renderer.sources[source.layer]
+        infile = os.path.join(renderer.template_dirs[source.layer], source.path)
+        if template_source.is_binary(infile):
+            return set(), set()
+        env = renderer.envs[source.layer]
+        try:
+            ast = env.parse(template_source.read(infile).decode("utf-8"))
+        except (TemplateSyntaxError, UnicodeDecodeError):
+            # render the file again to report the error
+            return {ALL_KEYS}, {None}
+        keys: Set[str] = set()
+        lookups = 0
+        for node in ast.find_all((nodes.Getattr, nodes.Getitem)):
+            if isinstance(node.node, nodes.Name) and node.node.name == "cookiecutter":
+                lookups += 1
+                if isinstance(node, nodes.Getattr):
+                    keys.add(node.attr)
+                elif isinstance(node.arg, nodes.Const):
+                    keys.add(str(node.arg.value))
+                else:
+                    keys.add(ALL_KEYS)
+        # any use of cookiecutter, which is not a lookup of a single key, may depend on all keys
+        if sum(1 for node in ast.find_all(nodes.Name) if node.name == "cookiecutter") > lookups:
+            keys.add(ALL_KEYS)
+
+        return keys, set(meta.find_referenced_templates(ast))
@@ -0,0 +1,44 @@
+import logging
+import os
+import shutil
+import time
+
+from cookietemple.create.template_source import PACK_SUFFIX, write_pack
+from cookietemple.template_tools.compile import TemplateCompiler
+from cookietemple.util.rich import console
+
+log = logging.getLogger(__name__)
+
+
+class TemplatePacker:
+    """
+    Bundle every template shipped with cookietemple into a single pack file next to its directory.
+    Packs are read through mmap with random access, which avoids walking and stat'ing hundreds of loose files on every creation.
+    """
+
+    def pack_templates(self, remove_sources: bool = False) -> None:
+        """
+        Pack all template directories.
+
+        :param remove_sources: Whether to remove the template directories afterwards, so that only the packs are installed
+        """
+        start = time.perf_counter()
+        total_files, total_size, total_pack_size = 0, 0, 0
+        templates = [template for template in TemplateCompiler.find_templates() if os.path.isdir(template)]
+        for template in templates:
+            pack_path = f"{template}{PACK_SUFFIX}"
+            files, size = write_pack(template, pack_path)
+            pack_size = os.path.getsize(pack_path)
+            log.debug(f"Packed {files} files ({size} bytes) of {template} into {pack_path} ({pack_size} bytes)")
+            total_files, total_size, total_pack_size = (
+                total_files + files,
+                total_size + size,
+                total_pack_size + pack_size,
+            )
+            if remove_sources:
+                shutil.rmtree(template)
+
+        console.print(
+            f"[bold blue]Packed [green]{total_files}[blue] files of [green]{len(templates)}[blue] templates "
+            f"({total_size / 1024 ** 2:.1f} MB) into {total_pack_size / 1024 ** 2:.1f} MB in {time.perf_counter() - start:.1f}s."
+        )
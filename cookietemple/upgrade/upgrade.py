@@ -1,15 +1,20 @@
 import json
 import logging
+import os
 import sys
-import urllib
+import tempfile
+import threading
+import time
+import urllib.request
+from pathlib import Path
 from subprocess import PIPE, Popen, check_call
-from urllib.error import HTTPError, URLError
+from typing import Optional, Tuple
 
-from pkg_resources import parse_version
+import appdirs
+from packaging.version import parse as parse_version
 from rich import print
 
 import cookietemple
-from cookietemple.custom_cli.questionary import cookietemple_questionary_or_dot_cookietemple
 
 log = logging.getLogger(__name__)
 
@@ -17,14 +22,27 @@ log = logging.getLogger(__name__)
 class UpgradeCommand:
     """
     Responsible for checking for newer versions cookietemple and upgrading it if required.
+    On startup, the latest version is read from a TTL cache on disk, which is refreshed in the background, so that no command ever waits for PyPI.
     """
 
+    PYPI_URL = "https://pypi.org/pypi/cookietemple/json"
+    CACHE_FILE = f'{appdirs.user_cache_dir(appname="cookietemple")}/latest_version.json'
+    # the latest version is looked up at most once a day
+    CACHE_TTL_SECONDS = 24 * 60 * 60
+    # set this environment variable to never check for a newer version on startup
+    DISABLE_ENV = "COOKIETEMPLE_NO_UPGRADE_CHECK"
+    # environment variables set by CI services, where nobody could upgrade anyways
+    CI_ENVS = ["CI", "GITHUB_ACTIONS", "GITLAB_CI", "TRAVIS", "JENKINS_URL", "BUILDKITE", "TF_BUILD"]
+
     @staticmethod
     def check_upgrade_cookietemple() -> None:
         """
         Checks whether the locally installed version of cookietemple is the latest.
         If not it prompts whether to upgrade and runs the upgrade command if desired.
         """
+        # questionary is only needed by the upgrade command and not by the check on startup
+        from cookietemple.custom_cli.questionary import cookietemple_questionary_or_dot_cookietemple
+
         if not UpgradeCommand.check_cookietemple_latest():
             if cookietemple_questionary_or_dot_cookietemple(
                 function="confirm", question="Do you want to upgrade?", default="y"
@@ -38,29 +56,128 @@ class UpgradeCommand:
 
         :return: True if locally version is the latest or PyPI is inaccessible, false otherwise
         """
-        latest_local_version = cookietemple.__version__
-        sliced_local_version = (
-            latest_local_version[:-9] if latest_local_version.endswith("-SNAPSHOT") else latest_local_version
-        )
-        log.debug(f"Latest local cookietemple version is: {latest_local_version}.")
+        latest_pypi_version = UpgradeCommand.latest_pypi_version()
+        if not latest_pypi_version:
+            print(
+                "[bold red]Unable to contact PyPI to check for the latest cookietemple version. Do you have an internet connection?"
+            )
+            # Returning true by default, since this is not a serious issue
+            return True
+        UpgradeCommand.save_cached_latest_version(latest_pypi_version)
+
+        return UpgradeCommand.is_latest(latest_pypi_version)
+
+    @classmethod
+    def check_cookietemple_latest_cached(cls) -> bool:
+        """
+        Checks whether the locally installed version of cookietemple is the latest known version without waiting for PyPI.
+        The latest known version is read from the cache, which is refreshed in a background thread when it expired.
+        A refresh not finished before cookietemple exits is simply tried again next time.
+        Skipped, if disabled by the environment, in CI or if cookietemple is not run interactively.
+
+        :return: False if a newer version is known to exist, true otherwise
+        """
+        if not UpgradeCommand.check_on_startup():
+            return True
+        latest_version, checked = UpgradeCommand.load_cached_latest_version()
+        if time.time() - checked >= UpgradeCommand.CACHE_TTL_SECONDS:
+            log.debug("Refreshing the latest cookietemple version in the background.")
+            threading.Thread(target=UpgradeCommand.refresh_latest_version, name="upgrade-check", daemon=True).start()
+
+        return not latest_version or UpgradeCommand.is_latest(latest_version)
+
+    @staticmethod
+    def check_on_startup() -> bool:
+        """
+        :return: Whether to check for a newer cookietemple version on startup
+        """
+        if UpgradeCommand.DISABLE_ENV in os.environ:
+            log.debug(f"Upgrade check disabled by {UpgradeCommand.DISABLE_ENV}.")
+            return False
+        if any(env in os.environ for env in UpgradeCommand.CI_ENVS):
+            log.debug("Skipping the upgrade check on CI.")
+            return False
+        if not (sys.stdin.isatty() and sys.stderr.isatty()):
+            log.debug("Skipping the upgrade check of a non-interactive run.")
+            return False
+
+        return True
+
+    @staticmethod
+    def latest_pypi_version() -> Optional[str]:
+        """
+        Look up the latest cookietemple version released on PyPI.
+
+        :return: The latest version or None if PyPI could not be reached
+        """
         log.debug("Checking whether a new cookietemple version exists on PyPI.")
         try:
             # Retrieve info on latest version
             # Adding nosec (bandit) here, since we have a hardcoded https request
             # It is impossible to access file:// or ftp://
             # See: https://stackoverflow.com/questions/48779202/audit-url-open-for-permitted-schemes-allowing-use-of-file-or-custom-schemes
-            req = urllib.request.Request("https://pypi.org/pypi/cookietemple/json")  # nosec
+            req = urllib.request.Request(UpgradeCommand.PYPI_URL)  # nosec
             with urllib.request.urlopen(req, timeout=1) as response:  # nosec
-                contents = response.read()
-                data = json.loads(contents)
-                latest_pypi_version = data["info"]["version"]
-        except (HTTPError, TimeoutError, URLError):
-            print(
-                "[bold red]Unable to contact PyPI to check for the latest cookietemple version. Do you have an internet connection?"
-            )
-            # Returning true by default, since this is not a serious issue
-            return True
+                return json.loads(response.read())["info"]["version"]
+        # unreachable hosts, timeouts (both are OSErrors) and unexpected responses
+        except (OSError, ValueError, KeyError) as e:
+            log.debug(f"Unable to look up the latest cookietemple version: {e}")
+            return None
+
+    @staticmethod
+    def refresh_latest_version() -> None:
+        """
+        Look up the latest cookietemple version and cache it. Failed lookups are not cached and tried again next time.
+        """
+        latest_pypi_version = UpgradeCommand.latest_pypi_version()
+        if latest_pypi_version:
+            UpgradeCommand.save_cached_latest_version(latest_pypi_version)
+
+    @staticmethod
+    def load_cached_latest_version() -> Tuple[Optional[str], float]:
+        """
+        Load the cached latest cookietemple version.
+
+        :return: The latest version (None if unknown) and the time it was looked up at
+        """
+        try:
+            with open(UpgradeCommand.CACHE_FILE) as f:
+                cached = json.load(f)
+            return cached["version"], cached["time"]
+        except (OSError, ValueError, KeyError):
+            return None, 0.0
+
+    @staticmethod
+    def save_cached_latest_version(latest_version: str) -> None:
+        """
+        Atomically replace the cached latest cookietemple version.
+
+        :param latest_version: The latest version released on PyPI
+        """
+        cache_file = Path(UpgradeCommand.CACHE_FILE)
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_file = tempfile.mkstemp(prefix=".latest_version_", dir=cache_file.parent)
+            with os.fdopen(fd, "w") as f:
+                json.dump({"version": latest_version, "time": time.time()}, f)
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            # the cache is only an optimization, so never fail because of it
+            log.debug(f"Unable to cache the latest cookietemple version: {e}")
+
+    @staticmethod
+    def is_latest(latest_pypi_version: str) -> bool:
+        """
+        Compare the installed cookietemple version with the latest one released on PyPI and tell the user about differences.
 
+        :param latest_pypi_version: The latest version released on PyPI
+        :return: True if the installed version is the latest, false otherwise
+        """
+        latest_local_version = cookietemple.__version__
+        sliced_local_version = (
+            latest_local_version[:-9] if latest_local_version.endswith("-SNAPSHOT") else latest_local_version
+        )
+        log.debug(f"Latest local cookietemple version is: {latest_local_version}.")
         if parse_version(sliced_local_version) > parse_version(latest_pypi_version):
             print(
                 f"[bold yellow]Installed version {latest_local_version} of cookietemple is newer than the latest release {latest_pypi_version}!"
@@ -1,6 +1,14 @@
+import logging
 import os
+import shutil
+import sys
 from pathlib import Path
 
+log = logging.getLogger(__name__)
+
+# ioctl request to share the extents of a file with another file (copy on write), see ioctl_ficlone(2)
+FICLONE = 0x40049409
+
 
 def delete_dir_tree(directory: Path) -> None:
     """
@@ -28,3 +36,68 @@ def pf(calling_class, file_path: str) -> str:
     :return: joined path
     """
     return os.path.join(calling_class.path, file_path)
+
+
+def copy_file(src: str, dst: str) -> str:
+    """
+    Copy the content and the permission bits of a file as cheaply as the filesystem allows.
+    On filesystems supporting copy on write (e.g. btrfs or xfs) the file is reflinked, which copies no data at all.
+    Otherwise the data is copied inside of the kernel via copy_file_range and as a last resort by a regular copy.
+    Hardlinks are never used, since the copy must stay independent of its source (e.g. a template file).
+
+    :param src: Path to the file to copy
+    :param dst: Path to copy the file to
+    :return: The path to the copy (to be usable as copy_function of shutil.copytree)
+    """
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        if not (reflink(fsrc.fileno(), fdst.fileno()) or copy_file_range(fsrc.fileno(), fdst.fileno())):
+            fsrc.seek(0)
+            fdst.seek(0)
+            fdst.truncate()
+            shutil.copyfileobj(fsrc, fdst)
+    shutil.copymode(src, dst)
+    return dst
+
+
+def reflink(src_fd: int, dst_fd: int) -> bool:
+    """
+    Try to share the data of a file with another (empty) file via the FICLONE ioctl.
+
+    :param src_fd: File descriptor of the file to clone
+    :param dst_fd: File descriptor of the clone
+    :return: Whether the file was cloned
+    """
+    if not sys.platform.startswith("linux"):
+        return False
+    import fcntl
+
+    try:
+        fcntl.ioctl(dst_fd, FICLONE, src_fd)
+        return True
+    except OSError as e:
+        log.debug(f"Unable to reflink file: {e}")
+        return False
+
+
+def copy_file_range(src_fd: int, dst_fd: int) -> bool:
+    """
+    Try to copy the data of a file into another (empty) file without passing it through user space.
+
+    :param src_fd: File descriptor of the file to copy
+    :param dst_fd: File descriptor of the copy
+    :return: Whether the file was copied completely
+    """
+    if not hasattr(os, "copy_file_range"):
+        return False
+    remaining = os.fstat(src_fd).st_size
+    try:
+        while remaining > 0:
+            copied = os.copy_file_range(src_fd, dst_fd, remaining)
+            if copied == 0:
+                # some virtual files report a wrong size, so let the regular copy handle them
+                return False
+            remaining -= copied
+        return True
+    except OSError as e:
+        log.debug(f"Unable to copy file via copy_file_range: {e}")
+        return False
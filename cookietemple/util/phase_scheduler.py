@@ -0,0 +1,76 @@
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable
+
+from cookietemple.util.profiling import profile_phase
+
+log = logging.getLogger(__name__)
+
+
+class PhaseScheduler:
+    """
+    Run the phases of a command, which do not need the user's attention (like network requests), in the background.
+    A phase is started as soon as all phases it depends on have finished. The foreground only waits for a phase where it
+    actually needs its result. Phases must never prompt the user, since prompts are answered in the foreground.
+    """
+
+    # the phases are mostly waiting for the network, so there are never more phases than threads
+    MAX_WORKERS = 8
+
+    def __init__(self):
+        self.executor = ThreadPoolExecutor(max_workers=PhaseScheduler.MAX_WORKERS, thread_name_prefix="phase")
+        self.futures: Dict[str, Future] = {}
+
+    def start(self, name: str, func: Callable[..., Any], *args: Any, after: Iterable[str] = ()) -> None:
+        """
+        Start a phase in the background. Each phase is profiled under its name.
+
+        :param name: Unique name of the phase (e.g. github repository)
+        :param func: The function running the phase
+        :param args: Arguments of the function
+        :param after: Names of the already started phases, which have to finish first.
+                      If one of them fails, the phase fails with the same exception.
+        """
+        dependencies = [self.futures[dependency] for dependency in after]
+
+        def run() -> Any:
+            for dependency in dependencies:
+                dependency.result()
+            with profile_phase(name):
+                return func(*args)
+
+        log.debug(f"Starting phase {name} in the background.")
+        self.futures[name] = self.executor.submit(run)
+
+    def started(self, name: str) -> bool:
+        """
+        :param name: Name of the phase
+        :return: Whether the phase has been started
+        """
+        return name in self.futures
+
+    def join(self, name: str) -> Any:
+        """
+        Wait for a phase to finish.
+
+        :param name: Name of the phase
+        :return: The result of the phase. Exceptions raised by the phase are raised again.
+        """
+        log.debug(f"Waiting for phase {name}.")
+        return self.futures[name].result()
+
+    def join_all(self) -> None:
+        """
+        Wait for all started phases to finish, ignoring their results and exceptions.
+        Useful before exiting, to not leave a half-done phase (like a half configured Github repository) behind.
+        """
+        for name, future in self.futures.items():
+            if future.exception():
+                log.debug(f"Phase {name} failed: {future.exception()}")
+
+    def shutdown(self) -> None:
+        """
+        Wait for all started phases to finish and release the threads running them.
+        The results of the phases can still be joined, but no phase can be started anymore.
+        """
+        self.executor.shutdown(wait=True)
@@ -0,0 +1,197 @@
+import cProfile
+import logging
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional
+
+from rich.box import HEAVY_HEAD
+from rich.style import Style
+from rich.table import Table
+
+from cookietemple.util.rich import console
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class PhaseStats:
+    """
+    The accumulated measurements of all runs of a named phase.
+    """
+
+    name: str
+    calls: int = 0
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0  # CPU time of the thread running the phase
+    # peak of the memory traced by tracemalloc while the phase ran in bytes. The traced memory is process-wide, so it
+    # includes the memory of concurrent background phases. Phases running in the background do not trace memory (None).
+    peak_memory: Optional[int] = 0
+
+
+class PhaseProfiler:
+    """
+    Record wall time, CPU time and peak memory of named phases like prompts, rendering or linting.
+    Measurements of nested phases are included in the measurements of their enclosing phases.
+    CPU time is measured per thread, so phases running in background threads are not charged to the foreground phases.
+    As long as profiling is not enabled (via the global --profile option) recording a phase costs nothing.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.phases: Dict[str, PhaseStats] = {}
+        self.profile: Optional[cProfile.Profile] = None
+        self.start_wall = 0.0
+        self.start_cpu = 0.0
+        self._lock = threading.Lock()
+        # peak memory of every phase currently running in this thread (innermost last)
+        self._running = threading.local()
+
+    def start(self, with_cprofile: bool = False) -> None:
+        """
+        Enable profiling for the rest of this process.
+
+        :param with_cprofile: Whether to additionally collect a cProfile profile of all function calls
+        """
+        self.enabled = True
+        self.phases = {}
+        self.start_wall, self.start_cpu = time.perf_counter(), time.process_time()
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        if with_cprofile:
+            self.profile = cProfile.Profile()
+            self.profile.enable()
+
+    def stop(self, pstats_file: Optional[str] = None) -> None:
+        """
+        Disable profiling, print the summary of all phases and write the cProfile profile (if collected).
+
+        :param pstats_file: Path to dump the cProfile profile in pstats format to
+        """
+        if not self.enabled:
+            return
+        total_wall, total_cpu = time.perf_counter() - self.start_wall, time.process_time() - self.start_cpu
+        total_peak = tracemalloc.get_traced_memory()[1]
+        self.enabled = False
+        tracemalloc.stop()
+        self.print_summary(PhaseStats("total", 1, total_wall, total_cpu, total_peak))
+        if self.profile:
+            self.profile.disable()
+            if pstats_file:
+                self.profile.dump_stats(pstats_file)
+                console.print(f"[bold blue]Wrote the cProfile statistics to {pstats_file}.")
+            self.profile = None
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Measure a named phase. Runs of the same phase are accumulated.
+        Can be used as context manager or as decorator.
+
+        :param name: Name of the phase (e.g. render or lint)
+        """
+        if not self.enabled:
+            yield
+            return
+        if threading.current_thread() is not threading.main_thread():
+            yield from self.background_phase(name)
+            return
+        running: List[int] = self._running.__dict__.setdefault("peaks", [])
+        start_peak = -1
+        if hasattr(tracemalloc, "reset_peak"):
+            # save the peak of the enclosing phase, since tracing the peak of this phase resets it
+            if running:
+                running[-1] = max(running[-1], tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+        else:
+            # Python 3.8 cannot reset the peak, so it only belongs to this phase if it rose while the phase ran
+            start_peak = tracemalloc.get_traced_memory()[1]
+        running.append(0)
+        start_wall, start_cpu = time.perf_counter(), time.thread_time()
+        try:
+            yield
+        finally:
+            wall, cpu = time.perf_counter() - start_wall, time.thread_time() - start_cpu
+            current, traced_peak = tracemalloc.get_traced_memory() if tracemalloc.is_tracing() else (0, 0)
+            # otherwise the memory traced at the end of the phase is the best known approximation
+            peak = max(running.pop(), traced_peak if traced_peak > start_peak else current)
+            if running:
+                running[-1] = max(running[-1], peak)
+            self.record(name, wall, cpu, peak)
+            log.debug(f"Phase {name} took {wall:.3f}s (CPU {cpu:.3f}s, peak memory {peak / 1024 ** 2:.1f} MB).")
+
+    def background_phase(self, name: str) -> Iterator[None]:
+        """
+        Measure a named phase running in a background thread. Its memory is not traced, since resetting the
+        process-wide peak would falsify the peak of the phase running in the foreground meanwhile.
+
+        :param name: Name of the phase (e.g. github repository)
+        """
+        start_wall, start_cpu = time.perf_counter(), time.thread_time()
+        try:
+            yield
+        finally:
+            wall, cpu = time.perf_counter() - start_wall, time.thread_time() - start_cpu
+            self.record(name, wall, cpu, None)
+            log.debug(f"Background phase {name} took {wall:.3f}s (CPU {cpu:.3f}s).")
+
+    def record(self, name: str, wall: float, cpu: float, peak: Optional[int]) -> None:
+        """
+        Accumulate the measurements of a single run of a phase.
+
+        :param name: Name of the phase
+        :param wall: Wall time of the run in seconds
+        :param cpu: CPU time of the run in seconds
+        :param peak: Peak memory of the run in bytes or None if it was not traced
+        """
+        with self._lock:
+            stats = self.phases.setdefault(name, PhaseStats(name, peak_memory=peak))
+            stats.calls += 1
+            stats.wall_seconds += wall
+            stats.cpu_seconds += cpu
+            if peak is not None:
+                stats.peak_memory = max(stats.peak_memory or 0, peak)
+
+    def print_summary(self, total: PhaseStats) -> None:
+        """
+        Print a table containing the measurements of all phases in the order they first ran in.
+
+        :param total: Measurements of the whole profiled run
+        """
+        table = Table(
+            title="[bold]Profile summary",
+            title_style="blue",
+            header_style=Style(color="blue", bold=True),
+            box=HEAVY_HEAD,
+        )
+        table.add_column("Phase", justify="left", style="green")
+        table.add_column("Calls", justify="right")
+        table.add_column("Wall time (s)", justify="right")
+        table.add_column("CPU time (s)", justify="right")
+        table.add_column("Peak memory (MB)", justify="right")
+
+        for stats in [*self.phases.values(), total]:
+            table.add_row(
+                stats.name if stats is not total else "[bold]total",
+                str(stats.calls),
+                f"{stats.wall_seconds:.3f}",
+                f"{stats.cpu_seconds:.3f}",
+                f"{stats.peak_memory / 1024 ** 2:.1f}" if stats.peak_memory is not None else "-",
+            )
+
+        console.print(table)
+
+
+# the profiler shared by all commands of this process
+profiler = PhaseProfiler()
+
+
+def profile_phase(name: str):
+    """
+    Measure a named phase with the shared profiler. Usable as context manager or as decorator.
+
+    :param name: Name of the phase (e.g. render or lint)
+    """
+    return profiler.phase(name)
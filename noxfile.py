@@ -119,12 +119,33 @@ def tests(session: Session) -> None:
     session.install(".")
     session.install("coverage[toml]", "pytest", "pytest-mock", "pygments", "ruamel.yaml")
     try:
-        session.run("coverage", "run", "--parallel", "-m", "pytest", "--ignore-glob=**/templates/*", *session.posargs)
+        session.run(
+            "coverage",
+            "run",
+            "--parallel",
+            "-m",
+            "pytest",
+            "--ignore-glob=**/templates/*",
+            "--ignore=tests/benchmarks",
+            *session.posargs,
+        )
     finally:
         if session.interactive:
             session.notify("coverage")
 
 
+@session(python=python_versions)
+def benchmarks(session: Session) -> None:
+    """Run the benchmark suite and store the results as JSON in .benchmarks."""
+    args = session.posargs or ["--benchmark-autosave"]
+    # compare against the previous run (if any) and fail on considerable regressions
+    if not session.posargs and Path(".benchmarks").is_dir():
+        args += ["--benchmark-compare", "--benchmark-compare-fail=mean:25%"]
+    session.install(".")
+    session.install("pytest", "pytest-benchmark", "ruamel.yaml")
+    session.run("pytest", "tests/benchmarks", "--benchmark-storage=.benchmarks", "--benchmark-sort=name", *args)
+
+
 @session
 def coverage(session: Session) -> None:
     """Produce the coverage report."""
@@ -0,0 +1,98 @@
+from pathlib import Path
+from typing import Callable, Iterator
+
+import pytest
+
+from cookietemple.create.create import choose_domain
+
+# name of every benchmarked project
+PROJECT_NAME = "benchmarkproject"
+
+WEBSITE_DOT_COOKIETEMPLE = {
+    "domain": "web",
+    "language": "python",
+    "webtype": "website",
+    "web_framework": "flask",
+    "url": "springfield.com",
+    "vmusername": "homer",
+    "command_line_interface": "Click",
+    "testing_library": "pytest",
+}
+
+# the headless .cookietemple.yml specifications of every benchmarked template handle
+DOT_COOKIETEMPLES = {
+    "cli-python": {
+        "domain": "cli",
+        "language": "python",
+        "command_line_interface": "Click",
+        "testing_library": "pytest",
+    },
+    "cli-java": {"domain": "cli", "language": "java", "group_domain": "com", "group_organization": "springfield"},
+    "gui-java": {"domain": "gui", "language": "java", "organization": "springfield"},
+    "lib-cpp": {"domain": "lib", "language": "cpp"},
+    "web-website-python-basic": {
+        **WEBSITE_DOT_COOKIETEMPLE,
+        "setup_type": "basic",
+        "use_frontend": True,
+        "frontend": "solidstate",
+    },
+    "web-website-python-advanced": {
+        **WEBSITE_DOT_COOKIETEMPLE,
+        "setup_type": "advanced",
+        "use_frontend": False,
+        "frontend": "none",
+    },
+    "pub-thesis-latex": {
+        "domain": "pub",
+        "language": "latex",
+        "pubtype": "thesis",
+        "author": "Homer Simpson",
+        "title": "Donuts",
+        "university": "Springfield University",
+        "department": "Nuclear Physics",
+        "degree": "PhD",
+    },
+}
+
+
+@pytest.fixture(scope="module", autouse=True)
+def headless_creation() -> Iterator[None]:
+    """
+    Never look up project names online and always render the templates instead of copying cached renderings.
+    """
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("COOKIETEMPLE_OFFLINE", "1")
+        monkeypatch.setenv("COOKIETEMPLE_NO_RENDER_CACHE", "1")
+        yield
+
+
+@pytest.fixture(params=sorted(DOT_COOKIETEMPLES))
+def handle(request) -> str:
+    """
+    Every benchmarked template handle.
+    """
+    return request.param
+
+
+@pytest.fixture(scope="session")
+def create_project(general_answers) -> Callable[[str, Path], Path]:
+    """
+    Create a project of a template handle without any prompts.
+    The returned function takes one of the benchmarked handles and the directory to create the project in
+    and returns the path to the created project.
+    """
+
+    def create(handle: str, output_root: Path) -> Path:
+        dot_cookietemple = {**general_answers, "project_name": PROJECT_NAME, **DOT_COOKIETEMPLES[handle]}
+        choose_domain(output_root, None, dot_cookietemple, output_root=output_root)
+        return output_root / PROJECT_NAME
+
+    return create
+
+
+@pytest.fixture(scope="module")
+def cli_python_project(tmp_path_factory, create_project) -> Path:
+    """
+    A freshly created cli-python project.
+    """
+    return create_project("cli-python", tmp_path_factory.mktemp("cli_python"))
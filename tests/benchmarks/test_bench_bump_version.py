@@ -0,0 +1,49 @@
+import itertools
+
+import pytest
+
+from cookietemple.bump_version.bump_version import VersionBumper
+
+pytest.importorskip("pytest_benchmark")
+
+# number of whitelisted files containing the project version
+WHITELISTED_FILES = 1000
+
+
+@pytest.fixture
+def bump_project(tmp_path):
+    """
+    A project with thousands of whitelisted files, each containing several versions.
+    """
+    files = []
+    for i in range(WHITELISTED_FILES):
+        path = f"src/package_{i // 100}/file_{i}.py"
+        (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / path).write_text(
+            '__version__ = "0.1.0"\n'
+            + "print('unrelated line')\n" * 50
+            + "release = 0.1.0  # <<COOKIETEMPLE_NO_BUMP>>\n"
+        )
+        files.append(f"file_{i} = {path}")
+    newline = "\n"
+    (tmp_path / "cookietemple.cfg").write_text(
+        f"[bumpversion]\ncurrent_version = 0.1.0\n\n[bumpversion_files_whitelisted]\n{newline.join(files)}\n\n"
+        "[bumpversion_files_blacklisted]\n"
+    )
+
+    return tmp_path
+
+
+def test_bench_bump_version(benchmark, bump_project) -> None:
+    """
+    Benchmark bumping the version of thousands of whitelisted files.
+    """
+    version_bumper = VersionBumper(bump_project, downgrade=False)
+    versions = (f"0.2.{patch}" for patch in itertools.count())
+
+    benchmark.pedantic(
+        lambda: version_bumper.bump_template_version(next(versions), bump_project, create_tag=False), rounds=3
+    )
+
+    # the number of rounds depends on the options (e.g. --benchmark-disable runs the benchmark only once)
+    assert '__version__ = "0.1.0"' not in (bump_project / "src" / "package_0" / "file_0.py").read_text()
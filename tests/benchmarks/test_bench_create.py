@@ -0,0 +1,21 @@
+import itertools
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+
+def test_bench_create(benchmark, tmp_path, create_project, handle) -> None:
+    """
+    Benchmark the headless creation of a project (rendering, linting and all common operations) per template handle.
+    """
+    output_roots = (tmp_path / str(round) for round in itertools.count())
+
+    def setup():
+        output_root = next(output_roots)
+        output_root.mkdir()
+        return (handle, output_root), {}
+
+    project_dir = benchmark.pedantic(create_project, setup=setup, rounds=3)
+
+    assert (project_dir / ".cookietemple.yml").is_file()
@@ -0,0 +1,43 @@
+import shutil
+
+import pytest
+
+from cookietemple.lint.lint import lint_project
+
+pytest.importorskip("pytest_benchmark")
+
+# number of generated files in the synthetic huge project
+HUGE_PROJECT_FILES = 2000
+
+
+@pytest.fixture(scope="module")
+def huge_project(tmp_path_factory, cli_python_project):
+    """
+    A cli-python project with thousands of additional source, documentation and data files.
+    """
+    project_dir = tmp_path_factory.mktemp("huge") / cli_python_project.name
+    shutil.copytree(cli_python_project, project_dir)
+    for i in range(HUGE_PROJECT_FILES):
+        module_dir = project_dir / cli_python_project.name / f"module_{i // 100}"
+        module_dir.mkdir(exist_ok=True)
+        (module_dir / f"file_{i}.py").write_text(
+            "".join(f"def function_{j}(x: int) -> int:\n    return x * {j}\n\n\n" for j in range(50))
+        )
+        (project_dir / "docs" / f"page_{i}.rst").write_text(f"Page {i}\n=======\n\n" + "Some text.\n" * 100)
+
+    return project_dir
+
+
+def test_bench_lint_small_project(benchmark, cli_python_project) -> None:
+    """
+    Benchmark linting a freshly created project.
+    """
+    # lint_project exits with a non-zero exit code if any check fails
+    benchmark(lint_project, str(cli_python_project))
+
+
+def test_bench_lint_huge_project(benchmark, huge_project) -> None:
+    """
+    Benchmark linting a project with thousands of files.
+    """
+    benchmark.pedantic(lint_project, args=(str(huge_project),), rounds=3)
@@ -0,0 +1,44 @@
+import random
+import string
+
+import pytest
+
+from cookietemple.common.levensthein_dist import most_similar_command
+from cookietemple.common.suggest_similar_commands import load_available_handles
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.fixture(scope="module")
+def large_handle_set():
+    """
+    All available handles together with thousands of random handles.
+    """
+    rng = random.Random(42)
+    handles = set(load_available_handles())
+    while len(handles) < 2000:
+        handles.add("-".join("".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 10))) for _ in range(3)))
+
+    return handles
+
+
+def test_bench_most_similar_command_available_handles(benchmark) -> None:
+    """
+    Benchmark suggesting a handle for a mistyped handle out of all available handles.
+    """
+    handles = load_available_handles()
+
+    similar_handles, action = benchmark(most_similar_command, "cli-pyton", handles)
+
+    assert similar_handles == ["cli-python"] and action == "use"
+
+
+def test_bench_most_similar_command_large_handle_set(benchmark, large_handle_set) -> None:
+    """
+    Benchmark suggesting a handle for a mistyped handle out of a large set of handles.
+    """
+    similar_handles, _ = benchmark.pedantic(
+        most_similar_command, args=("web-website-pyhton", large_handle_set), rounds=3
+    )
+
+    assert "web-website-python" in similar_handles
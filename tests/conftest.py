@@ -0,0 +1,54 @@
+from typing import Iterator
+
+import pytest
+
+from cookietemple.create.bytecode_cache import TemplateBytecodeCache
+from cookietemple.create.render_cache import RenderCache
+
+
+@pytest.fixture(scope="session", autouse=True)
+def isolated_caches(tmp_path_factory) -> Iterator[None]:
+    """
+    Keep the compiled templates and the cached renderings of all tests out of the user's cache directory.
+    """
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(TemplateBytecodeCache, "CACHE_DIR", str(tmp_path_factory.mktemp("jinja")))
+        monkeypatch.setattr(RenderCache, "CACHE_DIR", str(tmp_path_factory.mktemp("render")))
+        yield
+
+
+@pytest.fixture(scope="session")
+def general_answers() -> dict:
+    """
+    The answers to all prompts every template asks, in the format of a .cookietemple.yml file.
+    Shared by all tests, so copy it (like {**general_answers, "project_name": "shelbyville"}) instead of changing it.
+    """
+    return {
+        "full_name": "Homer Simpson",
+        "email": "homer.simpson@example.com",
+        "project_name": "springfield",
+        "project_short_description": "Exploding Springfield",
+        "version": "0.1.0",
+        "license": "MIT",
+        "github_username": "homer",
+        "creator_github_username": "homer",
+        "is_github_repo": False,
+        "is_repo_private": False,
+        "is_github_orga": False,
+        "github_orga": "",
+    }
+
+
+@pytest.fixture(scope="session")
+def cli_python_answers(general_answers) -> dict:
+    """
+    The answers to all prompts of the cli-python template, in the format of a .cookietemple.yml file.
+    Shared by all tests, so copy it instead of changing it.
+    """
+    return {
+        **general_answers,
+        "domain": "cli",
+        "language": "python",
+        "command_line_interface": "Click",
+        "testing_library": "pytest",
+    }
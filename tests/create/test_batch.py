@@ -0,0 +1,73 @@
+import os
+
+from click.testing import CliRunner
+from ruamel.yaml import YAML
+
+from cookietemple.__main__ import create
+from cookietemple.create.batch import BatchCreator
+
+
+def test_expand_spec_patterns(tmp_path) -> None:
+    """
+    Ensure that paths and glob patterns are expanded into a sorted list of unique specification files.
+    """
+    for name in ["b.yml", "a.yml", "c.txt"]:
+        (tmp_path / name).write_text("domain: cli")
+    (tmp_path / "dir.yml").mkdir()
+
+    specs = BatchCreator.expand_spec_patterns([f"{tmp_path}/*.yml", f"{tmp_path}/a.yml"])
+
+    assert specs == [str(tmp_path / "a.yml"), str(tmp_path / "b.yml")]
+
+
+def test_expand_spec_patterns_no_match(tmp_path) -> None:
+    """
+    Patterns without any matching specification file are skipped.
+    """
+    assert BatchCreator.expand_spec_patterns([f"{tmp_path}/*.yml"]) == []
+
+
+def test_batch_create(tmp_path, mocker, cli_python_answers) -> None:
+    """
+    Ensure that every specification is created by the worker pool, failed creations are reported
+    and the command exits with an error if any creation failed.
+    """
+    specs_dir = tmp_path / "specs"
+    specs_dir.mkdir()
+    specs = {
+        "springfield": cli_python_answers,
+        "shelbyville": {**cli_python_answers, "project_name": "shelbyville", "domain": "nuclear"},
+        # creates the same project directory as springfield
+        "springfield_again": {**cli_python_answers, "license": "GNUv3"},
+    }
+    for name, spec in specs.items():
+        with open(specs_dir / f"{name}.yml", "w") as f:
+            YAML().dump(spec, f)
+    create_ = mocker.spy(BatchCreator, "create")
+
+    result = CliRunner().invoke(
+        create,
+        [
+            str(tmp_path / "projects"),
+            "--batch",
+            f"{specs_dir}/*.yml",
+            "--jobs",
+            "2",
+            "--log-dir",
+            str(tmp_path / "logs"),
+            "--offline",
+        ],
+    )
+
+    assert result.exit_code == 1
+    results = create_.spy_return
+    assert [(result.project, result.status) for result in results] == [
+        ("shelbyville", "failed"),
+        ("springfield", "created"),
+        ("springfield", "failed"),
+    ]
+    assert results[0].message and os.path.dirname(results[0].log_file) == str(tmp_path / "logs")
+    assert os.path.isfile(results[0].log_file)
+    assert "springfield.yml" in results[2].message and not results[2].log_file
+    assert (tmp_path / "projects" / "springfield" / ".cookietemple.yml").is_file()
+    assert not (tmp_path / "projects" / "shelbyville").exists()
@@ -0,0 +1,66 @@
+from jinja2 import DictLoader, Environment
+
+from cookietemple.create.bytecode_cache import TemplateBytecodeCache
+from cookietemple.template_tools.compile import TemplateCompiler
+
+
+def test_bytecode_cache_is_reused(tmp_path) -> None:
+    """
+    Ensure that compiled templates are stored once and loaded by other environments with the same configuration.
+    """
+    cache = TemplateBytecodeCache(str(tmp_path))
+    loader = DictLoader({"README.rst": "{{ name }}"})
+
+    Environment(loader=loader, bytecode_cache=cache).get_template("README.rst")
+    entries = list(tmp_path.iterdir())
+    assert len(entries) == 1
+
+    template = Environment(loader=loader, bytecode_cache=cache).get_template("README.rst")
+    assert list(tmp_path.iterdir()) == entries
+    assert template.render(name="Homer") == "Homer"
+
+
+def test_bytecode_cache_key_depends_on_source_and_environment(tmp_path) -> None:
+    """
+    Ensure that changed template files and differently configured environments do not share bytecode.
+    """
+    cache = TemplateBytecodeCache(str(tmp_path))
+
+    Environment(loader=DictLoader({"README.rst": "{{ name }}"}), bytecode_cache=cache).get_template("README.rst")
+    Environment(loader=DictLoader({"README.rst": "{{ name }}!"}), bytecode_cache=cache).get_template("README.rst")
+    Environment(
+        loader=DictLoader({"README.rst": "{{ name }}"}), bytecode_cache=cache, keep_trailing_newline=True
+    ).get_template("README.rst")
+
+    assert len(list(tmp_path.iterdir())) == 3
+
+
+def test_bytecode_cache_memory_is_bounded(tmp_path, monkeypatch) -> None:
+    """
+    Ensure that only the most recently used compiled templates are kept in memory.
+    """
+    monkeypatch.setattr(TemplateBytecodeCache, "MEMORY", TemplateBytecodeCache.MEMORY.__class__())
+    monkeypatch.setattr(TemplateBytecodeCache, "MEMORY_SIZE", 2)
+    environment = Environment(
+        loader=DictLoader({f"{name}.rst": f"{{{{ {name} }}}}" for name in ["homer", "marge", "bart"]}),
+        bytecode_cache=TemplateBytecodeCache(str(tmp_path)),
+    )
+
+    for name in ["homer", "marge", "homer", "bart"]:
+        environment.get_template(f"{name}.rst")
+
+    assert len(TemplateBytecodeCache.MEMORY) == 2
+    # marge was used least recently
+    assert environment.get_template("marge.rst").render(marge="Marge") == "Marge"
+    assert len(TemplateBytecodeCache.MEMORY) == 2
+
+
+def test_find_templates() -> None:
+    """
+    Ensure that all shipped templates including the common files are found.
+    """
+    templates = [template.split("templates/")[-1] for template in TemplateCompiler.find_templates()]
+
+    assert "common_files" in templates
+    assert "cli/cli_python" in templates
+    assert "web/website_python/flask" in templates
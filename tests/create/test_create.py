@@ -0,0 +1,130 @@
+import os
+import stat
+import tarfile
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from cookietemple.create import template_creator
+from cookietemple.create.create import choose_domain, create_archive
+from cookietemple.create.domains.cli_creator import CliCreator
+from cookietemple.create.sinks import MemorySink
+
+
+def test_create_projects_in_parallel_threads(tmp_path, cli_python_answers) -> None:
+    """
+    Ensure that several projects can be created concurrently in one process without depending on the current working directory.
+    """
+    cwd = os.getcwd()
+    names = ["springfield", "shelbyville"]
+
+    def create(name: str) -> None:
+        output_root = tmp_path / name
+        output_root.mkdir()
+        choose_domain(output_root, None, {**cli_python_answers, "project_name": name}, output_root=output_root)
+
+    with ThreadPoolExecutor(max_workers=len(names)) as executor:
+        list(executor.map(create, names))
+
+    assert os.getcwd() == cwd
+    for name in names:
+        project_dir = tmp_path / name / name
+        assert (project_dir / ".cookietemple.yml").is_file()
+        assert (project_dir / name / "__main__.py").is_file()
+        # common files are rendered into the project as well
+        assert (project_dir / "LICENSE").is_file()
+
+
+def test_create_project_in_memory(tmp_path, cli_python_answers) -> None:
+    """
+    Ensure that a project rendered into a memory sink contains all files, but nothing is written to disk.
+    """
+    sink = MemorySink()
+
+    choose_domain(tmp_path, None, cli_python_answers, tmp_path, sink=sink)
+
+    assert list(tmp_path.iterdir()) == []
+    assert os.path.join("springfield", "__main__.py") in sink.files
+    assert b"project_name: springfield" in sink.files[".cookietemple.yml"].content
+    # the title underline of the docs is fixed while rendering
+    title, underline = sink.files[os.path.join("docs", "index.rst")].content.decode("utf-8").splitlines()[:2]
+    assert len(underline) == len(title) + 1 and set(underline) == {"="}
+
+
+def test_create_project_into_archives(tmp_path, monkeypatch, cli_python_answers) -> None:
+    """
+    Ensure that a project is streamed into tar.gz and zip archives containing the project directory, without writing it to disk.
+    """
+    monkeypatch.chdir(tmp_path)
+    dot_cookietemple = cli_python_answers
+
+    create_archive("springfield.tar.gz", None, dot_cookietemple)
+    create_archive("springfield.zip", None, dot_cookietemple)
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["springfield.tar.gz", "springfield.zip"]
+    with tarfile.open(tmp_path / "springfield.tar.gz") as tar:
+        tar_members = {member.name: member for member in tar.getmembers()}
+        assert tar_members["springfield"].isdir()
+        assert tar_members["springfield/springfield/__main__.py"].isfile()
+        assert b"project_name: springfield" in tar.extractfile("springfield/.cookietemple.yml").read()  # type: ignore
+    with zipfile.ZipFile(tmp_path / "springfield.zip") as zf:
+        zip_members = {info.filename: info for info in zf.infolist()}
+        # both archives contain the same files with the same permissions
+        assert {name for name, member in tar_members.items() if member.isfile()} == {
+            name for name in zip_members if not name.endswith("/")
+        }
+        assert stat.S_IMODE(zip_members["springfield/springfield/__main__.py"].external_attr >> 16) == (
+            tar_members["springfield/springfield/__main__.py"].mode
+        )
+
+
+def test_github_repository_is_set_up_in_the_background(tmp_path, mocker) -> None:
+    """
+    Ensure that the Github repository, its labels, secret and topic are created in the background
+    and that the project is only pushed once all of them are done.
+    """
+    order = []
+    mocker.patch.object(template_creator, "github_access_token", return_value="token")
+    mocker.patch.object(template_creator, "create_github_repository", side_effect=lambda ctx, token: "repository")
+    mocker.patch.object(
+        template_creator, "create_github_labels", side_effect=lambda repo, labels: order.append(f"labels of {repo}")
+    )
+    mocker.patch.object(template_creator, "create_sync_secret", side_effect=lambda *args: order.append("secret"))
+    mocker.patch.object(template_creator, "create_ct_topic", side_effect=lambda *args: order.append("topic"))
+    push = mocker.patch.object(
+        template_creator, "push_github_repository", side_effect=lambda *args: order.append("push")
+    )
+    creator = CliCreator(tmp_path)
+    creator.creator_ctx.is_github_repo = True
+    creator.creator_ctx.project_slug = "springfield"
+
+    creator.start_github_phases()
+    creator.push_github_repository(str(tmp_path / "springfield"))
+
+    assert sorted(order[:3]) == ["labels of repository", "secret", "topic"] and order[3:] == ["push"]
+    assert push.call_args.args[3] == "token"
+
+
+def test_github_repository_is_deleted_if_linting_fails(tmp_path, mocker) -> None:
+    """
+    Ensure that the Github repository is only created for a rendered project and deleted again if linting fails.
+    """
+    repository = mocker.Mock()
+    mocker.patch.object(template_creator, "github_access_token", return_value="token")
+    create_repository = mocker.patch.object(template_creator, "create_github_repository", return_value=repository)
+    for name in ["create_github_labels", "create_sync_secret", "create_ct_topic"]:
+        mocker.patch.object(template_creator, name)
+    mocker.patch.object(template_creator, "lint_project", side_effect=SystemExit(1))
+    push = mocker.patch.object(template_creator, "push_github_repository")
+    creator = CliCreator(tmp_path)
+    creator.creator_ctx.is_github_repo = True
+    creator.creator_ctx.project_slug = "springfield"
+    mocker.patch.object(creator, "create_dot_cookietemple")
+
+    with pytest.raises(SystemExit):
+        creator.process_common_operations(domain="cli", language="python")
+
+    create_repository.assert_called_once()
+    repository.delete.assert_called_once()
+    push.assert_not_called()
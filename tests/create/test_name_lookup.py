@@ -0,0 +1,51 @@
+import pytest
+
+from cookietemple.create.name_lookup import NameLookup
+
+
+def test_lookup_offline(tmp_path, mocker) -> None:
+    """
+    Ensure that no request is made in offline mode.
+    """
+    query = mocker.patch.object(NameLookup, "query")
+
+    assert NameLookup(True, f"{tmp_path}/cache.json").lookup("springfield", ["PyPi", "readthedocs.io"]) == {
+        "PyPi": False,
+        "readthedocs.io": False,
+    }
+    query.assert_not_called()
+
+
+def test_lookup_is_cached(tmp_path, mocker) -> None:
+    """
+    Ensure that definite lookups are cached, while unreachable hosts are asked again.
+    """
+    query = mocker.patch.object(NameLookup, "query", side_effect=lambda host, name: True if host == "PyPi" else None)
+    name_lookup = NameLookup(False, f"{tmp_path}/cache.json")
+
+    assert name_lookup.lookup("springfield", ["PyPi", "readthedocs.io"]) == {"PyPi": True, "readthedocs.io": False}
+    assert name_lookup.lookup("springfield", ["PyPi", "readthedocs.io"]) == {"PyPi": True, "readthedocs.io": False}
+    assert [call.args for call in query.call_args_list].count(("PyPi", "springfield")) == 1
+    assert [call.args for call in query.call_args_list].count(("readthedocs.io", "springfield")) == 2
+
+
+def test_lookup_quietly(tmp_path, mocker) -> None:
+    """
+    Ensure that lookups running in the background return their messages instead of printing them.
+    """
+    mocker.patch.object(NameLookup, "query", return_value=None)
+    print_ = mocker.patch("cookietemple.create.name_lookup.console.print")
+
+    results, messages = NameLookup(False, f"{tmp_path}/cache.json").lookup_quietly("springfield", ["PyPi"])
+
+    assert results == {"PyPi": False}
+    assert len(messages) == 2 and "unreachable" in messages[1]
+    print_.assert_not_called()
+
+
+def test_lookup_invalid_host(tmp_path) -> None:
+    """
+    Ensure that only PyPi and readthedocs.io are valid hosts.
+    """
+    with pytest.raises(ValueError):
+        NameLookup(False, f"{tmp_path}/cache.json").lookup("springfield", ["crates.io"])
@@ -0,0 +1,82 @@
+import os
+import stat
+
+from cookietemple.create.render_cache import RenderCache
+
+
+def make_template(path) -> str:
+    """
+    Create a minimal template source tree.
+    """
+    os.makedirs(f"{path}/{{{{cookiecutter.project_slug}}}}")
+    with open(f"{path}/cookiecutter.json", "w") as fh:
+        fh.write('{"project_slug": "slug"}')
+    with open(f"{path}/{{{{cookiecutter.project_slug}}}}/README.rst", "w") as fh:
+        fh.write("{{ cookiecutter.project_slug }}")
+    return str(path)
+
+
+def test_key_depends_on_template_and_context(tmp_path) -> None:
+    """
+    The same template rendered with the same context must always result in the same key.
+    """
+    template = make_template(tmp_path / "template")
+    other_template = make_template(tmp_path / "other_template")
+    with open(f"{other_template}/cookiecutter.json", "a") as fh:
+        fh.write("\n")
+    render_cache = RenderCache(cache_dir=str(tmp_path / "cache"))
+
+    assert render_cache.key(template, {"project_slug": "a"}) == render_cache.key(template, {"project_slug": "a"})
+    assert render_cache.key(template, {"project_slug": "a"}) != render_cache.key(template, {"project_slug": "b"})
+    assert render_cache.key(template, {"project_slug": "a"}) != render_cache.key(other_template, {"project_slug": "a"})
+
+
+def test_put_and_materialize(tmp_path) -> None:
+    """
+    A stored rendering is materialized into the output directory, unknown keys are cache misses.
+    """
+    render_cache = RenderCache(cache_dir=str(tmp_path / "cache"))
+    render_cache.enabled = True
+    os.makedirs(tmp_path / "rendered" / "slug" / "docs")
+    (tmp_path / "rendered" / "slug" / "docs" / "index.rst").write_text("slug")
+
+    render_cache.put("key", str(tmp_path / "rendered" / "slug"))
+
+    assert not render_cache.materialize("unknown", str(tmp_path / "output"))
+    assert render_cache.materialize("key", str(tmp_path / "output"))
+    assert (tmp_path / "output" / "slug" / "docs" / "index.rst").read_text() == "slug"
+
+
+def test_materialize_keeps_output_dir_permissions(tmp_path) -> None:
+    """
+    Materializing into an existing directory must not change its permissions to the ones of the private cache entry.
+    """
+    render_cache = RenderCache(cache_dir=str(tmp_path / "cache"))
+    render_cache.enabled = True
+    os.makedirs(tmp_path / "rendered" / "slug")
+    (tmp_path / "rendered" / "slug" / "README.rst").write_text("slug")
+    render_cache.put("key", str(tmp_path / "rendered" / "slug"))
+    output = tmp_path / "output"
+    output.mkdir()
+    os.chmod(output, 0o755)
+
+    assert render_cache.materialize("key", str(output))
+    assert (output / "slug" / "README.rst").read_text() == "slug"
+    assert stat.S_IMODE(os.stat(output).st_mode) == 0o755
+
+
+def test_evict_least_recently_used(tmp_path) -> None:
+    """
+    Renderings exceeding the size cap are evicted, starting with the least recently used one.
+    """
+    render_cache = RenderCache(cache_dir=str(tmp_path / "cache"), max_size_mb=1)
+    render_cache.enabled = True
+    for key in ["old", "new"]:
+        os.makedirs(tmp_path / key / "slug", exist_ok=True)
+        (tmp_path / key / "slug" / "big").write_bytes(b"0" * 700 * 1024)
+        render_cache.put(key, str(tmp_path / key / "slug"))
+        os.utime(tmp_path / "cache" / key, (0, 0) if key == "old" else None)
+    render_cache.evict()
+
+    assert not (tmp_path / "cache" / "old").exists()
+    assert (tmp_path / "cache" / "new").exists()
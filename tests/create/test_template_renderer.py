@@ -0,0 +1,192 @@
+import json
+import os
+import shutil
+import stat
+
+from cookietemple.create.sinks import MemorySink
+from cookietemple.create.template_renderer import TemplateLayer, TemplateRenderer
+from cookietemple.create.template_source import PACK_SUFFIX, PackSource, open_template_source, write_pack
+
+
+def make_template(template_path, context: dict, files: dict) -> str:
+    """
+    Write a cookiecutter template with the given context and files (relative to the templated directory).
+    """
+    template_path.mkdir()
+    (template_path / "cookiecutter.json").write_text(json.dumps(context))
+    for name, content in files.items():
+        file = template_path / "{{cookiecutter.dir_name}}" / name
+        file.parent.mkdir(parents=True, exist_ok=True)
+        file.write_text(content)
+
+    return str(template_path)
+
+
+def test_render_layers_into_single_project(tmp_path) -> None:
+    """
+    Ensure that all layers are merged into the project directory of the first layer and later layers win.
+    """
+    main = make_template(
+        tmp_path / "main",
+        {"dir_name": "project", "name": "Homer", "_copy_without_render": ["*.html"]},
+        {
+            "README.rst": "{{ cookiecutter.name }}\n",
+            "LICENSE": "main license\n",
+            "{{cookiecutter.name}}.py": "print('{{ cookiecutter.name }}')\r\n",
+            "templates/index.html": "{{ not rendered }}",
+        },
+    )
+    common = make_template(
+        tmp_path / "common",
+        {"dir_name": "common_files_util", "name": "Marge"},
+        {"LICENSE": "{{ cookiecutter.name }} license\n", "docs/index.rst": "docs\n"},
+    )
+    os.chmod(f"{main}/{{{{cookiecutter.dir_name}}}}/README.rst", 0o755)
+    output_dir = tmp_path / "out"
+
+    project_dir = TemplateRenderer(
+        [TemplateLayer(main, {"name": "Bart"}), TemplateLayer(common, {"name": "Lisa"})]
+    ).render(str(output_dir))
+
+    assert project_dir == str(output_dir / "project")
+    assert not (output_dir / "common_files_util").exists()
+    assert (output_dir / "project" / "README.rst").read_text() == "Bart\n"
+    assert (output_dir / "project" / "README.rst").stat().st_mode & stat.S_IXUSR
+    assert (output_dir / "project" / "LICENSE").read_text() == "Lisa license\n"
+    assert (output_dir / "project" / "docs" / "index.rst").read_text() == "docs\n"
+    assert (output_dir / "project" / "templates" / "index.html").read_text() == "{{ not rendered }}"
+    # the newline style of the template file is preserved
+    assert (output_dir / "project" / "Bart.py").read_bytes() == b"print('Bart')\r\n"
+
+
+def test_static_assets_are_copied_verbatim(tmp_path) -> None:
+    """
+    Ensure that static assets are never rendered, even if they happen to contain jinja syntax, and keep their permissions.
+    """
+    main = make_template(
+        tmp_path / "main",
+        {"dir_name": "project"},
+        {"assets/logo.svg": "<svg>{{ not rendered }}{# no comment</svg>", "gradlew.jar": "{% binary %}"},
+    )
+    os.chmod(f"{main}/{{{{cookiecutter.dir_name}}}}/gradlew.jar", 0o755)
+    output_dir = tmp_path / "out"
+
+    TemplateRenderer([TemplateLayer(main, {})]).render(str(output_dir))
+
+    assert (output_dir / "project" / "assets" / "logo.svg").read_text() == "<svg>{{ not rendered }}{# no comment</svg>"
+    assert (output_dir / "project" / "gradlew.jar").read_text() == "{% binary %}"
+    assert (output_dir / "project" / "gradlew.jar").stat().st_mode & stat.S_IXUSR
+
+
+def test_copied_directories_keep_their_permissions(tmp_path) -> None:
+    """
+    Ensure that directories copied without rendering keep the permissions of their source directories like cookiecutter's copytree,
+    while rendered directories get the default ones.
+    """
+    main = make_template(
+        tmp_path / "main",
+        {"dir_name": "project", "_copy_without_render": ["figures"]},
+        {"figures/raster/plot.png": "png", "docs/index.rst": "docs\n"},
+    )
+    os.chmod(f"{main}/{{{{cookiecutter.dir_name}}}}/figures/raster", 0o775)
+    os.chmod(f"{main}/{{{{cookiecutter.dir_name}}}}/docs", 0o775)
+    output_dir = tmp_path / "out"
+    umask = os.umask(0o022)
+    try:
+        TemplateRenderer([TemplateLayer(main, {})]).render(str(output_dir))
+    finally:
+        os.umask(umask)
+
+    assert stat.S_IMODE((output_dir / "project" / "figures" / "raster").stat().st_mode) == 0o775
+    assert stat.S_IMODE((output_dir / "project" / "docs").stat().st_mode) == 0o755
+
+
+def test_excluded_and_remapped_paths(tmp_path) -> None:
+    """
+    Ensure that excluded paths are never rendered or written and remapped paths win over files at their target path.
+    """
+    main = make_template(
+        tmp_path / "main",
+        {"dir_name": "project"},
+        {
+            "app/templates/index.html": "default index\n",
+            "app/auth/views.py": "{{ cookiecutter.undefined }}",
+            "themes/solid/index.html": "solid index\n",
+            "themes/solid/assets/main.css": "body {}\n",
+            "themes/other/index.html": "{{ cookiecutter.undefined }}",
+        },
+    )
+    output_dir = tmp_path / "out"
+    layer = TemplateLayer(
+        main,
+        {},
+        remap={"themes/solid/assets": "app/static/assets", "themes/solid/index.html": "app/templates/index.html"},
+        exclude={"themes", "app/auth"},
+    )
+
+    TemplateRenderer([layer]).render(str(output_dir))
+
+    project_dir = output_dir / "project"
+    assert not (project_dir / "themes").exists()
+    assert not (project_dir / "app" / "auth").exists()
+    assert (project_dir / "app" / "templates" / "index.html").read_text() == "solid index\n"
+    assert (project_dir / "app" / "static" / "assets" / "main.css").read_text() == "body {}\n"
+
+
+def test_render_into_memory_sink(tmp_path) -> None:
+    """
+    Ensure that a project can be rendered into memory and postprocessors transform the rendered files.
+    """
+    main = make_template(
+        tmp_path / "main",
+        {"dir_name": "project", "name": "Homer"},
+        {"README.rst": "{{ cookiecutter.name }}\n", "run.sh": "echo {{ cookiecutter.name }}\r\n"},
+    )
+    os.chmod(f"{main}/{{{{cookiecutter.dir_name}}}}/run.sh", 0o755)
+    sink = MemorySink()
+    layer = TemplateLayer(main, {}, postprocessors={"README.rst": str.upper})
+
+    project_dir = TemplateRenderer([layer]).render(str(tmp_path / "out"), sink)
+
+    assert project_dir == str(tmp_path / "out" / "project")
+    assert not (tmp_path / "out").exists()
+    assert sink.files["README.rst"].content == b"HOMER\n"
+    assert sink.files["run.sh"].content == b"echo Homer\r\n"
+    assert sink.files["run.sh"].mode == 0o755
+
+    sink.write_to(str(tmp_path / "written"))
+
+    assert (tmp_path / "written" / "run.sh").read_bytes() == b"echo Homer\r\n"
+    assert (tmp_path / "written" / "run.sh").stat().st_mode & stat.S_IXUSR
+
+
+def test_render_from_pack(tmp_path) -> None:
+    """
+    Ensure that rendering a packed template results in the very same project as rendering the template directory.
+    """
+    main = make_template(
+        tmp_path / "main",
+        {"dir_name": "project", "name": "Homer", "_copy_without_render": ["*.html", "static"]},
+        {
+            "README.rst": "{{ cookiecutter.name }}\n" * 100,
+            "{{cookiecutter.name}}.py": "print('{{ cookiecutter.name }}')\r\n",
+            "templates/index.html": "{{ not rendered }}",
+            "static/style.css": "{{ not rendered }}",
+            "logo.png": "\x89PNG{{ binary }}",
+        },
+    )
+    (tmp_path / "main" / "{{cookiecutter.dir_name}}" / "empty").mkdir()
+    os.chmod(f"{main}/{{{{cookiecutter.dir_name}}}}/README.rst", 0o755)
+    files, _ = write_pack(main, f"{main}{PACK_SUFFIX}")
+    directory_sink, pack_sink = MemorySink(), MemorySink()
+
+    TemplateRenderer([TemplateLayer(main, {"name": "Bart"})]).render(str(tmp_path / "out"), directory_sink)
+    shutil.rmtree(main)
+    TemplateRenderer([TemplateLayer(main, {"name": "Bart"})]).render(str(tmp_path / "out"), pack_sink)
+
+    assert files == 6
+    assert isinstance(open_template_source(main), PackSource)
+    assert pack_sink.dirs == directory_sink.dirs and "empty" in pack_sink.dirs
+    assert pack_sink.dir_modes == directory_sink.dir_modes and "static" in pack_sink.dir_modes
+    assert pack_sink.files == directory_sink.files
+    assert pack_sink.files["README.rst"].mode == 0o755
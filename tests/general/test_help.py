@@ -0,0 +1,14 @@
+from click.testing import CliRunner
+
+from cookietemple.__main__ import cookietemple_cli
+
+
+def test_main_help_lists_all_commands() -> None:
+    """
+    Ensure that every command is listed in the hand-written command overview of the main help.
+    """
+    result = CliRunner().invoke(cookietemple_cli, ["--help"])
+
+    assert result.exit_code == 0
+    for command in cookietemple_cli.commands:
+        assert f"\n  {command} " in result.output
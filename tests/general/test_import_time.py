@@ -0,0 +1,47 @@
+import subprocess
+import sys
+from typing import Dict, List
+
+import pytest
+
+# the total time importing modules may take for trivial commands
+IMPORT_BUDGET_SECONDS = 0.5
+# modules only the commands working with projects, templates or Github need
+HEAVY_MODULES = ["git", "github", "cookiecutter", "nacl", "cryptography", "requests", "questionary"]
+
+
+def import_times(args: List[str]) -> Dict[str, int]:
+    """
+    Run a cookietemple command (without the upgrade check of the entry point) with python -X importtime.
+
+    :param args: Arguments of the command
+    :return: The time importing every imported module took itself in microseconds
+    """
+    command = [
+        sys.executable,
+        "-X",
+        "importtime",
+        "-c",
+        "from cookietemple.__main__ import cookietemple_cli; cookietemple_cli()",
+    ]
+    # the first run may have to compile the modules
+    subprocess.run(command + args, capture_output=True, check=True)
+    stderr = subprocess.run(command + args, capture_output=True, check=True, text=True).stderr
+    times = {}
+    for line in stderr.splitlines():
+        if line.startswith("import time:") and not line.endswith("package"):
+            self_time, _, name = line[len("import time:") :].split("|")
+            times[name.strip()] = int(self_time)
+
+    return times
+
+
+@pytest.mark.parametrize("args", [["--version"], ["--help"], ["list"], ["info", "cli"], ["create", "--help"]])
+def test_trivial_commands_import_only_what_they_use(args: List[str]) -> None:
+    """
+    Ensure that trivial commands import none of the heavy dependencies and stay within the import time budget.
+    """
+    times = import_times(args)
+
+    assert [module for module in HEAVY_MODULES if module in times] == []
+    assert sum(times.values()) / 1_000_000 < IMPORT_BUDGET_SECONDS
@@ -0,0 +1,30 @@
+import os
+
+from cookietemple.common.template_registry import AVAILABLE_TEMPLATES_PATH, TemplateRegistry
+
+
+def test_registry_is_loaded_once() -> None:
+    """
+    Ensure that all callers share the very same registry, independent of how the path to the templates is spelled.
+    """
+    other_path = f"{os.path.dirname(AVAILABLE_TEMPLATES_PATH)}/../templates/available_templates.yml"
+
+    assert TemplateRegistry.get() is TemplateRegistry.get(AVAILABLE_TEMPLATES_PATH)
+    assert TemplateRegistry.get() is TemplateRegistry.get(other_path)
+
+
+def test_registry_indexes() -> None:
+    """
+    Ensure that the flattened templates can be looked up by handle, domain and language.
+    """
+    registry = TemplateRegistry.get()
+
+    web = registry.by_handle["web-website-python"]
+    assert (web.domain, web.subdomain, web.language, web.path) == ("web", "website", "python", "web/website_python")
+    assert registry.version("cli-python") == registry.available_templates["cli"]["python"]["version"]
+    assert registry.version("cli-cobol") == ""
+    assert {template.handle for template in registry.find("cli")} == {"cli-python", "cli-java"}
+    assert [template.handle for template in registry.find("web-website")] == ["web-website-python"]
+    assert registry.find("cl") == []
+    assert {"cli", "web", "web-website", "web-website-python", "pub-thesis"} <= registry.handles
+    assert "python" in registry.languages
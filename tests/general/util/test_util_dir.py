@@ -1,7 +1,8 @@
 import os
+import stat
 from pathlib import Path
 
-from cookietemple.util.dir_util import delete_dir_tree
+from cookietemple.util.dir_util import copy_file, delete_dir_tree
 
 
 def test_delete_dir_tree(tmp_path):
@@ -11,3 +12,34 @@ def test_delete_dir_tree(tmp_path):
     os.makedirs(f"{tmp_path}/testdir/my/deep/nested/directory")
     delete_dir_tree(Path(f"{tmp_path}/testdir"))
     assert len(list(tmp_path.iterdir())) == 0
+
+
+def test_copy_file_copies_content_and_permissions(tmp_path) -> None:
+    """
+    Ensure that a copied file has the same content and permissions as its source and stays independent of it.
+    """
+    src = tmp_path / "gradle-wrapper.jar"
+    src.write_bytes(os.urandom(256 * 1024))
+    os.chmod(src, 0o750)
+    dst = tmp_path / "copy.jar"
+
+    assert copy_file(str(src), str(dst)) == str(dst)
+
+    assert dst.read_bytes() == src.read_bytes()
+    assert stat.S_IMODE(dst.stat().st_mode) == 0o750
+    # the copy is never a hardlink
+    assert not os.path.samefile(src, dst)
+    dst.write_bytes(b"changed")
+    assert src.stat().st_size == 256 * 1024
+
+
+def test_copy_empty_file(tmp_path) -> None:
+    """
+    Ensure that empty files are copied as well.
+    """
+    src = tmp_path / "empty"
+    src.touch()
+
+    copy_file(str(src), str(tmp_path / "copy"))
+
+    assert (tmp_path / "copy").read_bytes() == b""
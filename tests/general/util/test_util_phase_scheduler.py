@@ -0,0 +1,63 @@
+import threading
+
+import pytest
+
+from cookietemple.util.phase_scheduler import PhaseScheduler
+
+
+def test_phases_wait_for_their_dependencies() -> None:
+    """
+    Ensure that a phase only starts after the phases it depends on, while independent phases run concurrently.
+    """
+    scheduler = PhaseScheduler()
+    release = threading.Event()
+    order = []
+
+    def repository() -> str:
+        release.wait(5)
+        order.append("repository")
+        return "springfield"
+
+    scheduler.start("repository", repository)
+    scheduler.start("labels", lambda: order.append(f"labels of {scheduler.join('repository')}"), after=["repository"])
+    # does not depend on the blocked repository phase
+    scheduler.start("lookup", lambda: order.append("lookup"))
+    scheduler.join("lookup")
+    release.set()
+    scheduler.join("labels")
+
+    assert order == ["lookup", "repository", "labels of springfield"]
+
+
+def test_failed_phases_fail_their_dependents() -> None:
+    """
+    Ensure that exceptions are raised again when joining a failed phase or a phase depending on it.
+    """
+    scheduler = PhaseScheduler()
+
+    def repository() -> None:
+        raise ConnectionError("offline")
+
+    scheduler.start("repository", repository)
+    scheduler.start("labels", lambda: None, after=["repository"])
+    scheduler.join_all()
+
+    for phase in ["repository", "labels"]:
+        with pytest.raises(ConnectionError):
+            scheduler.join(phase)
+
+
+def test_shutdown_waits_for_all_phases() -> None:
+    """
+    Ensure that shutting the scheduler down waits for the running phases, whose results can still be joined.
+    """
+    scheduler = PhaseScheduler()
+    release = threading.Event()
+    scheduler.start("repository", lambda: release.wait(5) and "springfield")
+    release.set()
+
+    scheduler.shutdown()
+
+    assert scheduler.join("repository") == "springfield"
+    with pytest.raises(RuntimeError):
+        scheduler.start("labels", lambda: None)
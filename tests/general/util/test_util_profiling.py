@@ -0,0 +1,74 @@
+import threading
+import tracemalloc
+
+import pytest
+
+from cookietemple.util.profiling import PhaseProfiler
+
+
+def test_phases_are_only_recorded_when_enabled() -> None:
+    """
+    Ensure that phases run while profiling is disabled are not recorded.
+    """
+    profiler = PhaseProfiler()
+    with profiler.phase("render"):
+        pass
+
+    assert profiler.phases == {}
+
+
+@pytest.mark.parametrize("reset_peak", [True, False])
+def test_phases_are_accumulated(tmp_path, monkeypatch, reset_peak: bool) -> None:
+    """
+    Ensure that repeated and nested phases are accumulated and the cProfile dump is written.
+    Without tracemalloc.reset_peak (Python 3.8) the peak memory of the phases is still told apart.
+    """
+    if not reset_peak:
+        monkeypatch.delattr(tracemalloc, "reset_peak", raising=False)
+    profiler = PhaseProfiler()
+    profiler.start(with_cprofile=True)
+
+    @profiler.phase("prompts")
+    def prompt() -> None:
+        pass
+
+    with profiler.phase("render"):
+        prompt()
+        data = bytearray(4 * 1024**2)
+    del data
+    prompt()
+    profiler.stop(str(tmp_path / "profile.pstats"))
+
+    assert list(profiler.phases) == ["prompts", "render"]
+    assert profiler.phases["prompts"].calls == 2
+    assert profiler.phases["render"].calls == 1
+    # the memory allocated by a phase is included in its peak memory
+    assert profiler.phases["render"].peak_memory >= 4 * 1024**2
+    assert profiler.phases["prompts"].peak_memory < 4 * 1024**2
+    assert profiler.phases["render"].wall_seconds >= profiler.phases["prompts"].wall_seconds / 2
+    assert (tmp_path / "profile.pstats").is_file()
+    assert not profiler.enabled
+
+
+def test_background_phases_do_not_trace_memory() -> None:
+    """
+    Ensure that phases running in background threads are recorded without resetting the peak memory of the foreground.
+    """
+    profiler = PhaseProfiler()
+    profiler.start()
+
+    def lookup() -> None:
+        with profiler.phase("name lookup"):
+            pass
+
+    with profiler.phase("prompts"):
+        data = bytearray(4 * 1024**2)
+        del data
+        thread = threading.Thread(target=lookup)
+        thread.start()
+        thread.join()
+    profiler.stop()
+
+    assert profiler.phases["name lookup"].calls == 1
+    assert profiler.phases["name lookup"].peak_memory is None
+    assert profiler.phases["prompts"].peak_memory >= 4 * 1024**2
@@ -0,0 +1,88 @@
+import os
+
+from click.testing import CliRunner
+from git import Actor, Repo  # type: ignore
+
+from cookietemple.__main__ import lint
+from cookietemple.create.create import choose_domain
+from cookietemple.lint.changed_files import changed_files
+from cookietemple.lint.lint import lint_project
+
+HOMER = Actor("Homer Simpson", "homer.simpson@example.com")
+
+
+def commit_all(repo: Repo) -> None:
+    repo.git.add(A=True)
+    repo.index.commit("Save Springfield", author=HOMER, committer=HOMER)
+
+
+def test_changed_files_of_project_in_subdirectory(tmp_path) -> None:
+    """
+    Ensure that staged files or files changed since a commit are found relative to a project in a subdirectory of the repository.
+    """
+    repo = Repo.init(tmp_path)
+    project_dir = tmp_path / "springfield"
+    project_dir.mkdir()
+    for name in ["staged.txt", "modified.txt", "deleted.txt"]:
+        (project_dir / name).write_text(name)
+    (tmp_path / "outside.txt").write_text("outside")
+    commit_all(repo)
+    (project_dir / "staged.txt").write_text("changed")
+    (tmp_path / "outside.txt").write_text("changed")
+    (tmp_path / "added_outside.txt").write_text("new")
+    repo.git.add(A=True)
+    (tmp_path / "untracked_outside.txt").write_text("new")
+    (project_dir / "modified.txt").write_text("changed")
+    (project_dir / "deleted.txt").unlink()
+    (project_dir / "untracked.txt").write_text("new")
+
+    staged = changed_files(str(project_dir), staged=True)
+    since = changed_files(str(project_dir), since="HEAD")
+
+    assert (staged.paths, staged.added_or_deleted) == (["staged.txt"], False)
+    assert (since.paths, since.added_or_deleted) == (
+        ["deleted.txt", "modified.txt", "staged.txt", "untracked.txt"],
+        True,
+    )
+
+
+def test_lint_rejects_since_with_staged(tmp_path, mocker) -> None:
+    """
+    Ensure that --since and --staged cannot be combined.
+    """
+    lint_project_ = mocker.patch("cookietemple.lint.lint.lint_project")
+
+    result = CliRunner().invoke(lint, [str(tmp_path), "--since", "HEAD", "--staged"])
+
+    assert result.exit_code == 1
+    lint_project_.assert_not_called()
+
+
+def test_lint_changed_files_only(tmp_path, cli_python_answers) -> None:
+    """
+    Ensure that only changed files are scanned and checks not affected by the changes are skipped.
+    """
+    choose_domain(tmp_path, None, cli_python_answers, output_root=tmp_path)
+    project_dir = tmp_path / "springfield"
+    repo = Repo.init(project_dir)
+    commit_all(repo)
+    with open(project_dir / "docs" / "conf.py", "a") as conf:
+        conf.write("# TODO COOKIETEMPLE: save Springfield\n")
+
+    linter = lint_project(str(project_dir), exit_on_failure=False, since="HEAD")
+
+    assert linter.changed_files.paths == [os.path.join("docs", "conf.py")]
+    assert [message for _, message in linter.warned] == [
+        f"TODO string found in `conf.py` line {len((project_dir / 'docs' / 'conf.py').read_text().splitlines())}: "
+        "save Springfield"
+    ]
+    assert linter.scan_statistics.scanned == 1
+    # the version of docs/conf.py is checked for consistency
+    assert "check_version_consistent" not in linter.skipped_checks
+    assert set(linter.skipped_checks) == {
+        "check_docker",
+        "check_files_exist",
+        "check_sync_section",
+        "lint_cookietemple_config",
+        "python_files_exist",
+    }
@@ -0,0 +1,131 @@
+import builtins
+import os
+import time
+from typing import List, Tuple
+
+import cookietemple
+
+from cookietemple.lint.content_scanner import ContentScanner, CookiecutterStringRule, ScanStatistics, TodoRule
+
+
+def test_scan_reads_every_file_once(tmp_path, mocker) -> None:
+    """
+    Ensure that all rules are run on a file read only once and that each rule skips its own ignored files.
+    """
+    (tmp_path / ".gitignore").write_text("build/\n")
+    (tmp_path / "build").mkdir()
+    (tmp_path / "build" / "generated.py").write_text("# TODO COOKIETEMPLE: ignored\n{{ cookiecutter.name }}\n")
+    (tmp_path / "src").mkdir()
+    for index in range(20):
+        (tmp_path / "src" / f"module{index:02}.py").write_text(f"# TODO COOKIETEMPLE: fix {index:02}\n")
+    (tmp_path / "compiled.pyc").write_bytes(b"\x00{{ cookiecutter.name }}\n")
+    opened = mocker.spy(builtins, "open")
+
+    scanner = ContentScanner(str(tmp_path), [TodoRule(str(tmp_path)), CookiecutterStringRule()])
+    findings = scanner.scan()
+
+    scanned = [call.args[0] for call in opened.call_args_list if call.args[1:] == ("rb",)]
+    assert len(scanned) == len(set(scanned)) == scanner.statistics.scanned == 22
+    assert scanner.statistics.skipped_extension == ["compiled.pyc"]
+    # the directory ignored by the TODO rule is still scanned for cookiecutter strings
+    assert sorted(findings["general-3"]) == [
+        f"TODO string found in `module{index:02}.py` line 1: fix {index:02}" for index in range(20)
+    ]
+    assert findings["general-4"] == ["Cookiecutter string found in 'generated.py' line 2: {{ cookiecutter.name }}.."]
+
+
+def test_scan_some_files(tmp_path) -> None:
+    """
+    Ensure that only the given files are scanned and removed files are skipped.
+    """
+    (tmp_path / "changed.txt").write_text("COOKIETEMPLE TODO: changed\n")
+    (tmp_path / "unchanged.txt").write_text("COOKIETEMPLE TODO: unchanged\n")
+
+    findings = ContentScanner(str(tmp_path), [TodoRule(str(tmp_path))]).scan(["changed.txt", "removed.txt"])
+
+    assert findings == {"general-3": ["TODO string found in `changed.txt` line 1: changed"]}
+
+
+def test_scan_counts_lines_of_hits_only(tmp_path) -> None:
+    """
+    Ensure that findings report the lines of all line break styles and that long lines without a complete cookiecutter
+    string are no findings.
+    """
+    (tmp_path / "mixed.js").write_bytes(
+        b"{ a }\r\n{{ cookiecutter.name }}\rvar x = '{' + ' cookiecutter'.repeat(100000);\n"
+        + b"{ " * 100000
+        + b" cookiecutter \n}\nTODO COOKIETEMPLE: last {{ cookiecutter.x }}"
+    )
+    (tmp_path / "empty.txt").write_bytes(b"")
+
+    findings = ContentScanner(str(tmp_path), [TodoRule(str(tmp_path)), CookiecutterStringRule()]).scan()
+
+    assert findings["general-3"] == ["TODO string found in `mixed.js` line 6: last {{ cookiecutter.x }}"]
+    assert [message.split(":")[0] for message in findings["general-4"]] == [
+        "Cookiecutter string found in 'mixed.js' line 2",
+        "Cookiecutter string found in 'mixed.js' line 6",
+    ]
+
+
+def test_scan_skips_binary_large_and_configured_files(tmp_path) -> None:
+    """
+    Ensure that binary files, files larger than the configured maximum size and files with configured extensions are skipped.
+    """
+    (tmp_path / "cookietemple.cfg").write_text("[lint]\nmax_file_size = 100\nskip_extensions = .min.js, .LOG\n")
+    (tmp_path / "logo.svg").write_bytes(b"\x89\x00COOKIETEMPLE TODO: binary\n")
+    (tmp_path / "large.txt").write_text("COOKIETEMPLE TODO: large\n" * 10)
+    (tmp_path / "vendor.min.js").write_text("COOKIETEMPLE TODO: minified\n")
+    (tmp_path / "build.log").write_text("COOKIETEMPLE TODO: log\n")
+    (tmp_path / "image.png").write_text("COOKIETEMPLE TODO: scanned, since the default extensions are replaced\n")
+
+    scanner = ContentScanner.configured(str(tmp_path), [TodoRule(str(tmp_path))])
+    findings = scanner.scan()
+
+    assert findings["general-3"] == [
+        "TODO string found in `image.png` line 1: scanned, since the default extensions are replaced"
+    ]
+    assert scanner.statistics.binary == ["logo.svg"]
+    assert scanner.statistics.too_large == ["large.txt"]
+    assert sorted(scanner.statistics.skipped_extension) == ["build.log", "vendor.min.js"]
+
+
+def test_scan_cache(tmp_path, mocker, monkeypatch) -> None:
+    """
+    Ensure that only changed files are scanned again and that the cache is discarded when cookietemple is updated.
+    """
+    for name in ["plan.txt", "touched.txt", "racy.txt"]:
+        (tmp_path / name).write_text(f"TODO COOKIETEMPLE: {name}\n")
+        # long before the scan
+        os.utime(tmp_path / name, ns=(0, 10**9))
+    # modified right before the scan
+    racy_mtime = time.time_ns()
+    os.utime(tmp_path / "racy.txt", ns=(0, racy_mtime))
+
+    def scan() -> Tuple[ScanStatistics, List[str]]:
+        scanner = ContentScanner(str(tmp_path), [TodoRule(str(tmp_path))], cache=True)
+        findings = sorted(scanner.scan()["general-3"])
+        return scanner.statistics, findings
+
+    assert scan()[0].cached == 0
+    # the racy file is compared by its content
+    assert scan()[0].cached == 3
+    (tmp_path / "plan.txt").write_text("TODO COOKIETEMPLE: plan.txt changed\n")
+    os.utime(tmp_path / "touched.txt")
+    # modified again with the same size in the same tick of a coarse file system clock
+    (tmp_path / "racy.txt").write_text("TODO COOKIETEMPLE: RACY.txt\n")
+    os.utime(tmp_path / "racy.txt", ns=(0, racy_mtime))
+    find = mocker.spy(ContentScanner, "find")
+
+    statistics, findings = scan()
+
+    assert statistics.cached == 1
+    assert findings == [
+        "TODO string found in `plan.txt` line 1: plan.txt changed",
+        "TODO string found in `racy.txt` line 1: RACY.txt",
+        "TODO string found in `touched.txt` line 1: touched.txt",
+    ]
+    # touched, but unchanged files are compared by their content
+    assert sorted(os.path.basename(call.args[3]) for call in find.call_args_list) == ["plan.txt", "racy.txt"]
+    monkeypatch.setattr(cookietemple, "__version__", "99.0.0")
+    assert scan()[0].cached == 0
+    assert (tmp_path / ".cookietemple" / "cache" / ".gitignore").read_text().endswith("*\n")
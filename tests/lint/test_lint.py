@@ -2,9 +2,11 @@ import os
 
 import pytest
 
+from cookietemple.create.create import choose_domain
 from cookietemple.lint.domains.cli import CliPythonLint
 from cookietemple.lint.domains.pub import PubLatexLint
 from cookietemple.lint.domains.web import WebWebsitePythonLint
+from cookietemple.lint.lint import lint_project
 from cookietemple.lint.template_linter import TemplateLinter
 
 
@@ -57,3 +59,23 @@ def test_lint_bad_example(capfd, get_template_linter) -> None:
         test_linter.print_results()
 
         assert len(test_linter.warned) == 1 and len(test_linter.failed) == 1
+
+
+def test_lint_in_parallel_matches_sequential_lint(tmp_path, cli_python_answers) -> None:
+    """
+    Ensure that running the checks in parallel reports the same results in the same order as running them one after another.
+    """
+    choose_domain(tmp_path, None, cli_python_answers, output_root=tmp_path)
+    project_dir = tmp_path / "springfield"
+    (project_dir / "Dockerfile").unlink()
+    (project_dir / "plan.txt").write_text("TODO COOKIETEMPLE: save Springfield\n")
+
+    sequential = lint_project(str(project_dir), exit_on_failure=False)
+    parallel = lint_project(str(project_dir), exit_on_failure=False, jobs=4)
+
+    assert parallel.failed and parallel.warned
+    assert (parallel.passed, parallel.warned, parallel.failed) == (
+        sequential.passed,
+        sequential.warned,
+        sequential.failed,
+    )
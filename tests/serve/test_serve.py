@@ -0,0 +1,73 @@
+import json
+import threading
+import urllib.error
+import urllib.request
+from typing import Dict, Optional, Tuple
+
+from cookietemple.serve.serve import TemplateServer
+
+
+def post(url: str, request: dict, headers: Optional[Dict[str, str]] = None) -> Tuple[int, dict]:
+    """
+    POST a JSON request.
+
+    :param url: The URL of the command
+    :param request: The parameters of the command
+    :param headers: Headers replacing the default JSON Content-Type
+    :return: The HTTP status code and the JSON response
+    """
+    http_request = urllib.request.Request(
+        url,
+        data=json.dumps(request).encode("utf-8"),
+        headers=headers if headers is not None else {"Content-Type": "application/json"},
+        method="POST",
+    )
+    try:
+        with urllib.request.urlopen(http_request) as response:
+            return response.status, json.load(response)
+    except urllib.error.HTTPError as e:
+        return e.code, json.load(e)
+
+
+def test_serve_create_lint_and_info(tmp_path, mocker, cli_python_answers) -> None:
+    """
+    Ensure that created projects can be linted, that the output of every request is returned
+    and that prompts fail instead of blocking the workers.
+    """
+    mocker.patch.object(TemplateServer, "warm_up")
+    template_server = TemplateServer(workers=2)
+    server = template_server.bind(port=0)
+    thread = threading.Thread(target=template_server.serve, args=(server,))
+    thread.start()
+    url = f"http://{server.server_address[0]}:{server.server_address[1]}"
+    try:
+        status, response = post(f"{url}/create", {"answers": cli_python_answers, "output_dir": str(tmp_path)})
+        assert status == 200 and response["exit_code"] == 0
+        assert response["project_dir"] == str(tmp_path / "springfield")
+        assert (tmp_path / "springfield" / "springfield" / "__main__.py").is_file()
+
+        status, response = post(f"{url}/lint", {"project_dir": str(tmp_path / "springfield")})
+        assert status == 200 and response["failed"] == [] and response["passed"]
+        assert "Running general linting" in response["output"]
+
+        status, response = post(f"{url}/info", {"handle": "cli-python"})
+        assert status == 200 and [template["handle"] for template in response["templates"]] == ["cli-python"]
+
+        # the project directory is occupied now, which requires a confirmation
+        status, response = post(f"{url}/create", {"answers": cli_python_answers, "output_dir": str(tmp_path)})
+        assert status == 422 and response["exit_code"] == 1 and "Cannot prompt" in response["output"]
+
+        status, response = post(f"{url}/lint", {})
+        assert status == 400 and "project_dir" in response["error"]
+
+        # no-preflight cross origin requests of web pages and DNS rebinding attacks are rejected
+        lint_request = {"project_dir": str(tmp_path / "springfield")}
+        assert post(f"{url}/lint", lint_request, {"Content-Type": "text/plain"})[0] == 415
+        status, response = post(
+            f"{url}/lint", lint_request, {"Content-Type": "application/json", "Host": "evil.example:8765"}
+        )
+        assert status == 403 and "evil.example" in response["error"]
+        assert post(f"{url}/lint", lint_request, {"Content-Type": "application/json", "Host": "localhost"})[0] == 200
+    finally:
+        server.shutdown()
+        thread.join()
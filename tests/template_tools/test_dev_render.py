@@ -0,0 +1,39 @@
+import os
+
+from ruamel.yaml import YAML
+
+from cookietemple.template_tools.dev_render import DevRenderer
+
+
+def write_answers(path, answers: dict) -> None:
+    with open(path, "w") as f:
+        YAML().dump(answers, f)
+
+
+def test_rerender_only_affected_files(tmp_path, cli_python_answers) -> None:
+    """
+    Ensure that only the files referencing changed answers or whose template files changed are rendered again.
+    """
+    answers_path = tmp_path / "answers.yml"
+    write_answers(answers_path, cli_python_answers)
+    dev_renderer = DevRenderer("cli-python", str(answers_path), str(tmp_path / "out"))
+
+    project_dir = dev_renderer.render()
+
+    assert project_dir == str(tmp_path / "out" / "springfield")
+    assert os.path.isfile(os.path.join(project_dir, ".cookietemple.yml"))
+    assert dev_renderer.rerender(set()) == []
+
+    write_answers(answers_path, {**cli_python_answers, "project_short_description": "Saving Springfield"})
+    rerendered = dev_renderer.rerender({str(answers_path)})
+
+    assert "pyproject.toml" in rerendered
+    assert "Makefile" not in rerendered
+    assert 0 < len(rerendered) < len(dev_renderer.files)
+    with open(os.path.join(project_dir, "pyproject.toml")) as f:
+        assert "Saving Springfield" in f.read()
+    with open(os.path.join(project_dir, ".cookietemple.yml")) as f:
+        assert "Saving Springfield" in f.read()
+
+    template_dir = os.path.join(dev_renderer.renderer.sources[0].template_path, dev_renderer.renderer.template_dirs[0])  # type: ignore
+    assert dev_renderer.rerender({os.path.join(template_dir, "Makefile")}) == ["Makefile"]
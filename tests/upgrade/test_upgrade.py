@@ -0,0 +1,91 @@
+import json
+import threading
+import time
+
+import pytest
+
+import cookietemple
+from cookietemple.upgrade.upgrade import UpgradeCommand
+
+
+@pytest.fixture
+def startup_check(tmp_path, mocker, monkeypatch):
+    """
+    Enable the startup check as if cookietemple was run interactively with a cache in a temporary directory.
+    """
+    for env in [UpgradeCommand.DISABLE_ENV, *UpgradeCommand.CI_ENVS]:
+        monkeypatch.delenv(env, raising=False)
+    mocker.patch("sys.stdin.isatty", return_value=True)
+    mocker.patch("sys.stderr.isatty", return_value=True)
+    monkeypatch.setattr(UpgradeCommand, "CACHE_FILE", f"{tmp_path}/latest_version.json")
+    monkeypatch.setattr(cookietemple, "__version__", "1.0.0")
+
+
+def join_upgrade_check() -> None:
+    for thread in threading.enumerate():
+        if thread.name == "upgrade-check":
+            thread.join(5)
+
+
+def test_startup_check_refreshes_cache_in_background(startup_check, mocker) -> None:
+    """
+    Ensure that the startup check never waits for PyPI and reports newer versions once they are cached.
+    """
+    released = threading.Event()
+
+    def latest_pypi_version() -> str:
+        released.wait(5)
+        return "2.0.0"
+
+    lookup = mocker.patch.object(UpgradeCommand, "latest_pypi_version", side_effect=latest_pypi_version)
+
+    # nothing is known yet and the lookup is still running
+    assert UpgradeCommand.check_cookietemple_latest_cached()
+    released.set()
+    join_upgrade_check()
+
+    assert UpgradeCommand.load_cached_latest_version()[0] == "2.0.0"
+    assert not UpgradeCommand.check_cookietemple_latest_cached()
+    join_upgrade_check()
+    # the cached version has not expired yet
+    lookup.assert_called_once()
+
+
+def test_startup_check_refreshes_expired_cache(startup_check, mocker) -> None:
+    """
+    Ensure that the expired cached version is reported while it is refreshed.
+    """
+    with open(UpgradeCommand.CACHE_FILE, "w") as f:
+        json.dump({"version": "1.0.0", "time": time.time() - UpgradeCommand.CACHE_TTL_SECONDS}, f)
+    lookup = mocker.patch.object(UpgradeCommand, "latest_pypi_version", return_value="2.0.0")
+
+    assert UpgradeCommand.check_cookietemple_latest_cached()
+    join_upgrade_check()
+
+    lookup.assert_called_once()
+    assert UpgradeCommand.load_cached_latest_version()[0] == "2.0.0"
+
+
+@pytest.mark.parametrize("env", [UpgradeCommand.DISABLE_ENV, "CI"])
+def test_startup_check_skipped(startup_check, mocker, monkeypatch, env) -> None:
+    """
+    Ensure that neither the cache nor PyPI is asked if the check is disabled or run on CI.
+    """
+    monkeypatch.setenv(env, "1")
+    load = mocker.patch.object(UpgradeCommand, "load_cached_latest_version")
+    lookup = mocker.patch.object(UpgradeCommand, "latest_pypi_version")
+
+    assert UpgradeCommand.check_cookietemple_latest_cached()
+    load.assert_not_called()
+    lookup.assert_not_called()
+
+
+def test_startup_check_skipped_when_not_interactive(startup_check, mocker) -> None:
+    """
+    Ensure that the check is skipped if the input is not a terminal (e.g. piped or scripted).
+    """
+    mocker.patch("sys.stdin.isatty", return_value=False)
+    lookup = mocker.patch.object(UpgradeCommand, "latest_pypi_version")
+
+    assert UpgradeCommand.check_cookietemple_latest_cached()
+    lookup.assert_not_called()